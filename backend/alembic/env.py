@@ -8,8 +8,8 @@ import sys
 # Add the backend directory to the path so we can import our models
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from database import Base
-from models import Project, Blog  # Import all models
+from app.core.database import Base
+import app.models  # noqa: F401  (registers all models on Base.metadata)
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -0,0 +1,44 @@
+"""add_listing_order_indexes
+
+Revision ID: 5b1e7c2a9d40
+Revises: 183dd502790b
+Create Date: 2026-10-17 09:12:40.118204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision = '5b1e7c2a9d40'
+down_revision = '183dd502790b'
+branch_labels = None
+depends_on = None
+
+
+def index_exists(table_name, index_name):
+    """Check if an index exists on a table."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    return index_name in [index['name'] for index in inspector.get_indexes(table_name)]
+
+
+def upgrade() -> None:
+    # Keyset pagination orders projects by (created_at, id)
+    if not index_exists('projects', 'ix_projects_listing_order'):
+        op.create_index('ix_projects_listing_order', 'projects', ['created_at', 'id'], unique=False)
+    
+    # Blogs are ordered by publish date, falling back to creation date
+    if not index_exists('blogs', 'ix_blogs_listing_order'):
+        op.create_index(
+            'ix_blogs_listing_order',
+            'blogs',
+            [sa.text('coalesce(published_at, created_at)'), 'id'],
+            unique=False
+        )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_blogs_listing_order', table_name='blogs')
+    op.drop_index('ix_projects_listing_order', table_name='projects')
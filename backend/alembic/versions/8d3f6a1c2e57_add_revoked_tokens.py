@@ -0,0 +1,41 @@
+"""add_revoked_tokens
+
+Revision ID: 8d3f6a1c2e57
+Revises: 5b1e7c2a9d40
+Create Date: 2026-10-17 11:03:52.640917
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision = '8d3f6a1c2e57'
+down_revision = '5b1e7c2a9d40'
+branch_labels = None
+depends_on = None
+
+
+def table_exists(table_name):
+    """Check if a table exists in the database."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def upgrade() -> None:
+    # Revocation list for the signed-token auth backend
+    if not table_exists('revoked_tokens'):
+        op.create_table('revoked_tokens',
+            sa.Column('jti', sa.String(length=64), nullable=False),
+            sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+            sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+            sa.PrimaryKeyConstraint('jti')
+        )
+        op.create_index(op.f('ix_revoked_tokens_expires_at'), 'revoked_tokens', ['expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_revoked_tokens_expires_at'), table_name='revoked_tokens')
+    op.drop_table('revoked_tokens')
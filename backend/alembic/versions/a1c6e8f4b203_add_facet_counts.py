@@ -0,0 +1,74 @@
+"""add_facet_counts
+
+Revision ID: a1c6e8f4b203
+Revises: f2a8d5c3e917
+Create Date: 2026-10-17 17:46:30.912274
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+import json
+
+
+# revision identifiers, used by Alembic.
+revision = 'a1c6e8f4b203'
+down_revision = 'f2a8d5c3e917'
+branch_labels = None
+depends_on = None
+
+
+def table_exists(table_name):
+    """Check if a table exists in the database."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def parse_labels(raw):
+    """Normalised entries of a JSON list column mapped to their first spelling."""
+    try:
+        values = json.loads(raw) if raw else []
+    except json.JSONDecodeError:
+        return {}
+    if not isinstance(values, list):
+        return {}
+    labels = {}
+    for value in values:
+        if isinstance(value, str) and value.strip():
+            labels.setdefault(value.strip().lower(), value.strip())
+    return labels
+
+
+def upgrade() -> None:
+    # Usage counts behind /api/facets, adjusted on every admin write
+    if table_exists('facet_counts'):
+        return
+    facet_counts = op.create_table('facet_counts',
+        sa.Column('facet', sa.String(length=10), nullable=False),
+        sa.Column('value', sa.String(length=100), nullable=False),
+        sa.Column('label', sa.String(length=100), nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('facet', 'value', name='pk_facet_counts')
+    )
+    op.create_index('ix_facet_counts_facet_count', 'facet_counts', ['facet', 'count'], unique=False)
+
+    bind = op.get_bind()
+    rows = []
+    for facet, query in (
+        ('tech', 'SELECT id, tech_stack FROM projects ORDER BY id'),
+        ('tag', 'SELECT id, tags FROM blogs ORDER BY id'),
+    ):
+        counts, labels = {}, {}
+        for _, raw in bind.execute(sa.text(query)):
+            for value, label in parse_labels(raw).items():
+                counts[value] = counts.get(value, 0) + 1
+                labels.setdefault(value, label)
+        rows += [{'facet': facet, 'value': value, 'label': labels[value], 'count': count} for value, count in counts.items()]
+    if rows:
+        op.bulk_insert(facet_counts, rows)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_facet_counts_facet_count', table_name='facet_counts')
+    op.drop_table('facet_counts')
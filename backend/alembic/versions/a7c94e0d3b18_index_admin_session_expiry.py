@@ -0,0 +1,34 @@
+"""index_admin_session_expiry
+
+Revision ID: a7c94e0d3b18
+Revises: 8d3f6a1c2e57
+Create Date: 2026-10-17 11:48:20.305716
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision = 'a7c94e0d3b18'
+down_revision = '8d3f6a1c2e57'
+branch_labels = None
+depends_on = None
+
+
+def index_exists(table_name, index_name):
+    """Check if an index exists on a table."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    return index_name in [index['name'] for index in inspector.get_indexes(table_name)]
+
+
+def upgrade() -> None:
+    # The session sweeper selects expired rows by expires_at
+    if not index_exists('admin_sessions', 'ix_admin_sessions_expires_at'):
+        op.create_index(op.f('ix_admin_sessions_expires_at'), 'admin_sessions', ['expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_admin_sessions_expires_at'), table_name='admin_sessions')
@@ -0,0 +1,40 @@
+"""add_related_content
+
+Revision ID: b5d3f7a9c214
+Revises: a1c6e8f4b203
+Create Date: 2026-10-17 18:34:05.267113
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision = 'b5d3f7a9c214'
+down_revision = 'a1c6e8f4b203'
+branch_labels = None
+depends_on = None
+
+
+def table_exists(table_name):
+    """Check if a table exists in the database."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def upgrade() -> None:
+    # Top-k TF-IDF neighbours behind /related; filled on first startup or by scripts/rebuild_related.py
+    if not table_exists('related_content'):
+        op.create_table('related_content',
+            sa.Column('source', sa.String(length=40), nullable=False),
+            sa.Column('rank', sa.Integer(), nullable=False),
+            sa.Column('target', sa.String(length=40), nullable=False),
+            sa.Column('score', sa.Float(), nullable=False),
+            sa.PrimaryKeyConstraint('source', 'rank', name='pk_related_content')
+        )
+
+
+def downgrade() -> None:
+    op.drop_table('related_content')
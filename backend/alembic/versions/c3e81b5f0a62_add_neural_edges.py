@@ -0,0 +1,48 @@
+"""add_neural_edges
+
+Revision ID: c3e81b5f0a62
+Revises: a7c94e0d3b18
+Create Date: 2026-10-17 12:36:09.512883
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision = 'c3e81b5f0a62'
+down_revision = 'a7c94e0d3b18'
+branch_labels = None
+depends_on = None
+
+
+def table_exists(table_name):
+    """Check if a table exists in the database."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def upgrade() -> None:
+    # Precomputed scene edges; filled on first startup or by scripts/rebuild_neural_edges.py
+    if not table_exists('neural_edges'):
+        op.create_table('neural_edges',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('source', sa.String(length=40), nullable=False),
+            sa.Column('target', sa.String(length=40), nullable=False),
+            sa.Column('kind', sa.String(length=20), nullable=False),
+            sa.Column('strength', sa.Float(), nullable=False),
+            sa.PrimaryKeyConstraint('id'),
+            sa.UniqueConstraint('source', 'target', name='uq_neural_edges_source_target')
+        )
+        op.create_index(op.f('ix_neural_edges_id'), 'neural_edges', ['id'], unique=False)
+        op.create_index(op.f('ix_neural_edges_source'), 'neural_edges', ['source'], unique=False)
+        op.create_index(op.f('ix_neural_edges_target'), 'neural_edges', ['target'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_neural_edges_target'), table_name='neural_edges')
+    op.drop_index(op.f('ix_neural_edges_source'), table_name='neural_edges')
+    op.drop_index(op.f('ix_neural_edges_id'), table_name='neural_edges')
+    op.drop_table('neural_edges')
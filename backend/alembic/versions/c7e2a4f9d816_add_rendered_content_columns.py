@@ -0,0 +1,45 @@
+"""add_rendered_content_columns
+
+Revision ID: c7e2a4f9d816
+Revises: b5d3f7a9c214
+Create Date: 2026-10-17 19:52:41.803526
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision = 'c7e2a4f9d816'
+down_revision = 'b5d3f7a9c214'
+branch_labels = None
+depends_on = None
+
+RENDERED_COLUMNS = (
+    ('content_html', sa.Text),
+    ('toc', sa.Text),
+    ('word_count', sa.Integer),
+    ('reading_time', sa.Integer),
+)
+
+
+def column_exists(table_name, column_name):
+    """Check if a column exists on a table."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    return column_name in [column['name'] for column in inspector.get_columns(table_name)]
+
+
+def upgrade() -> None:
+    # Write-time markdown render; existing rows are rendered on first startup
+    for table_name in ('projects', 'blogs'):
+        for column_name, column_type in RENDERED_COLUMNS:
+            if not column_exists(table_name, column_name):
+                op.add_column(table_name, sa.Column(column_name, column_type(), nullable=True))
+
+
+def downgrade() -> None:
+    for table_name in ('projects', 'blogs'):
+        for column_name, _ in reversed(RENDERED_COLUMNS):
+            op.drop_column(table_name, column_name)
@@ -0,0 +1,52 @@
+"""add_content_counters
+
+Revision ID: d4f8b2e6a317
+Revises: c7e2a4f9d816
+Create Date: 2026-10-17 20:41:17.529804
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision = 'd4f8b2e6a317'
+down_revision = 'c7e2a4f9d816'
+branch_labels = None
+depends_on = None
+
+
+def table_exists(table_name):
+    """Check if a table exists in the database."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def upgrade() -> None:
+    # Single row of dashboard totals adjusted by admin writes
+    if not table_exists('content_counters'):
+        op.create_table('content_counters',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('total_projects', sa.Integer(), nullable=False),
+            sa.Column('featured_projects', sa.Integer(), nullable=False),
+            sa.Column('total_blogs', sa.Integer(), nullable=False),
+            sa.Column('published_blogs', sa.Integer(), nullable=False),
+            sa.Column('draft_blogs', sa.Integer(), nullable=False),
+            sa.PrimaryKeyConstraint('id')
+        )
+        op.execute(
+            "INSERT INTO content_counters "
+            "(id, total_projects, featured_projects, total_blogs, published_blogs, draft_blogs) "
+            "SELECT 1, "
+            "(SELECT COUNT(*) FROM projects), "
+            "(SELECT COALESCE(SUM(CASE WHEN featured THEN 1 ELSE 0 END), 0) FROM projects), "
+            "(SELECT COUNT(*) FROM blogs), "
+            "(SELECT COALESCE(SUM(CASE WHEN published THEN 1 ELSE 0 END), 0) FROM blogs), "
+            "(SELECT COALESCE(SUM(CASE WHEN published THEN 0 ELSE 1 END), 0) FROM blogs)"
+        )
+
+
+def downgrade() -> None:
+    op.drop_table('content_counters')
@@ -0,0 +1,43 @@
+"""add_content_changes
+
+Revision ID: d9a4f2b61c87
+Revises: c3e81b5f0a62
+Create Date: 2026-10-17 15:02:44.180327
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision = 'd9a4f2b61c87'
+down_revision = 'c3e81b5f0a62'
+branch_labels = None
+depends_on = None
+
+
+def table_exists(table_name):
+    """Check if a table exists in the database."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def upgrade() -> None:
+    # Change log behind /api/neural-data/changes; compacted by the background sweeper
+    if not table_exists('content_changes'):
+        op.create_table('content_changes',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('node', sa.String(length=40), nullable=False),
+            sa.Column('op', sa.String(length=10), nullable=False),
+            sa.Column('created_at', sa.DateTime(), nullable=False),
+            sa.PrimaryKeyConstraint('id'),
+            sqlite_autoincrement=True
+        )
+        op.create_index(op.f('ix_content_changes_created_at'), 'content_changes', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_content_changes_created_at'), table_name='content_changes')
+    op.drop_table('content_changes')
@@ -0,0 +1,79 @@
+"""add_search_index
+
+Revision ID: e4b7c1d9a2f6
+Revises: d9a4f2b61c87
+Create Date: 2026-10-17 16:21:37.604118
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+# revision identifiers, used by Alembic.
+revision = 'e4b7c1d9a2f6'
+down_revision = 'd9a4f2b61c87'
+branch_labels = None
+depends_on = None
+
+TRIGGERS = [
+    'projects_search_insert', 'projects_search_update', 'projects_search_delete',
+    'blogs_search_insert', 'blogs_search_update', 'blogs_search_delete'
+]
+
+
+def table_exists(table_name):
+    """Check if a table exists in the database."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def upgrade() -> None:
+    # FTS5 index behind /api/search; rowid = id * 2 for projects, id * 2 + 1 for blogs
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    if not table_exists('search_index'):
+        op.execute(
+            "CREATE VIRTUAL TABLE search_index USING fts5("
+            "title, summary, content, tags, tokenize = 'porter unicode61 remove_diacritics 2')"
+        )
+        op.execute(
+            "INSERT INTO search_index(rowid, title, summary, content, tags) "
+            "SELECT id * 2, title, description, content, tech_stack FROM projects"
+        )
+        op.execute(
+            "INSERT INTO search_index(rowid, title, summary, content, tags) "
+            "SELECT id * 2 + 1, title, summary, content, tags FROM blogs"
+        )
+
+    op.execute("""CREATE TRIGGER IF NOT EXISTS projects_search_insert AFTER INSERT ON projects BEGIN
+        INSERT INTO search_index(rowid, title, summary, content, tags)
+        VALUES (new.id * 2, new.title, new.description, new.content, new.tech_stack);
+    END""")
+    op.execute("""CREATE TRIGGER IF NOT EXISTS projects_search_update AFTER UPDATE OF title, description, content, tech_stack ON projects BEGIN
+        UPDATE search_index SET title = new.title, summary = new.description, content = new.content, tags = new.tech_stack
+        WHERE rowid = new.id * 2;
+    END""")
+    op.execute("""CREATE TRIGGER IF NOT EXISTS projects_search_delete AFTER DELETE ON projects BEGIN
+        DELETE FROM search_index WHERE rowid = old.id * 2;
+    END""")
+    op.execute("""CREATE TRIGGER IF NOT EXISTS blogs_search_insert AFTER INSERT ON blogs BEGIN
+        INSERT INTO search_index(rowid, title, summary, content, tags)
+        VALUES (new.id * 2 + 1, new.title, new.summary, new.content, new.tags);
+    END""")
+    op.execute("""CREATE TRIGGER IF NOT EXISTS blogs_search_update AFTER UPDATE OF title, summary, content, tags ON blogs BEGIN
+        UPDATE search_index SET title = new.title, summary = new.summary, content = new.content, tags = new.tags
+        WHERE rowid = new.id * 2 + 1;
+    END""")
+    op.execute("""CREATE TRIGGER IF NOT EXISTS blogs_search_delete AFTER DELETE ON blogs BEGIN
+        DELETE FROM search_index WHERE rowid = old.id * 2 + 1;
+    END""")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    for trigger in TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+    op.execute("DROP TABLE IF EXISTS search_index")
@@ -0,0 +1,81 @@
+"""add_tag_and_technology_index
+
+Revision ID: f2a8d5c3e917
+Revises: e4b7c1d9a2f6
+Create Date: 2026-10-17 17:08:12.451930
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+import json
+
+
+# revision identifiers, used by Alembic.
+revision = 'f2a8d5c3e917'
+down_revision = 'e4b7c1d9a2f6'
+branch_labels = None
+depends_on = None
+
+
+def table_exists(table_name):
+    """Check if a table exists in the database."""
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    return table_name in inspector.get_table_names()
+
+
+def parse_terms(raw):
+    """Normalised, de-duplicated entries of a JSON list column."""
+    try:
+        values = json.loads(raw) if raw else []
+    except json.JSONDecodeError:
+        return []
+    if not isinstance(values, list):
+        return []
+    terms = {value.strip().lower() for value in values if isinstance(value, str)}
+    terms.discard('')
+    return sorted(terms)
+
+
+def upgrade() -> None:
+    # One row per tag / tech stack entry, mirroring the JSON columns for ?tag= and ?tech= filters
+    bind = op.get_bind()
+    if not table_exists('blog_tags'):
+        blog_tags = op.create_table('blog_tags',
+            sa.Column('blog_id', sa.Integer(), nullable=False),
+            sa.Column('tag', sa.String(length=100), nullable=False),
+            sa.ForeignKeyConstraint(['blog_id'], ['blogs.id'], ondelete='CASCADE'),
+            sa.PrimaryKeyConstraint('tag', 'blog_id', name='pk_blog_tags')
+        )
+        op.create_index(op.f('ix_blog_tags_blog_id'), 'blog_tags', ['blog_id'], unique=False)
+        rows = [
+            {'blog_id': blog_id, 'tag': tag}
+            for blog_id, tags in bind.execute(sa.text('SELECT id, tags FROM blogs'))
+            for tag in parse_terms(tags)
+        ]
+        if rows:
+            op.bulk_insert(blog_tags, rows)
+
+    if not table_exists('project_technologies'):
+        project_technologies = op.create_table('project_technologies',
+            sa.Column('project_id', sa.Integer(), nullable=False),
+            sa.Column('technology', sa.String(length=100), nullable=False),
+            sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ondelete='CASCADE'),
+            sa.PrimaryKeyConstraint('technology', 'project_id', name='pk_project_technologies')
+        )
+        op.create_index(op.f('ix_project_technologies_project_id'), 'project_technologies', ['project_id'], unique=False)
+        rows = [
+            {'project_id': project_id, 'technology': technology}
+            for project_id, tech_stack in bind.execute(sa.text('SELECT id, tech_stack FROM projects'))
+            for technology in parse_terms(tech_stack)
+        ]
+        if rows:
+            op.bulk_insert(project_technologies, rows)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_project_technologies_project_id'), table_name='project_technologies')
+    op.drop_table('project_technologies')
+    op.drop_index(op.f('ix_blog_tags_blog_id'), table_name='blog_tags')
+    op.drop_table('blog_tags')
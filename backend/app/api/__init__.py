@@ -1,6 +1,6 @@
 """API routers."""
 from fastapi import APIRouter
-from .routes import projects, blogs, neural_data, pages, admin_auth, admin_projects, admin_blogs, admin_pages, admin_stats
+from .routes import projects, blogs, neural_data, pages, events, search, facets, admin_auth, admin_projects, admin_blogs, admin_pages, admin_stats, admin_layout, admin_preview, admin_bulk
 
 api_router = APIRouter()
 
@@ -9,6 +9,9 @@ api_router.include_router(projects.router, prefix="/projects", tags=["projects"]
 api_router.include_router(blogs.router, prefix="/blogs", tags=["blogs"])
 api_router.include_router(neural_data.router, prefix="/neural-data", tags=["neural-data"])
 api_router.include_router(pages.router, prefix="/pages", tags=["pages"])
+api_router.include_router(events.router, prefix="/events", tags=["events"])
+api_router.include_router(search.router, prefix="/search", tags=["search"])
+api_router.include_router(facets.router, prefix="/facets", tags=["facets"])
 
 # Admin routes
 api_router.include_router(admin_auth.router, prefix="/admin", tags=["admin-auth"])
@@ -16,3 +19,6 @@ api_router.include_router(admin_projects.router, prefix="/admin/projects", tags=
 api_router.include_router(admin_blogs.router, prefix="/admin/blogs", tags=["admin-blogs"])
 api_router.include_router(admin_pages.router, prefix="/admin/pages", tags=["admin-pages"])
 api_router.include_router(admin_stats.router, prefix="/admin/stats", tags=["admin-stats"])
+api_router.include_router(admin_layout.router, prefix="/admin/layout", tags=["admin-layout"])
+api_router.include_router(admin_preview.router, prefix="/admin/preview", tags=["admin-preview"])
+api_router.include_router(admin_bulk.router, prefix="/admin/bulk", tags=["admin-bulk"])
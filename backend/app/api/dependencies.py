@@ -1,47 +1,110 @@
 """API dependencies."""
-from fastapi import Depends, HTTPException, Request
-from sqlalchemy.orm import Session
-from datetime import datetime
+from fastapi import Depends, HTTPException, Request, Response
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime, timedelta
 import logging
-from app.core.database import get_db
-from app.models import AdminUser, AdminSession
+from app.core.config import settings
+from app.core.database import get_async_db
+from app.core.security import decode_admin_token, issue_admin_token
+from app.core.sessions import (
+    AdminPrincipal, SESSION_COOKIE, revocation_list, session_cache, set_session_cookie
+)
+from app.models import AdminUser, AdminSession, RevokedToken
 
 logger = logging.getLogger(__name__)
 
+async def is_token_revoked(db: AsyncSession, jti: str) -> bool:
+    """Check the in-memory revocation list, asking the database when its answer may be stale."""
+    if revocation_list.is_revoked(jti):
+        return True
+    if not revocation_list.needs_check(jti):
+        return False
+    
+    expires_at = await db.scalar(select(RevokedToken.expires_at).where(RevokedToken.jti == jti))
+    if expires_at is not None:
+        revocation_list.revoke(jti, expires_at)
+        return True
+    revocation_list.mark_checked(jti)
+    return False
+
+async def authenticate_token(token: str, response: Response, db: AsyncSession) -> AdminPrincipal:
+    """Verify a signed admin token.
+    
+    The database is only read to confirm the token is not revoked, at most once
+    per TOKEN_REVOCATION_CHECK_SECONDS per login. Tokens close to expiry are
+    re-issued with the same jti and auth_time, so the cookie slides forward
+    until the absolute SESSION_EXPIRY_HOURS limit.
+    """
+    claims = decode_admin_token(token)
+    if not claims or await is_token_revoked(db, claims.get("jti")):
+        logger.warning(f"Invalid or revoked admin token: {token[:10]}...")
+        raise HTTPException(status_code=401, detail="Invalid session. Please log in again.")
+    
+    principal = AdminPrincipal(id=int(claims["sub"]), username=claims["username"], email=claims.get("email"))
+    
+    expires_at = datetime.utcfromtimestamp(claims["exp"])
+    if expires_at - datetime.utcnow() < timedelta(minutes=settings.ACCESS_TOKEN_REFRESH_MINUTES):
+        refreshed, refreshed_expiry = issue_admin_token(
+            principal.id,
+            principal.username,
+            principal.email,
+            jti=claims["jti"],
+            auth_time=datetime.utcfromtimestamp(claims["auth_time"])
+        )
+        if refreshed_expiry > expires_at:
+            set_session_cookie(response, refreshed)
+    
+    return principal
+
 async def get_current_admin(
     request: Request,
-    db: Session = Depends(get_db)
-) -> AdminUser:
-    """Verify admin session from cookie and return authenticated admin user."""
-    session_token = request.cookies.get("admin_session")
+    response: Response,
+    db: AsyncSession = Depends(get_async_db)
+) -> AdminPrincipal:
+    """Verify admin session from cookie and return the authenticated admin.
+    
+    Valid sessions are served from the in-memory session cache; a miss costs a
+    single session/user join. With AUTH_BACKEND=token the cookie holds a signed
+    token and the database is only read to re-check its revocation now and then.
+    """
+    session_token = request.cookies.get(SESSION_COOKIE)
     
     if not session_token:
         logger.warning("No session token found in cookies")
         raise HTTPException(status_code=401, detail="Not authenticated. Please log in.")
     
+    if settings.AUTH_BACKEND == "token":
+        return await authenticate_token(session_token, response, db)
+    
+    principal = session_cache.get_session(session_token)
+    if principal:
+        return principal
+    
     try:
-        session = db.query(AdminSession).filter(
-            AdminSession.session_token == session_token
-        ).first()
+        row = (await db.execute(
+            select(AdminSession.id, AdminSession.expires_at, AdminUser.id, AdminUser.username, AdminUser.email)
+            .join(AdminUser, AdminUser.id == AdminSession.user_id)
+            .where(AdminSession.session_token == session_token)
+        )).first()
         
-        if not session:
+        if not row:
             logger.warning(f"Invalid session token: {session_token[:10]}...")
             raise HTTPException(status_code=401, detail="Invalid session. Please log in again.")
         
-        if session.expires_at < datetime.utcnow():
-            logger.info(f"Expired session for user_id: {session.user_id}")
-            db.delete(session)
-            db.commit()
-            raise HTTPException(status_code=401, detail="Session expired. Please log in again.")
+        session_id, expires_at, user_id, username, email = row
         
-        admin_user = db.query(AdminUser).filter(AdminUser.id == session.user_id).first()
+        if expires_at < datetime.utcnow():
+            logger.info(f"Expired session for user_id: {user_id}")
+            await db.execute(delete(AdminSession).where(AdminSession.id == session_id))
+            await db.commit()
+            raise HTTPException(status_code=401, detail="Session expired. Please log in again.")
         
-        if not admin_user:
-            logger.error(f"Admin user not found for session user_id: {session.user_id}")
-            raise HTTPException(status_code=401, detail="User not found. Please log in again.")
+        principal = AdminPrincipal(id=user_id, username=username, email=email)
+        session_cache.put(session_token, principal, expires_at)
         
-        logger.info(f"Authenticated admin user: {admin_user.username}")
-        return admin_user
+        logger.debug(f"Authenticated admin user: {username}")
+        return principal
         
     except HTTPException:
         raise
@@ -1,11 +1,20 @@
 """Admin authentication endpoints."""
 from fastapi import APIRouter, Depends, HTTPException, Request, Response
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
 import logging
-from app.core.database import get_db
-from app.core.security import verify_password, create_session_token, get_session_expiry
-from app.models import AdminUser, AdminSession
+from app.core.config import settings
+from app.core.database import get_async_db
+from app.core.security import (
+    password_pool, PasswordPoolSaturated, create_session_token, get_session_expiry,
+    issue_admin_token, decode_admin_token, get_revocation_expiry
+)
+from app.core.rate_limit import login_throttle
+from app.core.sessions import (
+    AdminPrincipal, SESSION_COOKIE, revocation_list, session_cache, set_session_cookie
+)
+from app.models import AdminUser, AdminSession, RevokedToken
 from app.schemas import LoginRequest, LoginResponse
 from app.api.dependencies import get_current_admin
 
@@ -15,40 +24,48 @@ router = APIRouter()
 @router.post("/login", response_model=LoginResponse)
 async def admin_login(
     login_data: LoginRequest,
+    request: Request,
     response: Response,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Admin login endpoint. Verifies credentials, creates session, and sets HTTP-only cookie."""
+    client_ip = request.client.host if request.client else "unknown"
+    retry_after = login_throttle.retry_after(login_data.username, client_ip)
+    if retry_after is not None:
+        logger.warning(f"Throttled login attempt for username: {login_data.username} from {client_ip}")
+        raise HTTPException(
+            status_code=429,
+            detail="Too many login attempts. Please try again later.",
+            headers={"Retry-After": str(retry_after)}
+        )
+    login_throttle.record_attempt(login_data.username, client_ip)
+    
     try:
-        admin_user = db.query(AdminUser).filter(
-            AdminUser.username == login_data.username
-        ).first()
+        admin_user = await db.scalar(
+            select(AdminUser).where(AdminUser.username == login_data.username)
+        )
         
-        if not admin_user or not verify_password(login_data.password, admin_user.password_hash):
+        if not admin_user or not await password_pool.verify(login_data.password, admin_user.password_hash):
             logger.warning(f"Failed login attempt for username: {login_data.username}")
             raise HTTPException(status_code=401, detail="Invalid username or password")
         
-        session_token = create_session_token()
-        expires_at = get_session_expiry()
+        login_throttle.record_success(login_data.username)
         
-        new_session = AdminSession(
-            user_id=admin_user.id,
-            session_token=session_token,
-            expires_at=expires_at
-        )
-        db.add(new_session)
+        if settings.AUTH_BACKEND == "token":
+            session_token, _ = issue_admin_token(admin_user.id, admin_user.username, admin_user.email)
+        else:
+            session_token = create_session_token()
+            new_session = AdminSession(
+                user_id=admin_user.id,
+                session_token=session_token,
+                expires_at=get_session_expiry()
+            )
+            db.add(new_session)
         
         admin_user.last_login = datetime.utcnow()
-        db.commit()
+        await db.commit()
         
-        response.set_cookie(
-            key="admin_session",
-            value=session_token,
-            httponly=True,
-            secure=False,
-            samesite="lax",
-            max_age=24 * 60 * 60
-        )
+        set_session_cookie(response, session_token)
         
         logger.info(f"Successful login for user: {admin_user.username}")
         
@@ -64,33 +81,49 @@ async def admin_login(
         
     except HTTPException:
         raise
+    except PasswordPoolSaturated:
+        logger.warning("Password hashing pool saturated, rejecting login")
+        raise HTTPException(
+            status_code=503,
+            detail="Login is temporarily busy. Please try again.",
+            headers={"Retry-After": "1"}
+        )
     except Exception as e:
         logger.error(f"Error during login: {e}")
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail="Login failed due to server error")
 
 @router.post("/logout")
 async def admin_logout(
     response: Response,
     request: Request,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Admin logout endpoint. Deletes the session from database and clears the cookie."""
+    """Admin logout endpoint. Deletes the session (or revokes the signed token) and clears the cookie."""
     try:
-        session_token = request.cookies.get("admin_session")
+        session_token = request.cookies.get(SESSION_COOKIE)
         
-        if session_token:
-            session = db.query(AdminSession).filter(
-                AdminSession.session_token == session_token
-            ).first()
+        if session_token and settings.AUTH_BACKEND == "token":
+            claims = decode_admin_token(session_token)
+            if claims:
+                expires_at = get_revocation_expiry(claims)
+                await db.merge(RevokedToken(jti=claims["jti"], expires_at=expires_at))
+                await db.commit()
+                revocation_list.revoke(claims["jti"], expires_at)
+                logger.info(f"Token revoked for user_id: {claims['sub']}")
+        elif session_token:
+            session_cache.evict(session_token)
+            session = await db.scalar(
+                select(AdminSession).where(AdminSession.session_token == session_token)
+            )
             
             if session:
-                db.delete(session)
-                db.commit()
+                await db.delete(session)
+                await db.commit()
                 logger.info(f"Session deleted for user_id: {session.user_id}")
         
         response.delete_cookie(
-            key="admin_session",
+            key=SESSION_COOKIE,
             httponly=True,
             secure=False,
             samesite="lax"
@@ -100,12 +133,12 @@ async def admin_logout(
         
     except Exception as e:
         logger.error(f"Error during logout: {e}")
-        db.rollback()
-        response.delete_cookie(key="admin_session")
+        await db.rollback()
+        response.delete_cookie(key=SESSION_COOKIE)
         return {"success": True, "message": "Logout successful"}
 
 @router.get("/verify")
-async def verify_admin_session(admin_user: AdminUser = Depends(get_current_admin)):
+async def verify_admin_session(admin_user: AdminPrincipal = Depends(get_current_admin)):
     """Verify admin session endpoint. Checks if the current session is valid."""
     return {
         "valid": True,
@@ -1,26 +1,45 @@
 """Admin blog management endpoints."""
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
 import logging
-from app.core.database import get_db
-from app.models import Blog, AdminUser
+from app.core.config import settings
+from app.core.database import get_async_db
+from app.core.cache import bump_content_version
+from app.core.events import publish_content_change
+from app.core.pagination import NEXT_CURSOR_HEADER, apply_keyset, split_page
+from app.core.sessions import AdminPrincipal
+from app.models import Blog
 from app.schemas import BlogResponseAdmin, BlogCreateAdmin, BlogUpdateAdmin
 from app.api.dependencies import get_current_admin
+from app.services.content_sync import apply_content_change
+from app.services.counters import node_counts
+from app.services.placement import auto_place
+from app.services.rendering import render_content
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
 @router.get("", response_model=List[BlogResponseAdmin])
 async def get_admin_blogs(
-    admin_user: AdminUser = Depends(get_current_admin),
-    db: Session = Depends(get_db)
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
+    admin_user: AdminPrincipal = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Get all blogs for admin panel (includes all fields). Requires authentication."""
+    """Get a page of blogs for admin panel (includes all fields), newest first. Requires authentication."""
     try:
-        blogs = db.query(Blog).all()
+        stmt = apply_keyset(select(Blog), Blog.listing_order(), Blog.id, cursor, limit, db.get_bind().dialect.name)
+        blogs, next_cursor = split_page((await db.execute(stmt)).all(), limit)
+        if next_cursor:
+            response.headers[NEXT_CURSOR_HEADER] = next_cursor
+        
         logger.info(f"Admin {admin_user.username} fetched {len(blogs)} blogs")
         return blogs
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error fetching admin blogs: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch blogs")
@@ -28,12 +47,12 @@ async def get_admin_blogs(
 @router.post("", response_model=BlogResponseAdmin, status_code=201)
 async def create_admin_blog(
     blog_data: BlogCreateAdmin,
-    admin_user: AdminUser = Depends(get_current_admin),
-    db: Session = Depends(get_db)
+    admin_user: AdminPrincipal = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Create a new blog post. Requires authentication."""
     try:
-        existing_blog = db.query(Blog).filter(Blog.slug == blog_data.slug).first()
+        existing_blog = await db.scalar(select(Blog).where(Blog.slug == blog_data.slug))
         if existing_blog:
             raise HTTPException(
                 status_code=409,
@@ -57,9 +76,17 @@ async def create_admin_blog(
         if blog_data.tags:
             new_blog.set_tags_list(blog_data.tags)
         
+        if blog_data.position_mode == "auto":
+            await auto_place("blog", new_blog)
+        
+        await render_content(new_blog)
+        
         db.add(new_blog)
-        db.commit()
-        db.refresh(new_blog)
+        await db.commit()
+        sync_version = await apply_content_change("blog", new_blog.id)
+        version = bump_content_version()
+        publish_content_change("blog", new_blog.id, new_blog.slug, "created", version, sync_version)
+        await db.refresh(new_blog)
         
         logger.info(f"Admin {admin_user.username} created blog: {new_blog.slug}")
         return new_blog
@@ -68,19 +95,19 @@ async def create_admin_blog(
         raise
     except Exception as e:
         logger.error(f"Error creating blog: {e}")
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail="Failed to create blog")
 
 @router.put("/{blog_id}", response_model=BlogResponseAdmin)
 async def update_admin_blog(
     blog_id: int,
     blog_data: BlogUpdateAdmin,
-    admin_user: AdminUser = Depends(get_current_admin),
-    db: Session = Depends(get_db)
+    admin_user: AdminPrincipal = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update an existing blog post. Requires authentication."""
     try:
-        blog = db.query(Blog).filter(Blog.id == blog_id).first()
+        blog = await db.scalar(select(Blog).where(Blog.id == blog_id))
         if not blog:
             raise HTTPException(
                 status_code=404,
@@ -88,23 +115,34 @@ async def update_admin_blog(
             )
         
         if blog_data.slug and blog_data.slug != blog.slug:
-            existing_blog = db.query(Blog).filter(Blog.slug == blog_data.slug).first()
+            existing_blog = await db.scalar(select(Blog).where(Blog.slug == blog_data.slug))
             if existing_blog:
                 raise HTTPException(
                     status_code=409,
                     detail=f"Blog with slug '{blog_data.slug}' already exists"
                 )
         
+        previous_counts = node_counts(blog)
         update_data = blog_data.dict(exclude_unset=True)
         
         if 'tags' in update_data:
             blog.set_tags_list(update_data.pop('tags'))
         
+        position_mode = update_data.pop('position_mode', None)
         for field, value in update_data.items():
             setattr(blog, field, value)
         
-        db.commit()
-        db.refresh(blog)
+        if position_mode == "auto":
+            await auto_place("blog", blog)
+        
+        if 'content' in update_data:
+            await render_content(blog)
+        
+        await db.commit()
+        sync_version = await apply_content_change("blog", blog.id, previous_counts)
+        version = bump_content_version()
+        publish_content_change("blog", blog.id, blog.slug, "updated", version, sync_version)
+        await db.refresh(blog)
         
         logger.info(f"Admin {admin_user.username} updated blog: {blog.slug}")
         return blog
@@ -113,18 +151,18 @@ async def update_admin_blog(
         raise
     except Exception as e:
         logger.error(f"Error updating blog {blog_id}: {e}")
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail="Failed to update blog")
 
 @router.delete("/{blog_id}")
 async def delete_admin_blog(
     blog_id: int,
-    admin_user: AdminUser = Depends(get_current_admin),
-    db: Session = Depends(get_db)
+    admin_user: AdminPrincipal = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Delete a blog post. Requires authentication."""
     try:
-        blog = db.query(Blog).filter(Blog.id == blog_id).first()
+        blog = await db.scalar(select(Blog).where(Blog.id == blog_id))
         if not blog:
             raise HTTPException(
                 status_code=404,
@@ -132,8 +170,12 @@ async def delete_admin_blog(
             )
         
         blog_slug = blog.slug
-        db.delete(blog)
-        db.commit()
+        previous_counts = node_counts(blog)
+        await db.delete(blog)
+        await db.commit()
+        sync_version = await apply_content_change("blog", blog_id, previous_counts)
+        version = bump_content_version()
+        publish_content_change("blog", blog_id, blog_slug, "deleted", version, sync_version)
         
         logger.info(f"Admin {admin_user.username} deleted blog: {blog_slug}")
         return {
@@ -145,5 +187,5 @@ async def delete_admin_blog(
         raise
     except Exception as e:
         logger.error(f"Error deleting blog {blog_id}: {e}")
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail="Failed to delete blog")
@@ -0,0 +1,56 @@
+"""Admin NDJSON bulk import and export of projects and blogs."""
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Literal
+import logging
+from app.core.database import get_async_db
+from app.core.sessions import AdminPrincipal
+from app.schemas import BulkImportResult
+from app.api.dependencies import get_current_admin
+from app.services.bulk_transfer import export_ndjson, import_ndjson
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+KINDS = {"projects": "project", "blogs": "blog"}
+
+@router.get("/{collection}/export")
+async def export_content(
+    collection: Literal["projects", "blogs"],
+    admin_user: AdminPrincipal = Depends(get_current_admin)
+):
+    """Stream all projects or blogs as NDJSON, one create payload per line. Requires authentication."""
+    logger.info(f"Admin {admin_user.username} exported {collection}")
+    return StreamingResponse(
+        export_ndjson(KINDS[collection]),
+        media_type=NDJSON_MEDIA_TYPE,
+        headers={"Content-Disposition": f'attachment; filename="{collection}.ndjson"'}
+    )
+
+@router.post("/{collection}/import", response_model=BulkImportResult)
+async def import_content(
+    collection: Literal["projects", "blogs"],
+    request: Request,
+    on_conflict: Literal["skip", "replace"] = Query("skip"),
+    admin_user: AdminPrincipal = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Import projects or blogs from an NDJSON body of create payloads. Requires authentication.
+
+    Lines are validated like POST /api/admin/{collection}; invalid lines are
+    reported by line number and skipped. Rows whose slug already exists are
+    skipped, or overwritten with on_conflict=replace.
+    """
+    try:
+        result = await import_ndjson(db, KINDS[collection], request.stream(), replace=on_conflict == "replace")
+        logger.info(
+            f"Admin {admin_user.username} imported {collection}: {result.created} created, "
+            f"{result.updated} updated, {result.skipped} skipped, {result.error_count} invalid"
+        )
+        return result.__dict__
+    except Exception as e:
+        logger.error(f"Error importing {collection}: {e}")
+        await db.rollback()
+        raise HTTPException(status_code=500, detail=f"Failed to import {collection}")
@@ -0,0 +1,33 @@
+"""Admin endpoints for the server-side scene layout job."""
+from fastapi import APIRouter, Depends, HTTPException
+import logging
+from app.core.sessions import AdminPrincipal
+from app.schemas import LayoutRequest, LayoutJobStatus
+from app.api.dependencies import get_current_admin
+from app.services.layout import LayoutParams, layout_job
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+@router.post("", response_model=LayoutJobStatus, status_code=202)
+async def start_layout_job(
+    layout_request: LayoutRequest,
+    admin_user: AdminPrincipal = Depends(get_current_admin)
+):
+    """Start recomputing all node positions in the background. Requires authentication."""
+    params = LayoutParams(
+        iterations=layout_request.iterations,
+        theta=layout_request.theta,
+        seed=layout_request.seed,
+        warm_start=layout_request.warm_start
+    )
+    if not layout_job.start(params):
+        raise HTTPException(status_code=409, detail="A layout job is already running")
+    
+    logger.info(f"Admin {admin_user.username} started layout job")
+    return layout_job.state()
+
+@router.get("", response_model=LayoutJobStatus)
+async def get_layout_job(admin_user: AdminPrincipal = Depends(get_current_admin)):
+    """Get the state of the current or last layout job. Requires authentication."""
+    return layout_job.state()
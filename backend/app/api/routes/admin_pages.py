@@ -1,10 +1,14 @@
 """Admin static page management endpoints."""
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 import logging
-from app.core.database import get_db
-from app.models import StaticPage, AdminUser
+from app.core.database import get_async_db
+from app.core.cache import bump_content_version
+from app.core.events import publish_content_change
+from app.core.sessions import AdminPrincipal
+from app.models import StaticPage
 from app.schemas import StaticPageResponse, StaticPageUpdate
 from app.api.dependencies import get_current_admin
 
@@ -13,12 +17,12 @@ router = APIRouter()
 
 @router.get("", response_model=List[StaticPageResponse])
 async def get_admin_pages(
-    admin_user: AdminUser = Depends(get_current_admin),
-    db: Session = Depends(get_db)
+    admin_user: AdminPrincipal = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get all static pages for admin panel. Requires authentication."""
     try:
-        pages = db.query(StaticPage).all()
+        pages = (await db.scalars(select(StaticPage))).all()
         logger.info(f"Admin {admin_user.username} fetched {len(pages)} static pages")
         return pages
     except Exception as e:
@@ -28,12 +32,12 @@ async def get_admin_pages(
 @router.get("/{key}", response_model=StaticPageResponse)
 async def get_admin_page_by_key(
     key: str,
-    admin_user: AdminUser = Depends(get_current_admin),
-    db: Session = Depends(get_db)
+    admin_user: AdminPrincipal = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get a specific static page by key. Requires authentication."""
     try:
-        page = db.query(StaticPage).filter(StaticPage.page_key == key).first()
+        page = await db.scalar(select(StaticPage).where(StaticPage.page_key == key))
         if not page:
             raise HTTPException(
                 status_code=404,
@@ -53,12 +57,12 @@ async def get_admin_page_by_key(
 async def update_admin_page(
     key: str,
     page_data: StaticPageUpdate,
-    admin_user: AdminUser = Depends(get_current_admin),
-    db: Session = Depends(get_db)
+    admin_user: AdminPrincipal = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update a static page's content. Requires authentication."""
     try:
-        page = db.query(StaticPage).filter(StaticPage.page_key == key).first()
+        page = await db.scalar(select(StaticPage).where(StaticPage.page_key == key))
         if not page:
             raise HTTPException(
                 status_code=404,
@@ -68,8 +72,10 @@ async def update_admin_page(
         page.title = page_data.title
         page.set_content_dict(page_data.content)
         
-        db.commit()
-        db.refresh(page)
+        await db.commit()
+        version = bump_content_version()
+        publish_content_change("page", page.id, key, "updated", version)
+        await db.refresh(page)
         
         logger.info(f"Admin {admin_user.username} updated page: {key}")
         return page
@@ -78,5 +84,5 @@ async def update_admin_page(
         raise
     except Exception as e:
         logger.error(f"Error updating page {key}: {e}")
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail="Failed to update page")
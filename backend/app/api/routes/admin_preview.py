@@ -0,0 +1,28 @@
+"""Admin markdown preview rendered with the same pipeline as saved content."""
+from fastapi import APIRouter, Depends, HTTPException
+import asyncio
+import logging
+from app.core.sessions import AdminPrincipal
+from app.schemas import MarkdownPreviewRequest, MarkdownPreviewResponse
+from app.api.dependencies import get_current_admin
+from app.services.rendering import render_markdown
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+@router.post("", response_model=MarkdownPreviewResponse)
+async def preview_markdown(
+    preview_request: MarkdownPreviewRequest,
+    admin_user: AdminPrincipal = Depends(get_current_admin)
+):
+    """Render markdown as it would be stored on save. Requires authentication.
+
+    Blocks unchanged since an earlier render come from the render cache, so
+    calling this while typing only re-renders the edited blocks.
+    """
+    try:
+        rendered = await asyncio.to_thread(render_markdown, preview_request.content)
+        return rendered.__dict__
+    except Exception as e:
+        logger.error(f"Error rendering preview: {e}")
+        raise HTTPException(status_code=500, detail="Failed to render preview")
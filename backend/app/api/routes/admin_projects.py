@@ -1,26 +1,45 @@
 """Admin project management endpoints."""
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
 import logging
-from app.core.database import get_db
-from app.models import Project, AdminUser
+from app.core.config import settings
+from app.core.database import get_async_db
+from app.core.cache import bump_content_version
+from app.core.events import publish_content_change
+from app.core.pagination import NEXT_CURSOR_HEADER, apply_keyset, split_page
+from app.core.sessions import AdminPrincipal
+from app.models import Project
 from app.schemas import ProjectResponseAdmin, ProjectCreateAdmin, ProjectUpdateAdmin
 from app.api.dependencies import get_current_admin
+from app.services.content_sync import apply_content_change
+from app.services.counters import node_counts
+from app.services.placement import auto_place
+from app.services.rendering import render_content
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
 @router.get("", response_model=List[ProjectResponseAdmin])
 async def get_admin_projects(
-    admin_user: AdminUser = Depends(get_current_admin),
-    db: Session = Depends(get_db)
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
+    admin_user: AdminPrincipal = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Get all projects for admin panel (includes all fields). Requires authentication."""
+    """Get a page of projects for admin panel (includes all fields), newest first. Requires authentication."""
     try:
-        projects = db.query(Project).all()
+        stmt = apply_keyset(select(Project), Project.listing_order(), Project.id, cursor, limit, db.get_bind().dialect.name)
+        projects, next_cursor = split_page((await db.execute(stmt)).all(), limit)
+        if next_cursor:
+            response.headers[NEXT_CURSOR_HEADER] = next_cursor
+        
         logger.info(f"Admin {admin_user.username} fetched {len(projects)} projects")
         return projects
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error fetching admin projects: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch projects")
@@ -28,12 +47,12 @@ async def get_admin_projects(
 @router.post("", response_model=ProjectResponseAdmin, status_code=201)
 async def create_admin_project(
     project_data: ProjectCreateAdmin,
-    admin_user: AdminUser = Depends(get_current_admin),
-    db: Session = Depends(get_db)
+    admin_user: AdminPrincipal = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Create a new project. Requires authentication."""
     try:
-        existing_project = db.query(Project).filter(Project.slug == project_data.slug).first()
+        existing_project = await db.scalar(select(Project).where(Project.slug == project_data.slug))
         if existing_project:
             raise HTTPException(
                 status_code=409,
@@ -56,9 +75,17 @@ async def create_admin_project(
         
         new_project.set_tech_stack_list(project_data.tech_stack)
         
+        if project_data.position_mode == "auto":
+            await auto_place("project", new_project)
+        
+        await render_content(new_project)
+        
         db.add(new_project)
-        db.commit()
-        db.refresh(new_project)
+        await db.commit()
+        sync_version = await apply_content_change("project", new_project.id)
+        version = bump_content_version()
+        publish_content_change("project", new_project.id, new_project.slug, "created", version, sync_version)
+        await db.refresh(new_project)
         
         logger.info(f"Admin {admin_user.username} created project: {new_project.slug}")
         return new_project
@@ -67,19 +94,19 @@ async def create_admin_project(
         raise
     except Exception as e:
         logger.error(f"Error creating project: {e}")
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail="Failed to create project")
 
 @router.put("/{project_id}", response_model=ProjectResponseAdmin)
 async def update_admin_project(
     project_id: int,
     project_data: ProjectUpdateAdmin,
-    admin_user: AdminUser = Depends(get_current_admin),
-    db: Session = Depends(get_db)
+    admin_user: AdminPrincipal = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update an existing project. Requires authentication."""
     try:
-        project = db.query(Project).filter(Project.id == project_id).first()
+        project = await db.scalar(select(Project).where(Project.id == project_id))
         if not project:
             raise HTTPException(
                 status_code=404,
@@ -87,23 +114,36 @@ async def update_admin_project(
             )
         
         if project_data.slug and project_data.slug != project.slug:
-            existing_project = db.query(Project).filter(Project.slug == project_data.slug).first()
+            existing_project = await db.scalar(
+                select(Project).where(Project.slug == project_data.slug)
+            )
             if existing_project:
                 raise HTTPException(
                     status_code=409,
                     detail=f"Project with slug '{project_data.slug}' already exists"
                 )
         
+        previous_counts = node_counts(project)
         update_data = project_data.dict(exclude_unset=True)
         
         if 'tech_stack' in update_data:
             project.set_tech_stack_list(update_data.pop('tech_stack'))
         
+        position_mode = update_data.pop('position_mode', None)
         for field, value in update_data.items():
             setattr(project, field, value)
         
-        db.commit()
-        db.refresh(project)
+        if position_mode == "auto":
+            await auto_place("project", project)
+        
+        if 'content' in update_data:
+            await render_content(project)
+        
+        await db.commit()
+        sync_version = await apply_content_change("project", project.id, previous_counts)
+        version = bump_content_version()
+        publish_content_change("project", project.id, project.slug, "updated", version, sync_version)
+        await db.refresh(project)
         
         logger.info(f"Admin {admin_user.username} updated project: {project.slug}")
         return project
@@ -112,18 +152,18 @@ async def update_admin_project(
         raise
     except Exception as e:
         logger.error(f"Error updating project {project_id}: {e}")
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail="Failed to update project")
 
 @router.delete("/{project_id}")
 async def delete_admin_project(
     project_id: int,
-    admin_user: AdminUser = Depends(get_current_admin),
-    db: Session = Depends(get_db)
+    admin_user: AdminPrincipal = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Delete a project. Requires authentication."""
     try:
-        project = db.query(Project).filter(Project.id == project_id).first()
+        project = await db.scalar(select(Project).where(Project.id == project_id))
         if not project:
             raise HTTPException(
                 status_code=404,
@@ -131,8 +171,12 @@ async def delete_admin_project(
             )
         
         project_slug = project.slug
-        db.delete(project)
-        db.commit()
+        previous_counts = node_counts(project)
+        await db.delete(project)
+        await db.commit()
+        sync_version = await apply_content_change("project", project_id, previous_counts)
+        version = bump_content_version()
+        publish_content_change("project", project_id, project_slug, "deleted", version, sync_version)
         
         logger.info(f"Admin {admin_user.username} deleted project: {project_slug}")
         return {
@@ -144,5 +188,5 @@ async def delete_admin_project(
         raise
     except Exception as e:
         logger.error(f"Error deleting project {project_id}: {e}")
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail="Failed to delete project")
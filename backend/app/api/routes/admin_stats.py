@@ -1,9 +1,17 @@
 """Admin dashboard statistics endpoint."""
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 import logging
-from app.core.database import get_db
-from app.models import Project, Blog, AdminUser
+from app.core.config import settings
+from app.core.database import get_async_db
+from app.core.cache import content_cache, search_cache
+from app.core.events import content_events
+from app.core.security import password_pool
+from app.core.rate_limit import login_throttle
+from app.core.sessions import AdminPrincipal, revocation_list, session_cache
+from app.core.sweeper import session_sweeper
+from app.services.counters import load_counters
+from app.services.rendering import render_cache
 from app.schemas import DashboardStats
 from app.api.dependencies import get_current_admin
 
@@ -12,27 +20,41 @@ router = APIRouter()
 
 @router.get("", response_model=DashboardStats)
 async def get_dashboard_stats(
-    admin_user: AdminUser = Depends(get_current_admin),
-    db: Session = Depends(get_db)
+    admin_user: AdminPrincipal = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Get dashboard statistics for admin panel. Requires authentication."""
+    """Get dashboard statistics for admin panel. Requires authentication.
+
+    Reads the content_counters row (one aggregate query if it is missing),
+    cached until the next content write.
+    """
     try:
-        total_projects = db.query(Project).count()
-        featured_projects = db.query(Project).filter(Project.featured == True).count()
-        total_blogs = db.query(Blog).count()
-        published_blogs = db.query(Blog).filter(Blog.published == True).count()
-        draft_blogs = db.query(Blog).filter(Blog.published == False).count()
+        counts = await db.run_sync(
+            lambda session: content_cache.get_or_set("admin:stats", lambda: load_counters(session))
+        )
         
         logger.info(f"Admin {admin_user.username} fetched dashboard stats")
         
-        return DashboardStats(
-            total_projects=total_projects,
-            total_blogs=total_blogs,
-            published_blogs=published_blogs,
-            draft_blogs=draft_blogs,
-            featured_projects=featured_projects
-        )
+        return DashboardStats(**counts)
         
     except Exception as e:
         logger.error(f"Error fetching dashboard stats: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch dashboard statistics")
+
+
+@router.get("/runtime")
+async def get_runtime_stats(admin_user: AdminPrincipal = Depends(get_current_admin)):
+    """Get in-process runtime counters (cache, password pool, login throttle). Requires authentication."""
+    return {
+        "content_version": content_cache.version,
+        "cache": content_cache.stats(),
+        "search_cache": search_cache.stats(),
+        "password_hasher": password_pool.stats(),
+        "login_throttle": login_throttle.stats(),
+        "session_cache": session_cache.stats(),
+        "auth_backend": settings.AUTH_BACKEND,
+        "revoked_tokens": len(revocation_list),
+        "session_sweeper": session_sweeper.stats(),
+        "events": content_events.stats(),
+        "render_cache": render_cache.stats()
+    }
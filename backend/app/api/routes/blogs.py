@@ -1,35 +1,117 @@
 """Public blog endpoints."""
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import JSONResponse
+from sqlalchemy.orm import Session, defer, load_only
+from typing import List, Literal, Optional, Union
 import logging
+from app.core.config import settings
 from app.core.database import get_db
+from app.core.pagination import NEXT_CURSOR_HEADER, apply_keyset, split_page
+from app.core.http_cache import get_cache_policy, cached_representation, is_not_modified, cache_headers, not_modified_response
 from app.models import Blog
-from app.schemas import BlogResponse
+from app.services.taxonomy import normalize_term, blogs_with_tag
+from app.services.related import load_related
+from app.schemas import BlogResponse, BlogDetailResponse, BlogNode, RelatedItem
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
-@router.get("", response_model=List[BlogResponse])
-def get_blogs(db: Session = Depends(get_db)):
-    """Get all blogs with 3D positioning data."""
+def load_blogs_page(db: Session, view: str, cursor: Optional[str], limit: int, tag: Optional[str] = None) -> dict:
+    """Load one page of blogs as JSON-ready dicts; the summary view only selects node columns.
+    
+    Rendered bodies are left to the single-blog endpoint, so neither view loads them.
+    """
+    query = db.query(Blog)
+    schema = BlogResponse
+    if view == "summary":
+        query = query.options(load_only(*Blog.node_columns()))
+        schema = BlogNode
+    else:
+        query = query.options(*(defer(column) for column in Blog.rendered_columns()))
+    if tag:
+        query = query.filter(Blog.id.in_(blogs_with_tag(tag)))
+    
+    query = apply_keyset(query, Blog.listing_order(), Blog.id, cursor, limit, db.get_bind().dialect.name)
+    blogs, next_cursor = split_page(query.all(), limit)
+    return {
+        "items": [schema.model_validate(blog).model_dump(mode="json") for blog in blogs],
+        "next_cursor": next_cursor
+    }
+
+@router.get("", response_model=Union[List[BlogResponse], List[BlogNode]])
+def get_blogs(
+    request: Request,
+    view: Literal["full", "summary"] = "full",
+    cursor: Optional[str] = None,
+    limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
+    tag: Optional[str] = Query(None, max_length=100),
+    db: Session = Depends(get_db)
+):
+    """Get blogs with 3D positioning data, newest first, one page at a time.
+    
+    Use view=summary to omit markdown bodies. The X-Next-Cursor response header
+    carries the cursor for the next page and is absent on the last one.
+    tag= keeps only blogs with that tag (case-insensitive).
+    """
+    tag = normalize_term(tag) if tag else ""
+    policy = get_cache_policy("blogs")
     try:
-        blogs = db.query(Blog).all()
-        return blogs
+        page, etag = cached_representation(
+            f"blogs:list:{view}:{limit}:{cursor or ''}:{tag}",
+            lambda: load_blogs_page(db, view, cursor, limit, tag)
+        )
+        if is_not_modified(request, etag):
+            return not_modified_response(etag, policy)
+        headers = cache_headers(etag, policy)
+        if page["next_cursor"]:
+            headers[NEXT_CURSOR_HEADER] = page["next_cursor"]
+        return JSONResponse(content=page["items"], headers=headers)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error fetching blogs: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch blogs")
 
-@router.get("/{slug}", response_model=BlogResponse)
-def get_blog_by_slug(slug: str, db: Session = Depends(get_db)):
+@router.get("/{slug}", response_model=BlogDetailResponse)
+def get_blog_by_slug(slug: str, request: Request, db: Session = Depends(get_db)):
     """Get individual blog details by slug."""
-    try:
+    policy = get_cache_policy("blogs")
+    
+    def load_blog():
         blog = db.query(Blog).filter(Blog.slug == slug).first()
         if not blog:
             raise HTTPException(status_code=404, detail=f"Blog with slug '{slug}' not found")
-        return blog
+        return BlogDetailResponse.model_validate(blog).model_dump(mode="json")
+    
+    try:
+        payload, etag = cached_representation(f"blogs:{slug}", load_blog)
+        if is_not_modified(request, etag):
+            return not_modified_response(etag, policy)
+        return JSONResponse(content=payload, headers=cache_headers(etag, policy))
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"Error fetching blog {slug}: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch blog")
+
+@router.get("/{slug}/related", response_model=List[RelatedItem])
+def get_related_blogs(slug: str, request: Request, db: Session = Depends(get_db)):
+    """Get the projects and blogs most similar to a blog, best first."""
+    policy = get_cache_policy("blogs")
+    
+    def load_related_items():
+        related = load_related(db, "blog", slug)
+        if related is None:
+            raise HTTPException(status_code=404, detail=f"Blog with slug '{slug}' not found")
+        return related
+    
+    try:
+        payload, etag = cached_representation(f"blogs:related:{slug}", load_related_items)
+        if is_not_modified(request, etag):
+            return not_modified_response(etag, policy)
+        return JSONResponse(content=payload, headers=cache_headers(etag, policy))
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error fetching related content for blog {slug}: {e}")
+        raise HTTPException(status_code=500, detail="Failed to fetch related content")
@@ -0,0 +1,54 @@
+"""Server-Sent Events stream of content changes."""
+from fastapi import APIRouter, Header, HTTPException
+from fastapi.responses import StreamingResponse
+from typing import Optional
+import asyncio
+from app.core.config import settings
+from app.core.events import HEARTBEAT, content_events
+
+router = APIRouter()
+
+# Client reconnect delay advertised at the start of each stream
+RETRY = f"retry: {int(settings.EVENTS_HEARTBEAT_SECONDS * 1000)}\n\n".encode()
+
+async def stream_events(last_event_id: Optional[str] = None):
+    """Subscribe and relay broker messages; the subscription lives exactly as long as the stream."""
+    queue = content_events.subscribe()
+    if queue is None:
+        # Filled up since the capacity check; the client retries after RETRY
+        yield RETRY
+        return
+    try:
+        if last_event_id != content_events.last_event_id:
+            queue.put_nowait(content_events.resync("missed events" if last_event_id else "new stream"))
+        yield RETRY
+        while True:
+            try:
+                message = await asyncio.wait_for(queue.get(), timeout=settings.EVENTS_HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                message = HEARTBEAT
+            if message is None:
+                return
+            yield message
+    finally:
+        content_events.unsubscribe(queue)
+
+@router.get("")
+async def get_events(last_event_id: Optional[str] = Header(None)):
+    """Stream content change events (text/event-stream).
+    
+    "content" events carry the entity type, id, slug, action, the new content
+    version and, for projects and blogs, the sync version to pass to
+    /api/neural-data/changes. A "resync" event means events were dropped and
+    the client should refetch; it is also sent first unless the client
+    reconnects with the id of the latest event (Last-Event-ID). Comment lines
+    are sent as heartbeats.
+    """
+    if content_events.full:
+        raise HTTPException(status_code=503, detail="Too many event subscribers", headers={"Retry-After": "30"})
+    
+    return StreamingResponse(
+        stream_events(last_event_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
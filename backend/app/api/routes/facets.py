@@ -0,0 +1,28 @@
+"""Tag and technology facet counts."""
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import JSONResponse
+from sqlalchemy.orm import Session
+import logging
+from app.core.database import get_db
+from app.core.http_cache import get_cache_policy, cached_representation, is_not_modified, cache_headers, not_modified_response
+from app.schemas import FacetsResponse
+from app.services.taxonomy import load_facets
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+@router.get("", response_model=FacetsResponse)
+def get_facets(request: Request, db: Session = Depends(get_db)):
+    """Blog tags and project technologies with the number of items using each, most used first.
+    
+    Each value can be passed as ?tag= to /api/blogs or ?tech= to /api/projects.
+    """
+    policy = get_cache_policy("facets")
+    try:
+        facets, etag = cached_representation("facets", lambda: load_facets(db))
+        if is_not_modified(request, etag):
+            return not_modified_response(etag, policy)
+        return JSONResponse(content=facets, headers=cache_headers(etag, policy))
+    except Exception as e:
+        logger.error(f"Error fetching facets: {e}")
+        raise HTTPException(status_code=500, detail="Failed to fetch facets")
@@ -1,22 +1,208 @@
 """Neural data endpoint for 3D scene."""
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from typing import Callable, Dict, List, Optional, Tuple, Union
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import JSONResponse
+from sqlalchemy.orm import Session, load_only
 import logging
+import math
+from app.core.config import settings
 from app.core.database import get_db
+from app.core.cache import content_cache
+from app.core.snapshots import Snapshot, build_json_snapshot, build_snapshot, snapshot_response, accepts_gzip, accepts_media_type
+from app.core.http_cache import get_cache_policy, content_etag, cached_representation, is_not_modified, cache_headers, not_modified_response
 from app.models import Project, Blog
-from app.schemas import NeuralDataResponse
+from app.schemas import NeuralDataResponse, NeuralChangesResponse, NearestNode, NeuralLodResponse
+from app.services.neural_edges import load_graph
+from app.services.change_log import current_version, load_changes
+from app.services.graph_binary import MEDIA_TYPE as GRAPH_MEDIA_TYPE, encode_neural_graph
+from app.services.lod import build_lod_levels
+from app.services.spatial import index_neural_payload, filter_neural_payload
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
-@router.get("", response_model=NeuralDataResponse)
-def get_neural_data(db: Session = Depends(get_db)):
-    """Get combined projects and blogs data for 3D neural network scene."""
+def build_neural_data(db: Session) -> NeuralDataResponse:
+    """Load projects, blogs and their precomputed edges into the neural data payload."""
+    edges, adjacency = load_graph(db)
+    return NeuralDataResponse(
+        projects=db.query(Project).options(load_only(*Project.node_columns())).all(),
+        blogs=db.query(Blog).options(load_only(*Blog.node_columns())).all(),
+        edges=edges,
+        adjacency=adjacency
+    )
+
+def load_neural_payload(db: Session) -> dict:
+    """JSON-ready neural data for the current content version."""
+    return content_cache.get_or_set(
+        "neural-data",
+        lambda: build_neural_data(db).model_dump(mode="json")
+    )
+
+def load_spatial_index(db: Session):
+    """Neural data with its spatial, node and edge indexes, rebuilt once per content version."""
+    def build():
+        payload = load_neural_payload(db)
+        return (payload, *index_neural_payload(payload))
+    return content_cache.get_or_set("neural-data:spatial", build)
+
+def parse_bbox(bbox: str) -> Tuple[List[float], List[float]]:
+    """Parse "x1,y1,z1,x2,y2,z2" into the box's low and high corners."""
+    try:
+        values = [float(value) for value in bbox.split(",")]
+    except ValueError:
+        values = []
+    if len(values) != 6 or not all(math.isfinite(value) for value in values):
+        raise HTTPException(status_code=400, detail="bbox must be six numbers: x1,y1,z1,x2,y2,z2")
+    first, second = values[:3], values[3:]
+    return [min(pair) for pair in zip(first, second)], [max(pair) for pair in zip(first, second)]
+
+def load_lod_level(db: Session, lod: int) -> dict:
+    """Cluster level lod (1 = finest) of the current hierarchy, clamped to the coarsest level."""
+    levels = content_cache.get_or_set(
+        "neural-data:lod",
+        lambda: build_lod_levels(load_neural_payload(db))
+    )
+    if not levels:
+        return {"level": lod, "levels": 0, "clusters": [], "edges": []}
+    return levels[min(lod, len(levels)) - 1]
+
+def load_snapshot(key: str, build: Callable[[], Snapshot]) -> Tuple[Snapshot, Dict[str, str]]:
+    """Cached snapshot with the ETag of its plain and gzip bodies."""
+    def tagged():
+        snapshot = build()
+        return snapshot, {encoding: content_etag(snapshot.body, encoding) for encoding in ("identity", "gzip")}
+    return content_cache.get_or_set(key, tagged)
+
+@router.get("", response_model=Union[NeuralDataResponse, NeuralLodResponse])
+def get_neural_data(
+    request: Request,
+    bbox: Optional[str] = None,
+    lod: int = Query(0, ge=0),
+    db: Session = Depends(get_db)
+):
+    """Get combined projects and blogs data for 3D neural network scene.
+    
+    With bbox=x1,y1,z1,x2,y2,z2 only nodes inside that box are returned, along
+    with the edges and adjacency between them. With lod=N (N >= 1) clusters of
+    level N of the level-of-detail hierarchy are returned instead of nodes;
+    higher levels are coarser. Clients sending Accept: application/vnd.neural-space.graph
+    get the full scene in the packed binary layout of app.services.graph_binary.
+    """
+    policy = get_cache_policy("neural-data")
+    if lod > 0:
+        if bbox is not None:
+            raise HTTPException(status_code=400, detail="bbox and lod cannot be combined")
+        try:
+            payload = load_lod_level(db, lod)
+            etag = content_etag(payload)
+            if is_not_modified(request, etag):
+                return not_modified_response(etag, policy)
+            return JSONResponse(content=payload, headers=cache_headers(etag, policy))
+        except Exception as e:
+            logger.error(f"Error fetching neural data level {lod}: {e}")
+            raise HTTPException(status_code=500, detail="Failed to fetch neural data")
+    
+    if bbox is not None:
+        low, high = parse_bbox(bbox)
+        try:
+            # Queries against the cached index are cheap, so results are not cached per box
+            scene, index, nodes, node_edges = load_spatial_index(db)
+            payload = filter_neural_payload(scene, nodes, node_edges, index.within_box(low, high))
+            etag = content_etag(payload)
+            if is_not_modified(request, etag):
+                return not_modified_response(etag, policy)
+            return JSONResponse(content=payload, headers=cache_headers(etag, policy))
+        except Exception as e:
+            logger.error(f"Error fetching neural data in box: {e}")
+            raise HTTPException(status_code=500, detail="Failed to fetch neural data")
+    
+    binary = accepts_media_type(request, GRAPH_MEDIA_TYPE)
+    use_snapshot = binary or settings.NEURAL_DATA_SNAPSHOT
+    encoding = "gzip" if use_snapshot and accepts_gzip(request) else "identity"
+    vary = "Accept, Accept-Encoding" if use_snapshot else "Accept"
+    
     try:
-        projects = db.query(Project).all()
-        blogs = db.query(Blog).all()
+        if use_snapshot:
+            if binary:
+                snapshot, etags = load_snapshot(
+                    "neural-data:binary",
+                    lambda: build_snapshot(encode_neural_graph(load_neural_payload(db)), GRAPH_MEDIA_TYPE)
+                )
+            else:
+                snapshot, etags = load_snapshot(
+                    "neural-data:snapshot",
+                    lambda: build_json_snapshot(load_neural_payload(db))
+                )
+            etag = etags[encoding]
+            if is_not_modified(request, etag):
+                return not_modified_response(etag, policy, vary)
+            return snapshot_response(request, snapshot, headers=cache_headers(etag, policy, vary))
         
-        return NeuralDataResponse(projects=projects, blogs=blogs)
+        payload, etag = cached_representation("neural-data:tagged", lambda: load_neural_payload(db))
+        if is_not_modified(request, etag):
+            return not_modified_response(etag, policy, vary)
+        return JSONResponse(content=payload, headers=cache_headers(etag, policy, vary))
     except Exception as e:
         logger.error(f"Error fetching neural data: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch neural data")
+
+@router.get("/changes", response_model=NeuralChangesResponse)
+def get_neural_data_changes(request: Request, since: int = Query(0, ge=0), db: Session = Depends(get_db)):
+    """Get nodes and edges changed after sync version since.
+    
+    Clients apply the delta by dropping the nodes in deleted, replacing the
+    nodes in projects/blogs and every edge touching a node in changed, then
+    storing version for the next call. When full is true (first sync, or the
+    log no longer reaches back to since) the response is the whole scene.
+    """
+    policy = get_cache_policy("neural-data")
+    try:
+        def build():
+            changes = load_changes(db, since)
+            if changes is not None:
+                return NeuralChangesResponse.model_validate(changes).model_dump(mode="json")
+            # Read the version before the scene so a concurrent write is replayed, never skipped
+            version = current_version(db)
+            scene = build_neural_data(db).model_dump(mode="json")
+            return {"version": version, "full": True, "deleted": [], "changed": [], **scene}
+        
+        payload, etag = cached_representation(f"neural-data:changes:{since}", build)
+        if is_not_modified(request, etag):
+            return not_modified_response(etag, policy)
+        return JSONResponse(content=payload, headers=cache_headers(etag, policy))
+    except Exception as e:
+        logger.error(f"Error fetching neural data changes: {e}")
+        raise HTTPException(status_code=500, detail="Failed to fetch neural data changes")
+
+@router.get("/nearest", response_model=List[NearestNode])
+def get_nearest_nodes(
+    request: Request,
+    x: float,
+    y: float,
+    z: float,
+    k: int = Query(10, ge=1, le=100),
+    db: Session = Depends(get_db)
+):
+    """Get the k scene nodes closest to a point, nearest first."""
+    policy = get_cache_policy("neural-data")
+    
+    try:
+        _, index, nodes, _ = load_spatial_index(db)
+        results = []
+        for key, distance in index.nearest((x, y, z), k):
+            kind, node = nodes[key]
+            results.append({
+                "node": key,
+                "type": kind,
+                "id": node["id"],
+                "slug": node["slug"],
+                "title": node["title"],
+                "distance": round(distance, 4)
+            })
+        etag = content_etag(results)
+        if is_not_modified(request, etag):
+            return not_modified_response(etag, policy)
+        return JSONResponse(content=results, headers=cache_headers(etag, policy))
+    except Exception as e:
+        logger.error(f"Error fetching nearest nodes: {e}")
+        raise HTTPException(status_code=500, detail="Failed to fetch nearest nodes")
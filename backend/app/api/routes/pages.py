@@ -1,8 +1,10 @@
 """Public static page endpoints."""
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 import logging
 from app.core.database import get_db
+from app.core.http_cache import get_cache_policy, cached_representation, is_not_modified, cache_headers, not_modified_response
 from app.models import StaticPage
 from app.schemas import StaticPageResponse
 
@@ -10,16 +12,24 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 @router.get("/{key}", response_model=StaticPageResponse)
-def get_page_by_key(key: str, db: Session = Depends(get_db)):
+def get_page_by_key(key: str, request: Request, db: Session = Depends(get_db)):
     """Get a specific static page by key (public endpoint)."""
-    try:
+    policy = get_cache_policy("pages")
+    
+    def load_page():
         page = db.query(StaticPage).filter(StaticPage.page_key == key).first()
         if not page:
             raise HTTPException(
                 status_code=404,
                 detail=f"Page with key '{key}' not found"
             )
-        return page
+        return StaticPageResponse.model_validate(page).model_dump(mode="json")
+    
+    try:
+        payload, etag = cached_representation(f"pages:{key}", load_page)
+        if is_not_modified(request, etag):
+            return not_modified_response(etag, policy)
+        return JSONResponse(content=payload, headers=cache_headers(etag, policy))
     except HTTPException:
         raise
     except Exception as e:
@@ -1,35 +1,117 @@
 """Public project endpoints."""
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import JSONResponse
+from sqlalchemy.orm import Session, defer, load_only
+from typing import List, Literal, Optional, Union
 import logging
+from app.core.config import settings
 from app.core.database import get_db
+from app.core.pagination import NEXT_CURSOR_HEADER, apply_keyset, split_page
+from app.core.http_cache import get_cache_policy, cached_representation, is_not_modified, cache_headers, not_modified_response
 from app.models import Project
-from app.schemas import ProjectResponse
+from app.services.taxonomy import normalize_term, projects_with_technology
+from app.services.related import load_related
+from app.schemas import ProjectResponse, ProjectDetailResponse, ProjectNode, RelatedItem
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
-@router.get("", response_model=List[ProjectResponse])
-def get_projects(db: Session = Depends(get_db)):
-    """Get all projects with 3D positioning data."""
+def load_projects_page(db: Session, view: str, cursor: Optional[str], limit: int, tech: Optional[str] = None) -> dict:
+    """Load one page of projects as JSON-ready dicts; the summary view only selects node columns.
+    
+    Rendered bodies are left to the single-project endpoint, so neither view loads them.
+    """
+    query = db.query(Project)
+    schema = ProjectResponse
+    if view == "summary":
+        query = query.options(load_only(*Project.node_columns()))
+        schema = ProjectNode
+    else:
+        query = query.options(*(defer(column) for column in Project.rendered_columns()))
+    if tech:
+        query = query.filter(Project.id.in_(projects_with_technology(tech)))
+    
+    query = apply_keyset(query, Project.listing_order(), Project.id, cursor, limit, db.get_bind().dialect.name)
+    projects, next_cursor = split_page(query.all(), limit)
+    return {
+        "items": [schema.model_validate(project).model_dump(mode="json") for project in projects],
+        "next_cursor": next_cursor
+    }
+
+@router.get("", response_model=Union[List[ProjectResponse], List[ProjectNode]])
+def get_projects(
+    request: Request,
+    view: Literal["full", "summary"] = "full",
+    cursor: Optional[str] = None,
+    limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
+    tech: Optional[str] = Query(None, max_length=100),
+    db: Session = Depends(get_db)
+):
+    """Get projects with 3D positioning data, newest first, one page at a time.
+    
+    Use view=summary to omit markdown bodies. The X-Next-Cursor response header
+    carries the cursor for the next page and is absent on the last one.
+    tech= keeps only projects with that technology (case-insensitive).
+    """
+    tech = normalize_term(tech) if tech else ""
+    policy = get_cache_policy("projects")
     try:
-        projects = db.query(Project).all()
-        return projects
+        page, etag = cached_representation(
+            f"projects:list:{view}:{limit}:{cursor or ''}:{tech}",
+            lambda: load_projects_page(db, view, cursor, limit, tech)
+        )
+        if is_not_modified(request, etag):
+            return not_modified_response(etag, policy)
+        headers = cache_headers(etag, policy)
+        if page["next_cursor"]:
+            headers[NEXT_CURSOR_HEADER] = page["next_cursor"]
+        return JSONResponse(content=page["items"], headers=headers)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error fetching projects: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch projects")
 
-@router.get("/{slug}", response_model=ProjectResponse)
-def get_project_by_slug(slug: str, db: Session = Depends(get_db)):
+@router.get("/{slug}", response_model=ProjectDetailResponse)
+def get_project_by_slug(slug: str, request: Request, db: Session = Depends(get_db)):
     """Get individual project details by slug."""
-    try:
+    policy = get_cache_policy("projects")
+    
+    def load_project():
         project = db.query(Project).filter(Project.slug == slug).first()
         if not project:
             raise HTTPException(status_code=404, detail=f"Project with slug '{slug}' not found")
-        return project
+        return ProjectDetailResponse.model_validate(project).model_dump(mode="json")
+    
+    try:
+        payload, etag = cached_representation(f"projects:{slug}", load_project)
+        if is_not_modified(request, etag):
+            return not_modified_response(etag, policy)
+        return JSONResponse(content=payload, headers=cache_headers(etag, policy))
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"Error fetching project {slug}: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch project")
+
+@router.get("/{slug}/related", response_model=List[RelatedItem])
+def get_related_projects(slug: str, request: Request, db: Session = Depends(get_db)):
+    """Get the projects and blogs most similar to a project, best first."""
+    policy = get_cache_policy("projects")
+    
+    def load_related_items():
+        related = load_related(db, "project", slug)
+        if related is None:
+            raise HTTPException(status_code=404, detail=f"Project with slug '{slug}' not found")
+        return related
+    
+    try:
+        payload, etag = cached_representation(f"projects:related:{slug}", load_related_items)
+        if is_not_modified(request, etag):
+            return not_modified_response(etag, policy)
+        return JSONResponse(content=payload, headers=cache_headers(etag, policy))
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error fetching related content for project {slug}: {e}")
+        raise HTTPException(status_code=500, detail="Failed to fetch related content")
@@ -0,0 +1,50 @@
+"""Full-text search endpoint."""
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import JSONResponse
+from sqlalchemy.orm import Session
+from typing import List, Literal, Optional
+import logging
+from app.core.config import settings
+from app.core.database import get_db
+from app.core.cache import search_cache
+from app.core.pagination import NEXT_CURSOR_HEADER
+from app.core.http_cache import get_cache_policy, cached_representation, is_not_modified, cache_headers, not_modified_response
+from app.schemas import SearchResult
+from app.services.search import search
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+@router.get("", response_model=List[SearchResult])
+def search_content(
+    request: Request,
+    q: str = Query(..., min_length=1, max_length=200),
+    type: Optional[Literal["project", "blog"]] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=settings.PAGE_SIZE_MAX),
+    db: Session = Depends(get_db)
+):
+    """Search projects and blogs, best matches first.
+    
+    Every word in q must match (the last one as a prefix). Titles and snippets
+    are HTML-escaped with matches wrapped in <mark>. The X-Next-Cursor header
+    carries the cursor for the next page and is absent on the last one.
+    """
+    policy = get_cache_policy("search")
+    try:
+        (results, next_cursor), etag = cached_representation(
+            f"search:{type or ''}:{limit}:{cursor or ''}:{q}",
+            lambda: search(db.connection(), q, type, cursor, limit),
+            search_cache
+        )
+        if is_not_modified(request, etag):
+            return not_modified_response(etag, policy)
+        headers = cache_headers(etag, policy)
+        if next_cursor:
+            headers[NEXT_CURSOR_HEADER] = next_cursor
+        return JSONResponse(content=results, headers=headers)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error searching for {q!r}: {e}")
+        raise HTTPException(status_code=500, detail="Search failed")
@@ -0,0 +1,123 @@
+"""In-process caching utilities."""
+from collections import OrderedDict
+from threading import Lock
+import time
+from typing import Any, Callable, Hashable, Optional
+import logging
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+class LRUCache:
+    """Thread-safe bounded mapping with least-recently-used eviction and hit/miss counters."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, marking it as recently used."""
+        with self._lock:
+            value = self._entries.get(key, _MISSING)
+            if value is _MISSING:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entries when full."""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def pop(self, key: Hashable) -> Any:
+        """Remove and return the value for key, or None if absent."""
+        with self._lock:
+            return self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all entries (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        """Return a snapshot of the cache counters."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0
+            }
+
+class ContentCache(LRUCache):
+    """LRU cache whose entries are tagged with the global content version.
+
+    Entries stored under an older version are treated as misses, so bumping the
+    version after an admin write invalidates every cached read at once. The
+    version is per process; ttl_seconds bounds how long other workers can keep
+    serving entries built before a write they did not see.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float = 0):
+        super().__init__(max_entries)
+        self.ttl_seconds = ttl_seconds
+        self._version = 1
+        self._version_lock = Lock()
+
+    @property
+    def version(self) -> int:
+        """Current content version."""
+        return self._version
+
+    def bump_version(self) -> int:
+        """Advance the content version and drop entries built for older versions."""
+        with self._version_lock:
+            self._version += 1
+            version = self._version
+        self.clear()
+        logger.debug(f"Content version bumped to {version}")
+        return version
+
+    def get_or_set(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """Return the value cached for key at the current version, building it on a miss."""
+        version = self._version
+        with self._lock:
+            entry: Optional[tuple] = self._entries.get(key)
+            if entry is not None and entry[0] == version and (
+                entry[1] is None or entry[1] > time.monotonic()
+            ):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[2]
+            self.misses += 1
+
+        value = factory()
+        expires_at = time.monotonic() + self.ttl_seconds if self.ttl_seconds > 0 else None
+        self.set(key, (version, expires_at, value))
+        return value
+
+content_cache = ContentCache(settings.CACHE_MAX_ENTRIES, settings.CACHE_TTL_SECONDS)
+search_cache = ContentCache(settings.SEARCH_CACHE_MAX_ENTRIES, settings.CACHE_TTL_SECONDS)
+
+def bump_content_version() -> int:
+    """Invalidate cached public reads after a content write."""
+    search_cache.bump_version()
+    return content_cache.bump_version()
@@ -10,6 +10,14 @@ class Settings:
     # Database
     DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite:///./neural_space.db")
     
+    # Async driver URL (aiosqlite / asyncpg), derived from DATABASE_URL unless set
+    ASYNC_DATABASE_URL: str = os.getenv("ASYNC_DATABASE_URL") or (
+        DATABASE_URL
+        .replace("sqlite://", "sqlite+aiosqlite://", 1)
+        .replace("postgresql://", "postgresql+asyncpg://", 1)
+        .replace("postgres://", "postgresql+asyncpg://", 1)
+    )
+    
     # CORS
     ALLOWED_ORIGINS: list = [
         "http://localhost:3000",
@@ -26,11 +34,66 @@ class Settings:
     ALGORITHM: str = "HS256"
     SESSION_EXPIRY_HOURS: int = 24
     
+    # "session" resolves opaque tokens against admin_sessions; "token" issues
+    # short-lived signed tokens verified in memory with sliding refresh
+    AUTH_BACKEND: str = os.getenv("AUTH_BACKEND", "session")
+    ACCESS_TOKEN_EXPIRE_MINUTES: int = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
+    ACCESS_TOKEN_REFRESH_MINUTES: int = int(os.getenv("ACCESS_TOKEN_REFRESH_MINUTES", "10"))
+    SESSION_CACHE_MAX_ENTRIES: int = int(os.getenv("SESSION_CACHE_MAX_ENTRIES", "1024"))
+    SESSION_CACHE_TTL_SECONDS: float = float(os.getenv("SESSION_CACHE_TTL_SECONDS", "60"))
+    # How long a signed token's "not revoked" answer is trusted before revoked_tokens is checked again
+    TOKEN_REVOCATION_CHECK_SECONDS: float = float(os.getenv("TOKEN_REVOCATION_CHECK_SECONDS", "5"))
+    PASSWORD_HASH_WORKERS: int = int(os.getenv("PASSWORD_HASH_WORKERS", "2"))
+    PASSWORD_HASH_QUEUE_DEPTH: int = int(os.getenv("PASSWORD_HASH_QUEUE_DEPTH", "8"))
+    LOGIN_THROTTLE_WINDOW_SECONDS: int = int(os.getenv("LOGIN_THROTTLE_WINDOW_SECONDS", "300"))
+    LOGIN_MAX_ATTEMPTS_PER_USERNAME: int = int(os.getenv("LOGIN_MAX_ATTEMPTS_PER_USERNAME", "5"))
+    LOGIN_MAX_ATTEMPTS_PER_IP: int = int(os.getenv("LOGIN_MAX_ATTEMPTS_PER_IP", "20"))
+    
+    # Background removal of expired sessions/revocations; 0 disables the sweeper
+    SESSION_SWEEP_INTERVAL_SECONDS: float = float(os.getenv("SESSION_SWEEP_INTERVAL_SECONDS", "300"))
+    SESSION_SWEEP_BATCH_SIZE: int = int(os.getenv("SESSION_SWEEP_BATCH_SIZE", "500"))
+    
+    # Neural-data change log entries older than this are compacted by the sweeper
+    CHANGE_LOG_RETENTION_DAYS: float = float(os.getenv("CHANGE_LOG_RETENTION_DAYS", "30"))
+    
     # API
     API_V1_PREFIX: str = "/api"
     PROJECT_NAME: str = "Neural Space Portfolio API"
     VERSION: str = "1.0.0"
     
+    # Caching
+    CACHE_MAX_ENTRIES: int = int(os.getenv("CACHE_MAX_ENTRIES", "256"))
+    CACHE_TTL_SECONDS: float = float(os.getenv("CACHE_TTL_SECONDS", "60"))
+    # Search results get their own cache so free-text queries cannot evict scene and list entries
+    SEARCH_CACHE_MAX_ENTRIES: int = int(os.getenv("SEARCH_CACHE_MAX_ENTRIES", "512"))
+    NEURAL_DATA_SNAPSHOT: bool = os.getenv("NEURAL_DATA_SNAPSHOT", "true").lower() == "true"
+    RENDER_CACHE_MAX_ENTRIES: int = int(os.getenv("RENDER_CACHE_MAX_ENTRIES", "4096"))
+    
+    # Server-Sent Events (/api/events)
+    EVENTS_HEARTBEAT_SECONDS: float = float(os.getenv("EVENTS_HEARTBEAT_SECONDS", "15"))
+    EVENTS_QUEUE_SIZE: int = int(os.getenv("EVENTS_QUEUE_SIZE", "64"))
+    EVENTS_MAX_SUBSCRIBERS: int = int(os.getenv("EVENTS_MAX_SUBSCRIBERS", "10000"))
+    
+    # Pagination
+    PAGE_SIZE_DEFAULT: int = int(os.getenv("PAGE_SIZE_DEFAULT", "50"))
+    PAGE_SIZE_MAX: int = int(os.getenv("PAGE_SIZE_MAX", "200"))
+    
+    # Bulk NDJSON import/export (/api/admin/bulk)
+    BULK_CHUNK_SIZE: int = int(os.getenv("BULK_CHUNK_SIZE", "500"))
+    BULK_MAX_LINE_BYTES: int = int(os.getenv("BULK_MAX_LINE_BYTES", "2097152"))
+    
+    # HTTP caching (seconds); per-route policies are (max_age, stale_while_revalidate)
+    HTTP_CACHE_MAX_AGE: int = int(os.getenv("HTTP_CACHE_MAX_AGE", "60"))
+    HTTP_CACHE_STALE_WHILE_REVALIDATE: int = int(os.getenv("HTTP_CACHE_STALE_WHILE_REVALIDATE", "300"))
+    HTTP_CACHE_POLICIES: dict = {
+        "projects": (HTTP_CACHE_MAX_AGE, HTTP_CACHE_STALE_WHILE_REVALIDATE),
+        "blogs": (HTTP_CACHE_MAX_AGE, HTTP_CACHE_STALE_WHILE_REVALIDATE),
+        "neural-data": (HTTP_CACHE_MAX_AGE, HTTP_CACHE_STALE_WHILE_REVALIDATE),
+        "search": (HTTP_CACHE_MAX_AGE, HTTP_CACHE_STALE_WHILE_REVALIDATE),
+        "facets": (HTTP_CACHE_MAX_AGE, HTTP_CACHE_STALE_WHILE_REVALIDATE),
+        "pages": (int(os.getenv("HTTP_CACHE_PAGES_MAX_AGE", "300")), 3600),
+    }
+    
     # Logging
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
 
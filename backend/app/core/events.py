@@ -0,0 +1,103 @@
+"""In-process pub/sub of content change events for Server-Sent Events clients."""
+from typing import Optional, Set
+import asyncio
+import logging
+import secrets
+import orjson
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+HEARTBEAT = b": ping\n\n"
+
+def format_event(event: str, data: dict, event_id: Optional[str] = None) -> bytes:
+    """Encode one SSE message."""
+    prefix = f"id: {event_id}\n" if event_id is not None else ""
+    return f"{prefix}event: {event}\n".encode() + b"data: " + orjson.dumps(data) + b"\n\n"
+
+class EventBroker:
+    """Fans events out to bounded per-subscriber queues.
+
+    Each event is encoded once and shared by every queue. Publishing never
+    blocks: a subscriber whose queue is full has its backlog replaced by a
+    single resync event, telling it to refetch instead of replaying. All
+    methods must be called from the event loop thread.
+
+    Event ids are "<boot id>-<sequence>". Nothing is replayed, so a client
+    reconnecting with any other Last-Event-ID than last_event_id (another
+    process, a restart, or events published while it was away) must resync.
+    """
+
+    def __init__(self, queue_size: int, max_subscribers: int):
+        self.queue_size = queue_size
+        self.max_subscribers = max_subscribers
+        self._subscribers: Set[asyncio.Queue] = set()
+        self._boot_id = secrets.token_hex(4)
+        self.published = 0
+        self.overflows = 0
+
+    @property
+    def last_event_id(self) -> str:
+        """Id of the latest published event (sequence 0 before the first)."""
+        return f"{self._boot_id}-{self.published}"
+
+    def resync(self, reason: str) -> bytes:
+        """Resync event carrying the current id, so the client's next reconnect starts from here."""
+        return format_event("resync", {"reason": reason}, self.last_event_id)
+
+    @property
+    def full(self) -> bool:
+        return len(self._subscribers) >= self.max_subscribers
+
+    def subscribe(self) -> Optional[asyncio.Queue]:
+        """Register a new subscriber, or return None when at capacity."""
+        if self.full:
+            return None
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        self._subscribers.discard(queue)
+
+    def publish(self, event: str, data: dict) -> int:
+        """Queue an event for every subscriber; returns how many received it."""
+        self.published += 1
+        message = format_event(event, data, self.last_event_id)
+        overflow = None
+        for queue in self._subscribers:
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                while not queue.empty():
+                    queue.get_nowait()
+                overflow = overflow or self.resync("queue overflow")
+                queue.put_nowait(overflow)
+                self.overflows += 1
+        return len(self._subscribers)
+
+    def close(self) -> None:
+        """End every open stream, e.g. on shutdown."""
+        for queue in self._subscribers:
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait(None)
+        self._subscribers.clear()
+
+    def stats(self) -> dict:
+        return {
+            "subscribers": len(self._subscribers),
+            "max_subscribers": self.max_subscribers,
+            "queue_size": self.queue_size,
+            "published": self.published,
+            "overflows": self.overflows
+        }
+
+content_events = EventBroker(settings.EVENTS_QUEUE_SIZE, settings.EVENTS_MAX_SUBSCRIBERS)
+
+def publish_content_change(kind: str, node_id: int, slug: str, action: str, version: int, sync_version: Optional[int] = None) -> None:
+    """Announce a committed admin write to every SSE subscriber."""
+    data = {"type": kind, "id": node_id, "slug": slug, "action": action, "version": version}
+    if sync_version is not None:
+        data["sync_version"] = sync_version
+    content_events.publish("content", data)
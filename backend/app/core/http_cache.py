@@ -0,0 +1,73 @@
+"""HTTP conditional GET and Cache-Control helpers for public routes."""
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Optional, Tuple
+import hashlib
+import orjson
+from fastapi import Request, Response
+from .cache import ContentCache, content_cache
+from .config import settings
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """Cache-Control policy for a public route."""
+    max_age: int
+    stale_while_revalidate: int
+
+    @property
+    def header(self) -> str:
+        return f"public, max-age={self.max_age}, stale-while-revalidate={self.stale_while_revalidate}"
+
+def get_cache_policy(route: str) -> CachePolicy:
+    """Look up the configured policy for a route, falling back to the defaults."""
+    max_age, stale_while_revalidate = settings.HTTP_CACHE_POLICIES.get(
+        route,
+        (settings.HTTP_CACHE_MAX_AGE, settings.HTTP_CACHE_STALE_WHILE_REVALIDATE)
+    )
+    return CachePolicy(max_age=max_age, stale_while_revalidate=stale_while_revalidate)
+
+def content_etag(payload: Any, *parts: str) -> str:
+    """Build a strong ETag by hashing a representation's content.
+
+    payload is hashed as-is when it is already encoded, otherwise as JSON with
+    sorted keys, so every worker derives the same ETag for the same content.
+    parts distinguish representations of one payload (e.g. content codings).
+    """
+    body = payload if isinstance(payload, bytes) else orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+    digest = hashlib.sha1(body)
+    for part in parts:
+        digest.update(b"\0" + part.encode())
+    return f'"{digest.hexdigest()[:20]}"'
+
+def cached_representation(key: Hashable, factory: Callable[[], Any], cache: ContentCache = content_cache) -> Tuple[Any, str]:
+    """Cached payload for key with its content ETag, hashed once per cache fill."""
+    def build():
+        payload = factory()
+        return payload, content_etag(payload)
+    return cache.get_or_set(key, build)
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """Check the request's If-None-Match header against the current ETag."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+def cache_headers(etag: str, policy: CachePolicy, vary: Optional[str] = None) -> dict:
+    """Headers attached to both full and 304 responses."""
+    headers = {"ETag": etag, "Cache-Control": policy.header}
+    if vary:
+        headers["Vary"] = vary
+    return headers
+
+def not_modified_response(etag: str, policy: CachePolicy, vary: Optional[str] = None) -> Response:
+    """Empty 304 response carrying the validators."""
+    return Response(status_code=304, headers=cache_headers(etag, policy, vary))
@@ -0,0 +1,61 @@
+"""Keyset (cursor) pagination helpers."""
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+import base64
+import json
+from fastapi import HTTPException
+from sqlalchemy import String, and_, or_, type_coerce
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+def encode_cursor(sort_value: Any, row_id: int) -> str:
+    """Encode the last row's sort key into an opaque, URL-safe cursor."""
+    if isinstance(sort_value, datetime):
+        sort_value = sort_value.isoformat()
+    raw = json.dumps([sort_value, row_id], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def decode_cursor(cursor: str, parse_datetime: bool = False) -> Tuple[Any, int]:
+    """Decode a cursor produced by encode_cursor, optionally parsing its sort value as a datetime."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        sort_value, row_id = json.loads(raw)
+        if not isinstance(row_id, int) or not (sort_value is None or isinstance(sort_value, str)):
+            raise ValueError("malformed cursor")
+        if parse_datetime and sort_value is not None:
+            sort_value = datetime.fromisoformat(sort_value)
+        return sort_value, row_id
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+
+def apply_keyset(query, sort_column, id_column, cursor: Optional[str], limit: int, dialect: str):
+    """Order a Query/Select newest-first on (sort_column, id) and seek past the cursor.
+
+    The sort key is added as an extra result column so the next cursor can be
+    built from the exact value the database compared. On SQLite timestamps are
+    compared as stored text, which keeps the seek predicate consistent with
+    ORDER BY no matter how the value was written.
+    """
+    sort_key = type_coerce(sort_column, String) if dialect == "sqlite" else sort_column
+    query = query.add_columns(sort_key.label("cursor_key"))
+
+    if cursor:
+        sort_value, last_id = decode_cursor(cursor, parse_datetime=dialect != "sqlite")
+        # The leading range predicate lets the (sort, id) index bound the scan
+        query = query.where(and_(
+            sort_key <= sort_value,
+            or_(sort_key < sort_value, id_column < last_id)
+        ))
+
+    return query.order_by(sort_key.desc(), id_column.desc()).limit(limit + 1)
+
+def split_page(rows: List[Any], limit: int) -> Tuple[List[Any], Optional[str]]:
+    """Split (entity, cursor_key) rows fetched with limit + 1 into items and the next cursor."""
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    items = [row[0] for row in rows]
+
+    if not has_more:
+        return items, None
+    last_entity, last_key = rows[-1]
+    return items, encode_cursor(last_key, last_entity.id)
@@ -0,0 +1,102 @@
+"""In-process sliding-window rate limiting."""
+from collections import OrderedDict, deque
+from threading import Lock
+from typing import Deque, Optional
+import math
+import time
+from .config import settings
+
+class SlidingWindowLimiter:
+    """Allow at most max_attempts per key within the trailing window.
+
+    The number of tracked keys is bounded; the least recently seen keys are
+    dropped first so a flood of distinct keys cannot grow memory without limit.
+    """
+
+    def __init__(self, max_attempts: int, window_seconds: float, max_keys: int = 10000):
+        self.max_attempts = max_attempts
+        self.window_seconds = window_seconds
+        self.max_keys = max_keys
+        self._attempts: "OrderedDict[str, Deque[float]]" = OrderedDict()
+        self._lock = Lock()
+        self.rejected = 0
+
+    def _prune(self, key: str, now: float) -> Deque[float]:
+        attempts = self._attempts.get(key)
+        if attempts is None:
+            return deque()
+        while attempts and attempts[0] <= now - self.window_seconds:
+            attempts.popleft()
+        return attempts
+
+    def retry_after(self, key: str) -> Optional[int]:
+        """Seconds until key may try again, or None if it is not limited."""
+        now = time.monotonic()
+        with self._lock:
+            attempts = self._prune(key, now)
+            if len(attempts) < self.max_attempts:
+                return None
+            self.rejected += 1
+            return max(1, math.ceil(attempts[0] + self.window_seconds - now))
+
+    def hit(self, key: str) -> None:
+        """Record an attempt for key."""
+        now = time.monotonic()
+        with self._lock:
+            attempts = self._prune(key, now)
+            attempts.append(now)
+            self._attempts[key] = attempts
+            self._attempts.move_to_end(key)
+            while len(self._attempts) > self.max_keys:
+                self._attempts.popitem(last=False)
+
+    def reset(self, key: str) -> None:
+        """Forget all attempts for key."""
+        with self._lock:
+            self._attempts.pop(key, None)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "tracked_keys": len(self._attempts),
+                "max_attempts": self.max_attempts,
+                "window_seconds": self.window_seconds,
+                "rejected": self.rejected
+            }
+
+class LoginThrottle:
+    """Per-username and per-IP login attempt limits, checked before any password hashing."""
+
+    def __init__(self, window_seconds: float, max_per_username: int, max_per_ip: int):
+        self.by_username = SlidingWindowLimiter(max_per_username, window_seconds)
+        self.by_ip = SlidingWindowLimiter(max_per_ip, window_seconds)
+
+    def retry_after(self, username: str, client_ip: str) -> Optional[int]:
+        """Seconds to wait if either the username or the client IP is over its limit."""
+        waits = [
+            wait for wait in (
+                self.by_username.retry_after(username.lower()),
+                self.by_ip.retry_after(client_ip)
+            ) if wait is not None
+        ]
+        return max(waits) if waits else None
+
+    def record_attempt(self, username: str, client_ip: str) -> None:
+        self.by_username.hit(username.lower())
+        self.by_ip.hit(client_ip)
+
+    def record_success(self, username: str) -> None:
+        """Clear the username window after a successful login."""
+        self.by_username.reset(username.lower())
+
+    def stats(self) -> dict:
+        return {
+            "by_username": self.by_username.stats(),
+            "by_ip": self.by_ip.stats()
+        }
+
+login_throttle = LoginThrottle(
+    settings.LOGIN_THROTTLE_WINDOW_SECONDS,
+    settings.LOGIN_MAX_ATTEMPTS_PER_USERNAME,
+    settings.LOGIN_MAX_ATTEMPTS_PER_IP
+)
@@ -1,6 +1,10 @@
 """Security utilities for authentication."""
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from threading import Lock
+from typing import Optional, Tuple
+import asyncio
+import calendar
 import secrets
 from passlib.context import CryptContext
 from jose import JWTError, jwt
@@ -16,6 +20,60 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a plain text password against a hashed password."""
     return pwd_context.verify(plain_password, hashed_password)
 
+class PasswordPoolSaturated(Exception):
+    """Raised when the password hashing pool and its queue are full."""
+
+class PasswordHasherPool:
+    """Bounded worker pool that keeps bcrypt work off the event loop.
+    
+    At most max_workers hashes run concurrently and at most max_queue more may
+    wait; further requests are rejected immediately instead of piling up.
+    """
+    
+    def __init__(self, max_workers: int, max_queue: int):
+        self.max_workers = max(1, max_workers)
+        self.max_queue = max(0, max_queue)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="password-hash")
+        self._lock = Lock()
+        self._pending = 0
+        self.peak_pending = 0
+        self.completed = 0
+        self.rejected = 0
+    
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """Verify a password in the worker pool, raising PasswordPoolSaturated when full."""
+        with self._lock:
+            if self._pending >= self.max_workers + self.max_queue:
+                self.rejected += 1
+                raise PasswordPoolSaturated()
+            self._pending += 1
+            self.peak_pending = max(self.peak_pending, self._pending)
+        
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, verify_password, plain_password, hashed_password)
+        finally:
+            with self._lock:
+                self._pending -= 1
+                self.completed += 1
+    
+    def stats(self) -> dict:
+        """Return pool saturation counters."""
+        with self._lock:
+            capacity = self.max_workers + self.max_queue
+            return {
+                "workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "in_flight": min(self._pending, self.max_workers),
+                "queued": max(0, self._pending - self.max_workers),
+                "saturation": round(self._pending / capacity, 4),
+                "peak_pending": self.peak_pending,
+                "completed": self.completed,
+                "rejected": self.rejected
+            }
+
+password_pool = PasswordHasherPool(settings.PASSWORD_HASH_WORKERS, settings.PASSWORD_HASH_QUEUE_DEPTH)
+
 def create_session_token() -> str:
     """Generate a secure random session token."""
     return secrets.token_urlsafe(48)
@@ -37,3 +95,44 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
 def get_session_expiry() -> datetime:
     """Get the expiration datetime for a new session."""
     return datetime.utcnow() + timedelta(hours=settings.SESSION_EXPIRY_HOURS)
+
+def issue_admin_token(
+    user_id: int,
+    username: str,
+    email: Optional[str] = None,
+    jti: Optional[str] = None,
+    auth_time: Optional[datetime] = None
+) -> Tuple[str, datetime]:
+    """Issue a short-lived signed admin token, returning it with its expiry.
+    
+    Refreshed tokens keep the original jti and auth_time, so revoking the jti
+    revokes every token of that login and refresh stops at SESSION_EXPIRY_HOURS.
+    """
+    now = datetime.utcnow()
+    auth_time = auth_time or now
+    expires_at = min(
+        now + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES),
+        auth_time + timedelta(hours=settings.SESSION_EXPIRY_HOURS)
+    )
+    token = create_access_token(
+        {
+            "sub": str(user_id),
+            "username": username,
+            "email": email,
+            "jti": jti or secrets.token_urlsafe(16),
+            "auth_time": calendar.timegm(auth_time.utctimetuple())
+        },
+        expires_delta=expires_at - now
+    )
+    return token, expires_at
+
+def decode_admin_token(token: str) -> Optional[dict]:
+    """Verify a signed admin token, returning its claims or None if invalid or expired."""
+    try:
+        return jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    except JWTError:
+        return None
+
+def get_revocation_expiry(claims: dict) -> datetime:
+    """Latest moment any token sharing these claims' jti could still be valid."""
+    return datetime.utcfromtimestamp(claims["auth_time"]) + timedelta(hours=settings.SESSION_EXPIRY_HOURS)
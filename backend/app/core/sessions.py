@@ -0,0 +1,129 @@
+"""In-memory cache of authenticated admin sessions."""
+from dataclasses import dataclass
+from datetime import datetime
+from threading import Lock
+from typing import Dict, Optional
+import logging
+import time
+from fastapi import Response
+from .cache import LRUCache
+from .config import settings
+from .database import SessionLocal
+from app.models import RevokedToken
+
+logger = logging.getLogger(__name__)
+
+SESSION_COOKIE = "admin_session"
+
+@dataclass(frozen=True)
+class AdminPrincipal:
+    """Detached snapshot of the authenticated admin user."""
+    id: int
+    username: str
+    email: Optional[str] = None
+
+class SessionCache(LRUCache):
+    """Maps session tokens to (principal, session expiry) so steady-state auth skips the database.
+
+    Entries are dropped at the session's own expiry and, at the latest, after
+    ttl_seconds, which bounds how long a logout performed by another worker
+    can go unnoticed here.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        super().__init__(max_entries)
+        self.ttl_seconds = ttl_seconds
+
+    def get_session(self, token: str) -> Optional[AdminPrincipal]:
+        """Return the cached principal for token, or None on a miss or expiry."""
+        entry = self.get(token)
+        if entry is None:
+            return None
+
+        principal, expires_at, cached_until = entry
+        if expires_at < datetime.utcnow() or cached_until < time.monotonic():
+            self.pop(token)
+            return None
+        return principal
+
+    def put(self, token: str, principal: AdminPrincipal, expires_at: datetime) -> None:
+        self.set(token, (principal, expires_at, time.monotonic() + self.ttl_seconds))
+
+    def evict(self, token: str) -> None:
+        self.pop(token)
+
+session_cache = SessionCache(settings.SESSION_CACHE_MAX_ENTRIES, settings.SESSION_CACHE_TTL_SECONDS)
+
+class RevocationList:
+    """In-memory mirror of the revoked_tokens table for the signed-token auth backend.
+
+    Revocations recorded by this worker are known at once. For any other jti
+    a "not revoked" answer is trusted for check_ttl_seconds after it was last
+    confirmed against the database, which bounds how long a logout performed
+    by another worker can go unnoticed here.
+    """
+
+    def __init__(self, check_ttl_seconds: float, max_checked: int):
+        self._revoked: Dict[str, datetime] = {}
+        self._lock = Lock()
+        self.check_ttl_seconds = check_ttl_seconds
+        self._checked = LRUCache(max_checked)
+
+    def revoke(self, jti: str, expires_at: datetime) -> None:
+        with self._lock:
+            self._revoked[jti] = expires_at
+
+    def is_revoked(self, jti: str) -> bool:
+        return jti in self._revoked
+
+    def needs_check(self, jti: str) -> bool:
+        """Whether jti's revocation state must be confirmed against the database."""
+        checked_at = self._checked.get(jti)
+        return checked_at is None or time.monotonic() - checked_at >= self.check_ttl_seconds
+
+    def mark_checked(self, jti: str) -> None:
+        """Record that the database had no revocation for jti just now."""
+        self._checked.set(jti, time.monotonic())
+
+    def merge(self, revoked: Dict[str, datetime]) -> None:
+        """Add a freshly loaded set of revocations, keeping ones recorded meanwhile."""
+        with self._lock:
+            self._revoked.update(revoked)
+
+    def prune(self) -> int:
+        """Forget revocations whose tokens have expired anyway."""
+        now = datetime.utcnow()
+        with self._lock:
+            expired = [jti for jti, expires_at in self._revoked.items() if expires_at < now]
+            for jti in expired:
+                del self._revoked[jti]
+        return len(expired)
+
+    def __len__(self) -> int:
+        return len(self._revoked)
+
+revocation_list = RevocationList(settings.TOKEN_REVOCATION_CHECK_SECONDS, settings.SESSION_CACHE_MAX_ENTRIES)
+
+def load_revoked_tokens() -> int:
+    """Load unexpired revocations from the database into the in-memory list."""
+    db = SessionLocal()
+    try:
+        rows = db.query(RevokedToken.jti, RevokedToken.expires_at).filter(
+            RevokedToken.expires_at >= datetime.utcnow()
+        ).all()
+        revocation_list.merge({jti: expires_at for jti, expires_at in rows})
+        logger.info(f"Loaded {len(rows)} revoked admin tokens")
+        return len(rows)
+    finally:
+        db.close()
+
+def set_session_cookie(response: Response, value: str) -> None:
+    """Set the HTTP-only admin session cookie."""
+    response.set_cookie(
+        key=SESSION_COOKIE,
+        value=value,
+        httponly=True,
+        secure=False,
+        samesite="lax",
+        max_age=settings.SESSION_EXPIRY_HOURS * 60 * 60
+    )
@@ -0,0 +1,46 @@
+"""Pre-encoded response snapshots."""
+from dataclasses import dataclass
+from typing import Any, Optional
+import gzip
+import orjson
+from fastapi import Request, Response
+
+@dataclass(frozen=True)
+class Snapshot:
+    """Immutable response body, pre-encoded in plain and gzip form."""
+    body: bytes
+    gzip_body: bytes
+    media_type: str = "application/json"
+
+def build_snapshot(body: bytes, media_type: str = "application/json") -> Snapshot:
+    """Gzip an encoded body once for reuse across requests."""
+    return Snapshot(body=body, gzip_body=gzip.compress(body, compresslevel=6, mtime=0), media_type=media_type)
+
+def build_json_snapshot(payload: Any) -> Snapshot:
+    """Encode payload once with orjson and gzip it for reuse across requests."""
+    return build_snapshot(orjson.dumps(payload))
+
+def accepts_gzip(request: Request) -> bool:
+    """Check whether the client advertised gzip support."""
+    return "gzip" in request.headers.get("accept-encoding", "").lower()
+
+def accepts_media_type(request: Request, media_type: str) -> bool:
+    """Check whether the client explicitly listed media_type in its Accept header."""
+    accepted = (part.split(";")[0].strip().lower() for part in request.headers.get("accept", "").split(","))
+    return media_type in accepted
+
+def snapshot_response(
+    request: Request,
+    snapshot: Snapshot,
+    headers: Optional[dict] = None
+) -> Response:
+    """Return the snapshot bytes as-is, picking the gzip body when the client supports it."""
+    response_headers = {"Vary": "Accept-Encoding"}
+    if headers:
+        response_headers.update(headers)
+
+    if accepts_gzip(request):
+        response_headers["Content-Encoding"] = "gzip"
+        return Response(content=snapshot.gzip_body, media_type=snapshot.media_type, headers=response_headers)
+
+    return Response(content=snapshot.body, media_type=snapshot.media_type, headers=response_headers)
@@ -0,0 +1,125 @@
+"""Background sweeper for expired admin sessions, token revocations and old change log entries."""
+from datetime import datetime, timedelta
+from typing import Optional
+import asyncio
+import logging
+import time
+from sqlalchemy import delete, func, select
+from .config import settings
+from .database import AsyncSessionLocal
+from .sessions import revocation_list
+from app.models import AdminSession, RevokedToken, ContentChange
+
+logger = logging.getLogger(__name__)
+
+# Pause between batches so queued writers get the SQLite write lock
+BATCH_PAUSE_SECONDS = 0.05
+
+class SessionSweeper:
+    """Deletes expired rows in small batches, one short transaction per batch.
+
+    Each batch selects at most batch_size primary keys through the expires_at
+    index and deletes exactly those rows, so no single transaction holds the
+    write lock for longer than one bounded delete.
+    """
+
+    def __init__(self, interval_seconds: float, batch_size: int):
+        self.interval_seconds = interval_seconds
+        self.batch_size = batch_size
+        self._task: Optional[asyncio.Task] = None
+        self.runs = 0
+        self.last_swept = 0
+        self.total_swept = 0
+        self.last_run_at: Optional[datetime] = None
+        self.last_duration_ms = 0.0
+
+    async def _sweep_table(self, key_column, expires_column, retention: timedelta = timedelta(0), *conditions) -> int:
+        swept = 0
+        while True:
+            cutoff = datetime.utcnow() - retention
+            async with AsyncSessionLocal() as db:
+                keys = (await db.scalars(
+                    select(key_column)
+                    .where(expires_column < cutoff, *conditions)
+                    .order_by(expires_column)
+                    .limit(self.batch_size)
+                )).all()
+                if not keys:
+                    return swept
+
+                await db.execute(delete(key_column.table).where(key_column.in_(keys)))
+                await db.commit()
+
+            swept += len(keys)
+            if len(keys) < self.batch_size:
+                return swept
+            await asyncio.sleep(BATCH_PAUSE_SECONDS)
+
+    async def sweep_once(self) -> int:
+        """Run one sweep and return the number of rows deleted."""
+        start = time.perf_counter()
+        swept = await self._sweep_table(AdminSession.id, AdminSession.expires_at)
+        swept += await self._sweep_table(RevokedToken.jti, RevokedToken.expires_at)
+        # The newest entry always survives so the log keeps its current version
+        swept += await self._sweep_table(
+            ContentChange.id,
+            ContentChange.created_at,
+            timedelta(days=settings.CHANGE_LOG_RETENTION_DAYS),
+            ContentChange.id < select(func.max(ContentChange.id)).scalar_subquery()
+        )
+        revocation_list.prune()
+
+        if settings.AUTH_BACKEND == "token":
+            # Picks up revocations recorded by other workers
+            async with AsyncSessionLocal() as db:
+                rows = (await db.execute(
+                    select(RevokedToken.jti, RevokedToken.expires_at)
+                    .where(RevokedToken.expires_at >= datetime.utcnow())
+                )).all()
+            revocation_list.merge({jti: expires_at for jti, expires_at in rows})
+
+        self.runs += 1
+        self.last_swept = swept
+        self.total_swept += swept
+        self.last_run_at = datetime.utcnow()
+        self.last_duration_ms = round((time.perf_counter() - start) * 1000, 2)
+        if swept:
+            logger.info(f"Swept {swept} expired rows in {self.last_duration_ms}ms")
+        return swept
+
+    async def run(self) -> None:
+        """Sweep forever at the configured interval."""
+        while True:
+            try:
+                await self.sweep_once()
+            except Exception as e:
+                logger.error(f"Session sweep failed: {e}")
+            await asyncio.sleep(self.interval_seconds)
+
+    def start(self) -> None:
+        if self.interval_seconds > 0 and self._task is None:
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def stats(self) -> dict:
+        return {
+            "running": self._task is not None,
+            "interval_seconds": self.interval_seconds,
+            "batch_size": self.batch_size,
+            "runs": self.runs,
+            "last_swept": self.last_swept,
+            "total_swept": self.total_swept,
+            "last_run_at": self.last_run_at.isoformat() if self.last_run_at else None,
+            "last_duration_ms": self.last_duration_ms
+        }
+
+session_sweeper = SessionSweeper(settings.SESSION_SWEEP_INTERVAL_SECONDS, settings.SESSION_SWEEP_BATCH_SIZE)
@@ -3,7 +3,16 @@ from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 import logging
 from app.core.config import settings
-from app.core.database import create_tables, check_database_connection
+from app.core.database import create_tables, check_database_connection, engine
+from app.core.sessions import load_revoked_tokens
+from app.core.sweeper import session_sweeper
+from app.core.events import content_events
+from app.services.search import ensure_search_index
+from app.services.neural_edges import backfill_neural_edges
+from app.services.taxonomy import backfill_terms
+from app.services.related import backfill_related
+from app.services.rendering import backfill_rendered_content
+from app.services.counters import backfill_counters
 from app.api import api_router
 
 logging.basicConfig(level=settings.LOG_LEVEL)
@@ -21,6 +30,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 @app.on_event("startup")
@@ -34,10 +44,26 @@ async def startup_event():
     
     try:
         create_tables()
+        ensure_search_index(engine)
+        if settings.AUTH_BACKEND == "token":
+            load_revoked_tokens()
+        backfill_neural_edges()
+        backfill_terms()
+        backfill_related()
+        backfill_rendered_content()
+        backfill_counters()
         logger.info("Database initialization completed")
     except Exception as e:
         logger.error(f"Database initialization failed: {e}")
         raise HTTPException(status_code=500, detail="Database initialization failed")
+    
+    session_sweeper.start()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop background tasks and end open event streams."""
+    content_events.close()
+    await session_sweeper.stop()
 
 @app.get("/")
 async def root():
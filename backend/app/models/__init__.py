@@ -1,7 +1,12 @@
 """Database models."""
 from .project import Project
 from .blog import Blog
-from .admin import AdminUser, AdminSession
+from .admin import AdminUser, AdminSession, RevokedToken
 from .static_page import StaticPage
+from .neural_edge import NeuralEdge
+from .content_change import ContentChange
+from .taxonomy import BlogTag, ProjectTechnology, FacetCount
+from .related_content import RelatedContent
+from .content_counter import ContentCounter
 
-__all__ = ["Project", "Blog", "AdminUser", "AdminSession", "StaticPage"]
+__all__ = ["Project", "Blog", "AdminUser", "AdminSession", "RevokedToken", "StaticPage", "NeuralEdge", "ContentChange", "BlogTag", "ProjectTechnology", "FacetCount", "RelatedContent", "ContentCounter"]
@@ -1,5 +1,5 @@
 """Blog model."""
-from sqlalchemy import Column, Integer, String, Text, Float, DateTime, Boolean
+from sqlalchemy import Column, Integer, String, Text, Float, DateTime, Boolean, Index
 from sqlalchemy.sql import func
 from app.core.database import Base
 import json
@@ -14,6 +14,10 @@ class Blog(Base):
     summary = Column(Text, nullable=True)
     author = Column(String, default="Satyam", nullable=False)
     tags = Column(Text, nullable=True)
+    content_html = Column(Text, nullable=True)
+    toc = Column(Text, nullable=True)
+    word_count = Column(Integer, nullable=True)
+    reading_time = Column(Integer, nullable=True)
     image_url = Column(String, nullable=True)
     published = Column(Boolean, default=True, nullable=False)
     published_at = Column(DateTime(timezone=True), nullable=True)
@@ -23,6 +27,28 @@ class Blog(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     
+    __table_args__ = (
+        Index("ix_blogs_listing_order", func.coalesce(published_at, created_at), id),
+    )
+    
+    @classmethod
+    def listing_order(cls):
+        """Sort key for listings: publish date, falling back to creation date."""
+        return func.coalesce(cls.published_at, cls.created_at)
+    
+    @classmethod
+    def node_columns(cls):
+        """Columns needed to render the blog as a listing entry or scene node."""
+        return (
+            cls.id, cls.slug, cls.title, cls.summary, cls.tags,
+            cls.position_x, cls.position_y, cls.position_z
+        )
+    
+    @classmethod
+    def rendered_columns(cls):
+        """Columns holding the rendered body, only needed by the single-blog view."""
+        return (cls.content_html, cls.toc, cls.word_count, cls.reading_time)
+    
     def get_tags_list(self):
         """Convert tags JSON string to list."""
         try:
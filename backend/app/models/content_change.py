@@ -0,0 +1,20 @@
+"""Content change log model."""
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, DateTime
+from app.core.database import Base
+
+class ContentChange(Base):
+    """One entry of the scene change log; the id doubles as the sync version.
+
+    op is "upsert" or "delete" (a tombstone) for a single node, or "reset"
+    (node "*") when every node may have changed, e.g. after a layout run.
+    AUTOINCREMENT keeps ids from being reused once old entries are compacted.
+    """
+    __tablename__ = "content_changes"
+    
+    id = Column(Integer, primary_key=True)
+    node = Column(String(40), nullable=False)
+    op = Column(String(10), nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True, nullable=False)
+    
+    __table_args__ = {"sqlite_autoincrement": True}
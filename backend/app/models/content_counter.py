@@ -0,0 +1,14 @@
+"""Content counter model."""
+from sqlalchemy import Column, Integer
+from app.core.database import Base
+
+class ContentCounter(Base):
+    """Single row (id 1) of dashboard totals, adjusted by the admin write routes."""
+    __tablename__ = "content_counters"
+    
+    id = Column(Integer, primary_key=True)
+    total_projects = Column(Integer, nullable=False, default=0)
+    featured_projects = Column(Integer, nullable=False, default=0)
+    total_blogs = Column(Integer, nullable=False, default=0)
+    published_blogs = Column(Integer, nullable=False, default=0)
+    draft_blogs = Column(Integer, nullable=False, default=0)
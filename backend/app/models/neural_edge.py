@@ -0,0 +1,17 @@
+"""Neural graph edge model."""
+from sqlalchemy import Column, Integer, String, Float, UniqueConstraint
+from app.core.database import Base
+
+class NeuralEdge(Base):
+    """Precomputed similarity edge between two scene nodes ("project-1", "blog-3")."""
+    __tablename__ = "neural_edges"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    source = Column(String(40), index=True, nullable=False)
+    target = Column(String(40), index=True, nullable=False)
+    kind = Column(String(20), nullable=False)
+    strength = Column(Float, nullable=False)
+    
+    __table_args__ = (
+        UniqueConstraint("source", "target", name="uq_neural_edges_source_target"),
+    )
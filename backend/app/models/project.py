@@ -1,5 +1,5 @@
 """Project model."""
-from sqlalchemy import Column, Integer, String, Text, Float, DateTime, Boolean
+from sqlalchemy import Column, Integer, String, Text, Float, DateTime, Boolean, Index
 from sqlalchemy.sql import func
 from app.core.database import Base
 import json
@@ -13,6 +13,10 @@ class Project(Base):
     description = Column(Text, nullable=False)
     content = Column(Text, nullable=True)
     tech_stack = Column(Text, nullable=False)
+    content_html = Column(Text, nullable=True)
+    toc = Column(Text, nullable=True)
+    word_count = Column(Integer, nullable=True)
+    reading_time = Column(Integer, nullable=True)
     github_url = Column(String, nullable=True)
     live_demo = Column(String, nullable=True)
     image_url = Column(String, nullable=True)
@@ -23,6 +27,28 @@ class Project(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     
+    __table_args__ = (
+        Index("ix_projects_listing_order", created_at, id),
+    )
+    
+    @classmethod
+    def listing_order(cls):
+        """Sort key for listings (newest first, ties broken by id)."""
+        return cls.created_at
+    
+    @classmethod
+    def node_columns(cls):
+        """Columns needed to render the project as a listing entry or scene node."""
+        return (
+            cls.id, cls.slug, cls.title, cls.description, cls.tech_stack,
+            cls.position_x, cls.position_y, cls.position_z
+        )
+    
+    @classmethod
+    def rendered_columns(cls):
+        """Columns holding the rendered body, only needed by the single-project view."""
+        return (cls.content_html, cls.toc, cls.word_count, cls.reading_time)
+    
     def get_tech_stack_list(self):
         """Convert tech_stack JSON string to list."""
         try:
@@ -0,0 +1,16 @@
+"""Related content model."""
+from sqlalchemy import Column, Integer, String, Float, PrimaryKeyConstraint
+from app.core.database import Base
+
+class RelatedContent(Base):
+    """One of a scene node's top-k most similar nodes by TF-IDF cosine ("blog-3" -> "project-1")."""
+    __tablename__ = "related_content"
+    
+    source = Column(String(40), nullable=False)
+    rank = Column(Integer, nullable=False)
+    target = Column(String(40), nullable=False)
+    score = Column(Float, nullable=False)
+    
+    __table_args__ = (
+        PrimaryKeyConstraint("source", "rank", name="pk_related_content"),
+    )
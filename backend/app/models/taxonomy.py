@@ -0,0 +1,45 @@
+"""Tag and tech stack index models."""
+from sqlalchemy import Column, Integer, String, ForeignKey, PrimaryKeyConstraint, Index
+from app.core.database import Base
+
+class BlogTag(Base):
+    """One tag of a blog, normalised to lowercase; mirrors Blog.tags for indexed filtering."""
+    __tablename__ = "blog_tags"
+    
+    blog_id = Column(Integer, ForeignKey("blogs.id", ondelete="CASCADE"), index=True, nullable=False)
+    tag = Column(String(100), nullable=False)
+    
+    # Leading with tag makes the key double as the filter index
+    __table_args__ = (
+        PrimaryKeyConstraint("tag", "blog_id", name="pk_blog_tags"),
+    )
+
+class ProjectTechnology(Base):
+    """One tech stack entry of a project, normalised to lowercase; mirrors Project.tech_stack."""
+    __tablename__ = "project_technologies"
+    
+    project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), index=True, nullable=False)
+    technology = Column(String(100), nullable=False)
+    
+    __table_args__ = (
+        PrimaryKeyConstraint("technology", "project_id", name="pk_project_technologies"),
+    )
+
+class FacetCount(Base):
+    """Number of blogs using a tag (facet "tag") or projects using a technology (facet "tech").
+
+    label keeps the spelling the value was first seen with, for display.
+    Rows are adjusted right after each content write is committed and
+    removed when their count drops to zero.
+    """
+    __tablename__ = "facet_counts"
+    
+    facet = Column(String(10), nullable=False)
+    value = Column(String(100), nullable=False)
+    label = Column(String(100), nullable=False)
+    count = Column(Integer, nullable=False)
+    
+    __table_args__ = (
+        PrimaryKeyConstraint("facet", "value", name="pk_facet_counts"),
+        Index("ix_facet_counts_facet_count", "facet", "count"),
+    )
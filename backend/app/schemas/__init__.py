@@ -1,14 +1,18 @@
 """Pydantic schemas."""
-from .project import ProjectResponse, ProjectCreateAdmin, ProjectUpdateAdmin, ProjectResponseAdmin
-from .blog import BlogResponse, BlogCreateAdmin, BlogUpdateAdmin, BlogResponseAdmin
+from .project import ProjectResponse, ProjectDetailResponse, ProjectNode, ProjectCreateAdmin, ProjectUpdateAdmin, ProjectResponseAdmin
+from .blog import BlogResponse, BlogDetailResponse, BlogNode, BlogCreateAdmin, BlogUpdateAdmin, BlogResponseAdmin
 from .auth import LoginRequest, LoginResponse
 from .static_page import StaticPageResponse, StaticPageUpdate
-from .dashboard import DashboardStats, NeuralDataResponse
+from .dashboard import DashboardStats, NeuralEdgeResponse, NeuralDataResponse, NeuralChangesResponse, NearestNode, LodCluster, LodEdge, NeuralLodResponse, SearchResult, FacetValue, FacetsResponse, RelatedItem, BulkImportError, BulkImportResult
+from .layout import LayoutRequest, LayoutJobStatus
+from .content import TocEntry, MarkdownPreviewRequest, MarkdownPreviewResponse
 
 __all__ = [
-    "ProjectResponse", "ProjectCreateAdmin", "ProjectUpdateAdmin", "ProjectResponseAdmin",
-    "BlogResponse", "BlogCreateAdmin", "BlogUpdateAdmin", "BlogResponseAdmin",
+    "ProjectResponse", "ProjectDetailResponse", "ProjectNode", "ProjectCreateAdmin", "ProjectUpdateAdmin", "ProjectResponseAdmin",
+    "BlogResponse", "BlogDetailResponse", "BlogNode", "BlogCreateAdmin", "BlogUpdateAdmin", "BlogResponseAdmin",
     "LoginRequest", "LoginResponse",
     "StaticPageResponse", "StaticPageUpdate",
-    "DashboardStats", "NeuralDataResponse"
+    "DashboardStats", "NeuralEdgeResponse", "NeuralDataResponse", "NeuralChangesResponse", "NearestNode", "LodCluster", "LodEdge", "NeuralLodResponse", "SearchResult", "FacetValue", "FacetsResponse", "RelatedItem", "BulkImportError", "BulkImportResult",
+    "LayoutRequest", "LayoutJobStatus",
+    "TocEntry", "MarkdownPreviewRequest", "MarkdownPreviewResponse"
 ]
@@ -1,8 +1,9 @@
 """Blog schemas."""
 from pydantic import BaseModel, validator
-from typing import List, Optional
+from typing import List, Literal, Optional
 from datetime import datetime
 import json
+from .content import TocEntry
 
 class BlogBase(BaseModel):
     title: str
@@ -20,15 +21,61 @@ class BlogResponse(BlogBase):
     class Config:
         from_attributes = True
 
+class BlogDetailResponse(BlogResponse):
+    """Single-blog view; adds the server-rendered body, which listings leave out."""
+    content_html: Optional[str] = None
+    toc: List[TocEntry] = []
+    word_count: Optional[int] = None
+    reading_time: Optional[int] = None
+    
+    @validator('toc', pre=True)
+    def parse_toc(cls, v):
+        if isinstance(v, str):
+            try:
+                return json.loads(v)
+            except json.JSONDecodeError:
+                return []
+        return v if v is not None else []
+
+class BlogNode(BaseModel):
+    """Slim projection used for listings and 3D scene nodes (no markdown body)."""
+    id: int
+    slug: str
+    title: str
+    summary: Optional[str] = None
+    tags: List[str] = []
+    position_x: float
+    position_y: float
+    position_z: float
+    
+    class Config:
+        from_attributes = True
+    
+    @validator('tags', pre=True)
+    def parse_tags(cls, v):
+        if isinstance(v, str):
+            try:
+                return json.loads(v)
+            except json.JSONDecodeError:
+                return []
+        return v if v is not None else []
+
 class BlogCreateAdmin(BlogBase):
     published: bool = False
     author: Optional[str] = "Satyam"
     tags: Optional[List[str]] = None
     image_url: Optional[str] = None
     published_at: Optional[datetime] = None
-    position_x: float
-    position_y: float
-    position_z: float
+    position_x: Optional[float] = None
+    position_y: Optional[float] = None
+    position_z: Optional[float] = None
+    position_mode: Literal["manual", "auto"] = "manual"
+    
+    @validator('position_mode', always=True)
+    def require_manual_position(cls, v, values):
+        if v == "manual" and any(values.get(axis) is None for axis in ("position_x", "position_y", "position_z")):
+            raise ValueError("position_x, position_y and position_z are required unless position_mode is 'auto'")
+        return v
 
 class BlogUpdateAdmin(BaseModel):
     title: Optional[str] = None
@@ -43,6 +90,7 @@ class BlogUpdateAdmin(BaseModel):
     position_x: Optional[float] = None
     position_y: Optional[float] = None
     position_z: Optional[float] = None
+    position_mode: Optional[Literal["manual", "auto"]] = None
 
 class BlogResponseAdmin(BlogResponse):
     published: bool = True
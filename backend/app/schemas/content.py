@@ -0,0 +1,19 @@
+"""Rendered markdown schemas."""
+from pydantic import BaseModel, Field
+from typing import List
+
+class TocEntry(BaseModel):
+    level: int
+    text: str
+    id: str
+
+class MarkdownPreviewRequest(BaseModel):
+    content: str = Field(..., max_length=500_000)
+
+class MarkdownPreviewResponse(BaseModel):
+    html: str
+    toc: List[TocEntry]
+    word_count: int
+    reading_time: int
+    blocks: int
+    rendered_blocks: int
@@ -1,8 +1,8 @@
 """Dashboard and combined data schemas."""
 from pydantic import BaseModel
-from typing import List
-from .project import ProjectResponse
-from .blog import BlogResponse
+from typing import Dict, List, Optional
+from .project import ProjectNode
+from .blog import BlogNode
 
 class DashboardStats(BaseModel):
     total_projects: int
@@ -11,6 +11,96 @@ class DashboardStats(BaseModel):
     draft_blogs: int
     featured_projects: int
 
+class BulkImportError(BaseModel):
+    line: int
+    detail: str
+
+class BulkImportResult(BaseModel):
+    created: int
+    updated: int
+    skipped: int
+    error_count: int
+    errors: List[BulkImportError]
+
+class NeuralEdgeResponse(BaseModel):
+    source: str
+    target: str
+    kind: str
+    strength: float
+    
+    class Config:
+        from_attributes = True
+
 class NeuralDataResponse(BaseModel):
-    projects: List[ProjectResponse]
-    blogs: List[BlogResponse]
+    projects: List[ProjectNode]
+    blogs: List[BlogNode]
+    edges: List[NeuralEdgeResponse] = []
+    adjacency: Dict[str, List[str]] = {}
+
+class NeuralChangesResponse(BaseModel):
+    """Delta since a sync version, or the full scene when full is true."""
+    version: int
+    full: bool
+    projects: List[ProjectNode]
+    blogs: List[BlogNode]
+    deleted: List[str] = []
+    changed: List[str] = []
+    edges: List[NeuralEdgeResponse] = []
+    adjacency: Dict[str, List[str]] = {}
+
+class NearestNode(BaseModel):
+    node: str
+    type: str
+    id: int
+    slug: str
+    title: str
+    distance: float
+
+class LodCluster(BaseModel):
+    id: str
+    position_x: float
+    position_y: float
+    position_z: float
+    count: int
+    projects: int
+    blogs: int
+    representative: str
+    label: str
+    parent: Optional[str] = None
+
+class LodEdge(BaseModel):
+    source: str
+    target: str
+    strength: float
+    count: int
+
+class NeuralLodResponse(BaseModel):
+    level: int
+    levels: int
+    clusters: List[LodCluster]
+    edges: List[LodEdge]
+
+class SearchResult(BaseModel):
+    type: str
+    id: int
+    slug: str
+    title: str
+    snippet: str
+    score: float
+
+class FacetValue(BaseModel):
+    value: str
+    label: str
+    count: int
+
+class FacetsResponse(BaseModel):
+    tag: List[FacetValue]
+    tech: List[FacetValue]
+
+class RelatedItem(BaseModel):
+    type: str
+    id: int
+    slug: str
+    title: str
+    summary: Optional[str] = None
+    score: float
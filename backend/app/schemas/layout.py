@@ -0,0 +1,18 @@
+"""Layout job schemas."""
+from pydantic import BaseModel, Field
+from typing import Optional
+from datetime import datetime
+
+class LayoutRequest(BaseModel):
+    iterations: int = Field(200, ge=1, le=2000)
+    theta: float = Field(0.8, ge=0.0, le=2.0)
+    seed: int = 42
+    warm_start: bool = True
+
+class LayoutJobStatus(BaseModel):
+    status: str
+    params: Optional[dict] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    result: Optional[dict] = None
+    error: Optional[str] = None
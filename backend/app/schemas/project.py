@@ -1,8 +1,9 @@
 """Project schemas."""
 from pydantic import BaseModel, validator
-from typing import List, Optional
+from typing import List, Literal, Optional
 from datetime import datetime
 import json
+from .content import TocEntry
 
 class ProjectBase(BaseModel):
     title: str
@@ -32,12 +33,58 @@ class ProjectResponse(ProjectBase):
                 return []
         return v if v is not None else []
 
-class ProjectCreateAdmin(ProjectBase):
-    content: Optional[str] = None
-    featured: bool = False
+class ProjectDetailResponse(ProjectResponse):
+    """Single-project view; adds the server-rendered body, which listings leave out."""
+    content_html: Optional[str] = None
+    toc: List[TocEntry] = []
+    word_count: Optional[int] = None
+    reading_time: Optional[int] = None
+    
+    @validator('toc', pre=True)
+    def parse_toc(cls, v):
+        if isinstance(v, str):
+            try:
+                return json.loads(v)
+            except json.JSONDecodeError:
+                return []
+        return v if v is not None else []
+
+class ProjectNode(BaseModel):
+    """Slim projection used for listings and 3D scene nodes (no markdown body)."""
+    id: int
+    slug: str
+    title: str
+    description: str
+    tech_stack: List[str]
     position_x: float
     position_y: float
     position_z: float
+    
+    class Config:
+        from_attributes = True
+    
+    @validator('tech_stack', pre=True)
+    def parse_tech_stack(cls, v):
+        if isinstance(v, str):
+            try:
+                return json.loads(v)
+            except json.JSONDecodeError:
+                return []
+        return v if v is not None else []
+
+class ProjectCreateAdmin(ProjectBase):
+    content: Optional[str] = None
+    featured: bool = False
+    position_x: Optional[float] = None
+    position_y: Optional[float] = None
+    position_z: Optional[float] = None
+    position_mode: Literal["manual", "auto"] = "manual"
+    
+    @validator('position_mode', always=True)
+    def require_manual_position(cls, v, values):
+        if v == "manual" and any(values.get(axis) is None for axis in ("position_x", "position_y", "position_z")):
+            raise ValueError("position_x, position_y and position_z are required unless position_mode is 'auto'")
+        return v
 
 class ProjectUpdateAdmin(BaseModel):
     title: Optional[str] = None
@@ -52,6 +99,7 @@ class ProjectUpdateAdmin(BaseModel):
     position_x: Optional[float] = None
     position_y: Optional[float] = None
     position_z: Optional[float] = None
+    position_mode: Optional[Literal["manual", "auto"]] = None
 
 class ProjectResponseAdmin(ProjectResponse):
     content: Optional[str] = None
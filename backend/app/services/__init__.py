@@ -0,0 +1 @@
+"""Services that maintain content derived from projects and blogs."""
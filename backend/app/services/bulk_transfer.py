@@ -0,0 +1,229 @@
+"""Streaming NDJSON import and export of projects and blogs.
+
+Import reads the request body line by line and works in chunks of
+BULK_CHUNK_SIZE lines: each line is validated with the admin create schema
+and rendered in a worker thread, the chunk's slugs are resolved in one
+query, and the rows are written with one executemany INSERT (plus one
+UPDATE by primary key for replaced slugs) and committed. Tables derived
+from content are rebuilt once at the end instead of once per row.
+
+Export streams rows with yield_per, so memory stays flat at any table size.
+Each exported line is a valid create payload, so an export can be imported
+as is.
+"""
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+import asyncio
+import logging
+import orjson
+from pydantic import ValidationError
+from sqlalchemy import insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.cache import bump_content_version
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, SessionLocal
+from app.core.events import content_events
+from app.schemas import ProjectCreateAdmin, BlogCreateAdmin
+from .change_log import MODELS, record_reset
+from .counters import rebuild_counters
+from .neural_edges import rebuild_edges
+from .placement import blog_document, placement_index, project_document
+from .related import rebuild_related
+from .rendering import apply_rendered, render_markdown
+from .taxonomy import rebuild_terms
+
+logger = logging.getLogger(__name__)
+
+SCHEMAS = {"project": ProjectCreateAdmin, "blog": BlogCreateAdmin}
+LIST_FIELDS = {"project": "tech_stack", "blog": "tags"}
+RENDERED_COLUMNS = ("content_html", "toc", "word_count", "reading_time")
+
+# Errors reported back per import; later ones are only counted
+MAX_REPORTED_ERRORS = 100
+
+def export_columns(kind: str) -> List[str]:
+    """Fields of an exported line: the admin create payload without position_mode."""
+    return [name for name in SCHEMAS[kind].model_fields if name != "position_mode"]
+
+@dataclass
+class ImportResult:
+    created: int = 0
+    updated: int = 0
+    skipped: int = 0
+    error_count: int = 0
+    errors: List[dict] = field(default_factory=list)
+
+    def add_error(self, line: int, detail: str) -> None:
+        self.error_count += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"line": line, "detail": detail})
+
+async def read_lines(chunks: AsyncIterator[bytes], max_line_bytes: int) -> AsyncIterator[Tuple[int, Optional[bytes]]]:
+    """Split a byte stream into numbered lines; a line longer than max_line_bytes is yielded as None."""
+    buffer = bytearray()
+    number = 0
+    overflow = False
+    async for chunk in chunks:
+        buffer += chunk
+        start = 0
+        while (end := buffer.find(b"\n", start)) >= 0:
+            number += 1
+            line = bytes(buffer[start:end])
+            yield number, None if overflow or len(line) > max_line_bytes else line
+            overflow = False
+            start = end + 1
+        del buffer[:start]
+        if len(buffer) > max_line_bytes:
+            # Drop the rest of an oversized line instead of buffering it
+            overflow = True
+            buffer.clear()
+    if buffer or overflow:
+        yield number + 1, None if overflow or len(buffer) > max_line_bytes else bytes(buffer)
+
+def _describe(error: ValidationError) -> str:
+    first = error.errors()[0]
+    location = ".".join(str(part) for part in first["loc"])
+    return f"{location}: {first['msg']}" if location else first["msg"]
+
+def prepare_rows(kind: str, lines: List[Tuple[int, Optional[bytes]]], result: ImportResult) -> List[Tuple[int, dict]]:
+    """Validate, place and render one chunk of lines into insertable rows (blocking; run in a thread)."""
+    schema, model, list_field = SCHEMAS[kind], MODELS[kind], LIST_FIELDS[kind]
+    columns = export_columns(kind) + list(RENDERED_COLUMNS)
+    placement = None
+    rows = []
+    for number, line in lines:
+        if line is None:
+            result.add_error(number, f"Line is longer than {settings.BULK_MAX_LINE_BYTES} bytes")
+            continue
+        try:
+            item = schema.model_validate_json(line)
+        except ValidationError as e:
+            result.add_error(number, _describe(e))
+            continue
+
+        node = model(**item.model_dump(exclude={"position_mode", list_field}))
+        if kind == "project":
+            node.set_tech_stack_list(item.tech_stack)
+        else:
+            node.set_tags_list(item.tags)
+        if item.position_mode == "auto":
+            placement = placement or placement_index.ensure_fitted()
+            document = project_document(node) if kind == "project" else blog_document(node)
+            node.position_x, node.position_y, node.position_z = placement.place(document)
+        apply_rendered(node, render_markdown(node.content or ""))
+        rows.append((number, {column: getattr(node, column) for column in columns}))
+    return rows
+
+async def write_rows(db: AsyncSession, kind: str, rows: List[Tuple[int, dict]], replace: bool, result: ImportResult) -> None:
+    """Insert one chunk of rows and commit, resolving slug conflicts with a single lookup.
+
+    An existing slug is skipped, or with replace overwritten in place. A slug
+    repeated within the chunk is handled the same way against its first line,
+    and a replaced line that was not in the table yet still counts as created.
+    """
+    model = MODELS[kind]
+    existing = dict((await db.execute(
+        select(model.slug, model.id).where(model.slug.in_({row["slug"] for _, row in rows}))
+    )).all())
+
+    inserts: Dict[str, dict] = {}
+    updates: Dict[str, dict] = {}
+    for _, row in rows:
+        slug = row["slug"]
+        if slug not in existing and slug not in inserts:
+            inserts[slug] = row
+        elif not replace:
+            result.skipped += 1
+        elif slug in inserts:
+            inserts[slug] = row
+        else:
+            updates[slug] = dict(row, id=existing[slug])
+
+    if inserts:
+        await db.execute(insert(model), list(inserts.values()))
+    if updates:
+        await db.execute(update(model), list(updates.values()))
+    await db.commit()
+    result.created += len(inserts)
+    result.updated += len(updates)
+
+def refresh_derived() -> None:
+    """Rebuild every table derived from projects and blogs after a bulk import."""
+    db = SessionLocal()
+    try:
+        rebuild_terms(db)
+        rebuild_edges(db)
+        rebuild_counters(db)
+        record_reset(db)
+        db.flush()
+        rebuild_related(db)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+async def import_ndjson(db: AsyncSession, kind: str, chunks: AsyncIterator[bytes], replace: bool = False) -> ImportResult:
+    """Import projects or blogs from an NDJSON byte stream, committing every BULK_CHUNK_SIZE lines.
+
+    Chunks committed before a failure stay imported; derived tables are
+    rebuilt and a scene reset is published whenever anything was written.
+    A failure while doing so after a failed import is logged, and the
+    import's own error is raised.
+    """
+    result = ImportResult()
+    batch: List[Tuple[int, Optional[bytes]]] = []
+
+    async def flush_batch():
+        rows = await asyncio.to_thread(prepare_rows, kind, batch, result)
+        if rows:
+            await write_rows(db, kind, rows, replace, result)
+        batch.clear()
+
+    async def publish_import():
+        if result.created or result.updated:
+            await asyncio.to_thread(refresh_derived)
+            version = bump_content_version()
+            content_events.publish("content", {"type": "scene", "action": "reset", "version": version})
+
+    try:
+        async for number, line in read_lines(chunks, settings.BULK_MAX_LINE_BYTES):
+            if line is not None and not line.strip():
+                continue
+            batch.append((number, line))
+            if len(batch) >= settings.BULK_CHUNK_SIZE:
+                await flush_batch()
+        if batch:
+            await flush_batch()
+    except BaseException:
+        try:
+            await publish_import()
+        except Exception as e:
+            logger.error(f"Error refreshing derived tables after a failed {kind} import: {e}")
+        raise
+    await publish_import()
+    return result
+
+async def export_ndjson(kind: str) -> AsyncIterator[bytes]:
+    """Stream every project or blog as one JSON object per line, in id order.
+
+    Opens its own session because the response body is sent after the
+    request's dependencies have been closed.
+    """
+    model, list_field = MODELS[kind], LIST_FIELDS[kind]
+    columns = export_columns(kind)
+    async with AsyncSessionLocal() as db:
+        stream = await db.stream(
+            select(*(getattr(model, column) for column in columns))
+            .order_by(model.id)
+            .execution_options(yield_per=settings.BULK_CHUNK_SIZE)
+        )
+        async for partition in stream.partitions():
+            lines = bytearray()
+            for row in partition:
+                item = dict(zip(columns, row))
+                item[list_field] = orjson.loads(item[list_field] or "[]")
+                lines += orjson.dumps(item)
+                lines += b"\n"
+            yield bytes(lines)
@@ -0,0 +1,83 @@
+"""Change log behind incremental neural-data sync."""
+from typing import Dict, List, Optional
+from sqlalchemy import func, or_
+from sqlalchemy.orm import Session, load_only
+from app.models import Project, Blog, NeuralEdge, ContentChange
+from .neural_edges import node_key
+
+MODELS = {"project": Project, "blog": Blog}
+RESET = "*"
+
+def record_change(db: Session, kind: str, node_id: int) -> int:
+    """Log an upsert, or a tombstone if the row is gone, for one project or blog; returns its version."""
+    exists = db.get(MODELS[kind], node_id) is not None
+    change = ContentChange(node=node_key(kind, node_id), op="upsert" if exists else "delete")
+    db.add(change)
+    db.flush()
+    return change.id
+
+def record_reset(db: Session) -> None:
+    """Log that any node may have changed, forcing clients back to a full snapshot."""
+    db.add(ContentChange(node=RESET, op="reset"))
+
+def current_version(db: Session) -> int:
+    """Latest change id, or 0 before the first logged change."""
+    return db.query(func.max(ContentChange.id)).scalar() or 0
+
+def changed_nodes(db: Session, since: int, until: int) -> Optional[List[str]]:
+    """Nodes logged after version since and before version until, or None if the log cannot tell.
+
+    None means a reset was logged in between or the entries were compacted away.
+    """
+    oldest = db.query(func.min(ContentChange.id)).scalar()
+    if since < (oldest or 1) - 1:
+        return None
+    nodes: Dict[str, None] = {}
+    for node, op in db.query(ContentChange.node, ContentChange.op).filter(
+        ContentChange.id > since, ContentChange.id < until
+    ).order_by(ContentChange.id):
+        if op == "reset":
+            return None
+        nodes[node] = None
+    return list(nodes)
+
+def load_changes(db: Session, since: int) -> Optional[dict]:
+    """Nodes upserted or deleted after version since, with the current edges touching them.
+
+    Returns None when a delta cannot be served: since is 0 or ahead of the
+    log, the entries after it were compacted away, or a reset was logged.
+    """
+    version, oldest = db.query(func.max(ContentChange.id), func.min(ContentChange.id)).one()
+    version = version or 0
+    if since <= 0 or since > version or since < (oldest or 1) - 1:
+        return None
+
+    latest: Dict[str, str] = {}
+    for node, op in db.query(ContentChange.node, ContentChange.op).filter(ContentChange.id > since).order_by(ContentChange.id):
+        if op == "reset":
+            return None
+        latest[node] = op
+
+    upserted = {"project": [], "blog": []}
+    for node, op in latest.items():
+        kind, _, node_id = node.partition("-")
+        if op == "upsert" and kind in upserted:
+            upserted[kind].append(int(node_id))
+
+    projects = db.query(Project).options(load_only(*Project.node_columns())).filter(Project.id.in_(upserted["project"])).all()
+    blogs = db.query(Blog).options(load_only(*Blog.node_columns())).filter(Blog.id.in_(upserted["blog"])).all()
+    found = {node_key("project", p.id) for p in projects} | {node_key("blog", b.id) for b in blogs}
+    changed = sorted(latest)
+    edges = db.query(NeuralEdge).filter(
+        or_(NeuralEdge.source.in_(changed), NeuralEdge.target.in_(changed))
+    ).order_by(NeuralEdge.strength.desc(), NeuralEdge.id).all() if changed else []
+
+    return {
+        "version": version,
+        "full": False,
+        "projects": projects,
+        "blogs": blogs,
+        "deleted": [node for node in changed if node not in found],
+        "changed": changed,
+        "edges": edges
+    }
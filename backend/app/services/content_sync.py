@@ -0,0 +1,52 @@
+"""Keeps derived tables in step with project/blog writes."""
+from typing import Dict, Optional
+import asyncio
+import logging
+from sqlalchemy.orm import Session
+from app.core.database import SessionLocal
+from .change_log import MODELS, record_change
+from .counters import adjust_counters, node_counts
+from .neural_edges import sync_node_edges
+from .related import sync_related
+from .taxonomy import sync_node_terms
+
+logger = logging.getLogger(__name__)
+
+def sync_content_change(db: Session, kind: str, node_id: int, previous: Optional[Dict[str, int]] = None) -> int:
+    """Refresh derived data for one project or blog within the caller's transaction.
+
+    previous is node_counts of the row as it was before an update or delete.
+    Returns the change's sync version.
+    """
+    node = db.get(MODELS[kind], node_id)
+    adjust_counters(db, previous, node_counts(node) if node is not None else None)
+    sync_node_edges(db, kind, node_id)
+    sync_node_terms(db, kind, node_id)
+    version = record_change(db, kind, node_id)
+    sync_related(db, kind, node_id, version)
+    return version
+
+def _apply_content_change(kind: str, node_id: int, previous: Optional[Dict[str, int]]) -> int:
+    db = SessionLocal()
+    try:
+        version = sync_content_change(db, kind, node_id, previous)
+        db.commit()
+        return version
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+async def apply_content_change(kind: str, node_id: int, previous: Optional[Dict[str, int]] = None) -> Optional[int]:
+    """Refresh derived data for a committed project or blog write in a worker thread.
+
+    Runs in its own session and transaction, so the edge, term and related
+    content work never blocks the event loop. A failure is logged and
+    returns None; the write itself is already committed.
+    """
+    try:
+        return await asyncio.to_thread(_apply_content_change, kind, node_id, previous)
+    except Exception as e:
+        logger.error(f"Error refreshing derived data for {kind} {node_id}: {e}")
+        return None
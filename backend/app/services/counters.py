@@ -0,0 +1,85 @@
+"""Dashboard totals kept in a single content_counters row.
+
+Admin writes pass the node's counts from before the change to
+sync_content_change, which adds the difference to the row right after the
+write is committed, so the dashboard reads one row instead of counting both
+tables. count_content is the fallback when the row does not exist yet.
+"""
+from typing import Dict, Optional
+import logging
+from sqlalchemy import case, func, insert, select, true, update
+from sqlalchemy.orm import Session
+from app.core.database import SessionLocal
+from app.models import Project, Blog, ContentCounter
+
+logger = logging.getLogger(__name__)
+
+COUNTER_ID = 1
+COUNTERS = ("total_projects", "featured_projects", "total_blogs", "published_blogs", "draft_blogs")
+
+def node_counts(node) -> Dict[str, int]:
+    """What one project or blog contributes to each counter."""
+    if isinstance(node, Project):
+        return {"total_projects": 1, "featured_projects": int(bool(node.featured))}
+    return {"total_blogs": 1, "published_blogs": int(bool(node.published)), "draft_blogs": int(not node.published)}
+
+def adjust_counters(db: Session, previous: Optional[Dict[str, int]], current: Optional[Dict[str, int]]) -> None:
+    """Add the difference between a node's old and new counts to the counters row.
+
+    previous is None for a created node and current is None for a deleted one.
+    Does nothing while the row does not exist.
+    """
+    previous, current = previous or {}, current or {}
+    deltas = {name: current.get(name, 0) - previous.get(name, 0) for name in COUNTERS}
+    values = {name: getattr(ContentCounter, name) + delta for name, delta in deltas.items() if delta}
+    if values:
+        db.execute(update(ContentCounter).where(ContentCounter.id == COUNTER_ID).values(**values))
+
+def count_content(db: Session) -> Dict[str, int]:
+    """All counters in one aggregate query over both tables."""
+    projects = select(
+        func.count().label("total"),
+        func.coalesce(func.sum(case((Project.featured == True, 1), else_=0)), 0).label("featured")
+    ).select_from(Project).subquery()
+    blogs = select(
+        func.count().label("total"),
+        func.coalesce(func.sum(case((Blog.published == True, 1), else_=0)), 0).label("published"),
+        func.coalesce(func.sum(case((Blog.published == False, 1), else_=0)), 0).label("draft")
+    ).select_from(Blog).subquery()
+    row = db.execute(
+        select(projects.c.total, projects.c.featured, blogs.c.total, blogs.c.published, blogs.c.draft)
+        .select_from(projects.join(blogs, true()))
+    ).one()
+    return dict(zip(COUNTERS, row))
+
+def _stored_counters(db: Session) -> Optional[Dict[str, int]]:
+    row = db.execute(
+        select(*(getattr(ContentCounter, name) for name in COUNTERS)).where(ContentCounter.id == COUNTER_ID)
+    ).first()
+    return dict(zip(COUNTERS, row)) if row is not None else None
+
+def load_counters(db: Session) -> Dict[str, int]:
+    """Dashboard totals from the counters row, or counted when it is missing."""
+    stored = _stored_counters(db)
+    return stored if stored is not None else count_content(db)
+
+def rebuild_counters(db: Session) -> Dict[str, int]:
+    """Recount both tables and store the result in the counters row."""
+    counts = count_content(db)
+    if _stored_counters(db) is None:
+        db.execute(insert(ContentCounter).values(id=COUNTER_ID, **counts))
+    else:
+        db.execute(update(ContentCounter).where(ContentCounter.id == COUNTER_ID).values(**counts))
+    return counts
+
+def backfill_counters() -> None:
+    """Create the counters row on startup when it does not exist."""
+    db = SessionLocal()
+    try:
+        if _stored_counters(db) is not None:
+            return
+        counts = rebuild_counters(db)
+        db.commit()
+        logger.info(f"Initialized content counters: {counts}")
+    finally:
+        db.close()
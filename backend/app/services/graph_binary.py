@@ -0,0 +1,90 @@
+"""Packed binary encoding of the neural-data payload.
+
+Layout (little-endian, every numeric section 4-byte aligned so clients can
+view it as a typed array without copying):
+
+    header      magic b"NSG1", uint32 version, projects, blogs, edges, string table bytes
+    positions   float32[nodes * 3]   x, y, z per node; projects first, then blogs
+    ids         uint32[nodes]        database id per node
+    endpoints   uint32[edges * 2]    source, target node indices
+    strengths   float32[edges]
+    kinds       uint8[edges]         index into the string table's "kinds", zero-padded to 4 bytes
+    strings     UTF-8 JSON           {"slugs": [...], "titles": [...], "kinds": [...]}
+
+Adjacency is not sent; it follows from the edge endpoints.
+"""
+from typing import Dict, List
+import struct
+import orjson
+import numpy as np
+from .neural_edges import node_key
+
+MEDIA_TYPE = "application/vnd.neural-space.graph"
+MAGIC = b"NSG1"
+VERSION = 1
+HEADER = struct.Struct("<4s5I")
+
+def _pad(size: int) -> int:
+    return -size % 4
+
+def encode_neural_graph(payload: dict) -> bytes:
+    """Encode a JSON-ready neural-data payload into the packed layout."""
+    nodes = payload["projects"] + payload["blogs"]
+    index = {node_key("project", node["id"]): i for i, node in enumerate(payload["projects"])}
+    offset = len(payload["projects"])
+    index.update({node_key("blog", node["id"]): offset + i for i, node in enumerate(payload["blogs"])})
+
+    edges = [edge for edge in payload["edges"] if edge["source"] in index and edge["target"] in index]
+    kinds: List[str] = sorted({edge["kind"] for edge in edges})
+    kind_index: Dict[str, int] = {kind: i for i, kind in enumerate(kinds)}
+
+    positions = np.array(
+        [[node["position_x"], node["position_y"], node["position_z"]] for node in nodes], dtype="<f4"
+    ).reshape(-1, 3)
+    ids = np.array([node["id"] for node in nodes], dtype="<u4")
+    endpoints = np.array([[index[edge["source"]], index[edge["target"]]] for edge in edges], dtype="<u4").reshape(-1, 2)
+    strengths = np.array([edge["strength"] for edge in edges], dtype="<f4")
+    edge_kinds = np.array([kind_index[edge["kind"]] for edge in edges], dtype="u1")
+    strings = orjson.dumps({
+        "slugs": [node["slug"] for node in nodes],
+        "titles": [node["title"] for node in nodes],
+        "kinds": kinds
+    })
+
+    return b"".join([
+        HEADER.pack(MAGIC, VERSION, len(payload["projects"]), len(payload["blogs"]), len(edges), len(strings)),
+        positions.tobytes(),
+        ids.tobytes(),
+        endpoints.tobytes(),
+        strengths.tobytes(),
+        edge_kinds.tobytes(),
+        b"\0" * _pad(len(edges)),
+        strings
+    ])
+
+def decode_neural_graph(body: bytes) -> dict:
+    """Decode the packed layout into NumPy arrays and the string table."""
+    magic, version, projects, blogs, edges, strings_length = HEADER.unpack_from(body)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("Not a neural graph v1 payload")
+    nodes = projects + blogs
+    offset = HEADER.size
+
+    def take(dtype: str, count: int) -> np.ndarray:
+        nonlocal offset
+        array = np.frombuffer(body, dtype=dtype, count=count, offset=offset)
+        offset += array.nbytes
+        return array
+
+    graph = {
+        "projects": projects,
+        "blogs": blogs,
+        "positions": take("<f4", nodes * 3).reshape(-1, 3),
+        "ids": take("<u4", nodes),
+        "endpoints": take("<u4", edges * 2).reshape(-1, 2),
+        "strengths": take("<f4", edges),
+        "kinds": take("u1", edges)
+    }
+    offset += _pad(edges)
+    graph["strings"] = orjson.loads(body[offset:offset + strings_length])
+    return graph
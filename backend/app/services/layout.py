@@ -0,0 +1,288 @@
+"""Barnes-Hut force-directed layout for the neural scene.
+
+Repulsion between all nodes is approximated with an octree: a cell whose
+size/distance ratio is below theta acts as a single mass at its centre of
+mass. The tree is built and traversed level by level with NumPy, so each
+iteration costs O(n log n) array work instead of the O(n^2) pairwise loop
+the frontend used to run on every page load.
+"""
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional, Tuple
+import asyncio
+import logging
+import math
+import time
+import numpy as np
+from sqlalchemy import update
+from app.core.cache import bump_content_version
+from app.core.events import content_events
+from app.core.database import SessionLocal
+from app.models import Project, Blog, NeuralEdge
+from .change_log import record_reset
+
+logger = logging.getLogger(__name__)
+
+# Same box the frontend scene uses (DEFAULT_CONFIG.bounds in neuralPositioning.ts)
+SCENE_BOUNDS = np.array([[-12.0, 12.0], [-8.0, 8.0], [-10.0, 10.0]])
+
+# Node count the default repulsion is tuned for
+REFERENCE_NODES = 30
+
+@dataclass(frozen=True)
+class LayoutParams:
+    """Tunables for a layout run; the same params and input always give the same output."""
+    iterations: int = 200
+    theta: float = 0.8
+    repulsion: float = 1.5
+    attraction: float = 0.05
+    gravity: float = 0.05
+    max_step: float = 1.0
+    warm_step: float = 0.05
+    cooling: float = 0.98
+    softening: float = 0.05
+    seed: int = 42
+    warm_start: bool = True
+    max_depth: int = 10
+
+@dataclass
+class _Level:
+    size: float
+    node_cell: np.ndarray
+    mass: np.ndarray
+    com: np.ndarray
+    children: Optional[np.ndarray] = None
+    child_start: Optional[np.ndarray] = None
+    child_count: Optional[np.ndarray] = None
+
+class Octree:
+    """Octree stored as one array of cell aggregates per depth.
+
+    Cells are found by binning points into a 2^d grid at each depth d, so
+    building the tree is a handful of sorts and bincounts rather than
+    per-point insertion.
+    """
+
+    def __init__(self, positions: np.ndarray, max_depth: int = 10):
+        n = len(positions)
+        lo = positions.min(axis=0)
+        span = max(float((positions.max(axis=0) - lo).max()), 1e-9) * (1 + 1e-9)
+        scaled = (positions - lo) / span
+        depth = min(max_depth, max(1, math.ceil(math.log(max(n, 2), 8)) + 2))
+
+        self.levels: List[_Level] = []
+        for d in range(depth + 1):
+            resolution = 1 << d
+            coords = np.minimum((scaled * resolution).astype(np.int64), resolution - 1)
+            keys = (coords[:, 0] * resolution + coords[:, 1]) * resolution + coords[:, 2]
+            _, first, node_cell = np.unique(keys, return_index=True, return_inverse=True)
+            cells = len(first)
+            mass = np.bincount(node_cell, minlength=cells).astype(np.float64)
+            com = np.stack(
+                [np.bincount(node_cell, weights=positions[:, k], minlength=cells) for k in range(3)], axis=1
+            ) / mass[:, None]
+            level = _Level(size=span / resolution, node_cell=node_cell, mass=mass, com=com)
+
+            if self.levels:
+                parent = self.levels[-1]
+                parent_of_cell = parent.node_cell[first]
+                parent.children = np.argsort(parent_of_cell, kind="stable")
+                parent.child_count = np.bincount(parent_of_cell, minlength=len(parent.mass))
+                parent.child_start = np.concatenate(([0], np.cumsum(parent.child_count)[:-1]))
+            self.levels.append(level)
+
+def _accumulate(force: np.ndarray, nodes: np.ndarray, values: np.ndarray) -> None:
+    for k in range(3):
+        force[:, k] += np.bincount(nodes, weights=values[:, k], minlength=len(force))
+
+def repulsive_forces(positions: np.ndarray, theta: float, strength: float, softening: float, max_depth: int = 10) -> np.ndarray:
+    """Approximate inverse-square repulsion on every node using Barnes-Hut."""
+    n = len(positions)
+    force = np.zeros_like(positions)
+    if n < 2:
+        return force
+
+    tree = Octree(positions, max_depth)
+    nodes = np.arange(n)
+    cells = np.zeros(n, dtype=np.int64)
+
+    for depth, level in enumerate(tree.levels):
+        if nodes.size == 0:
+            break
+        leaf = depth == len(tree.levels) - 1
+        mass = level.mass[cells]
+        com = level.com[cells]
+        own = level.node_cell[nodes] == cells
+
+        if leaf:
+            # Deepest cells are treated as point masses, minus the node itself
+            shared = own & (mass > 1)
+            com[shared] = (com[shared] * mass[shared, None] - positions[nodes[shared]]) / (mass[shared, None] - 1)
+            mass = np.where(own, mass - 1, mass)
+            accept = mass > 0
+        diff = positions[nodes] - com
+        dist2 = np.einsum("ij,ij->i", diff, diff)
+        if not leaf:
+            accept = ~own & ((mass == 1) | (level.size * level.size < theta * theta * dist2))
+
+        softened = dist2[accept] + softening
+        weight = strength * mass[accept] / (softened * np.sqrt(softened))
+        _accumulate(force, nodes[accept], diff[accept] * weight[:, None])
+
+        if leaf:
+            break
+        # Open every remaining cell except a node's own singleton cell
+        expand = ~accept & ~(own & (mass == 1))
+        open_nodes, open_cells = nodes[expand], cells[expand]
+        counts = level.child_count[open_cells]
+        total = int(counts.sum())
+        offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        nodes = np.repeat(open_nodes, counts)
+        cells = level.children[np.repeat(level.child_start[open_cells], counts) + offsets]
+
+    return force
+
+def attractive_forces(positions: np.ndarray, edges: np.ndarray, weights: np.ndarray, strength: float) -> np.ndarray:
+    """Spring forces pulling connected nodes together, scaled by edge strength."""
+    force = np.zeros_like(positions)
+    if len(edges) == 0:
+        return force
+    pull = strength * weights[:, None] * (positions[edges[:, 1]] - positions[edges[:, 0]])
+    _accumulate(force, edges[:, 0], pull)
+    _accumulate(force, edges[:, 1], -pull)
+    return force
+
+def compute_layout(
+    positions: np.ndarray,
+    edges: np.ndarray,
+    weights: np.ndarray,
+    params: LayoutParams = LayoutParams()
+) -> np.ndarray:
+    """Run the force-directed layout and return an (n, 3) array of positions.
+
+    With warm_start, rows of positions are used as the starting layout (NaN
+    rows are seeded) and the first steps are limited to warm_step, so an
+    existing layout is refined rather than reshuffled. Otherwise every node is
+    seeded from params.seed. A tiny seeded jitter separates nodes that start on
+    the same point. Repulsion is scaled down once the scene holds more than
+    REFERENCE_NODES nodes so large graphs still fit the bounds.
+    """
+    rng = np.random.default_rng(params.seed)
+    low, high = SCENE_BOUNDS[:, 0], SCENE_BOUNDS[:, 1]
+
+    seeded = rng.uniform(low * 0.5, high * 0.5, size=(len(positions), 3))
+    warm = params.warm_start and not np.isnan(positions).all()
+    if params.warm_start:
+        current = np.where(np.isnan(positions), seeded, positions).astype(np.float64)
+    else:
+        current = seeded
+    current += rng.normal(0.0, 1e-3, size=current.shape)
+
+    repulsion = params.repulsion * min(1.0, REFERENCE_NODES / max(len(current), 1))
+    step_limit = params.warm_step if warm else params.max_step
+    for _ in range(params.iterations):
+        force = repulsive_forces(current, params.theta, repulsion, params.softening, params.max_depth)
+        force += attractive_forces(current, edges, weights, params.attraction)
+        force -= params.gravity * current
+
+        length = np.sqrt((force * force).sum(axis=1))
+        scale = np.minimum(1.0, step_limit / np.maximum(length, 1e-12))
+        current = np.clip(current + force * scale[:, None], low, high)
+        step_limit *= params.cooling
+
+    return current
+
+def _load_graph_arrays(db) -> Tuple[list, np.ndarray, np.ndarray, np.ndarray]:
+    projects = db.query(Project.id, Project.position_x, Project.position_y, Project.position_z).order_by(Project.id).all()
+    blogs = db.query(Blog.id, Blog.position_x, Blog.position_y, Blog.position_z).order_by(Blog.id).all()
+    keys = [("project", row[0]) for row in projects] + [("blog", row[0]) for row in blogs]
+    positions = np.array([row[1:] for row in projects + blogs], dtype=np.float64).reshape(-1, 3)
+
+    index = {f"{kind}-{node_id}": i for i, (kind, node_id) in enumerate(keys)}
+    pairs, weights = [], []
+    for source, target, strength in db.query(NeuralEdge.source, NeuralEdge.target, NeuralEdge.strength):
+        if source in index and target in index:
+            pairs.append((index[source], index[target]))
+            weights.append(strength)
+    return keys, positions, np.array(pairs, dtype=np.int64).reshape(-1, 2), np.array(weights, dtype=np.float64)
+
+def run_layout(params: LayoutParams) -> dict:
+    """Lay out every project and blog and write the positions back in one transaction."""
+    db = SessionLocal()
+    try:
+        keys, positions, edges, weights = _load_graph_arrays(db)
+        start = time.perf_counter()
+        result = compute_layout(positions, edges, weights, params)
+        elapsed = time.perf_counter() - start
+
+        rows = {"project": [], "blog": []}
+        for (kind, node_id), (x, y, z) in zip(keys, result.round(4).tolist()):
+            rows[kind].append({"id": node_id, "position_x": x, "position_y": y, "position_z": z})
+        if rows["project"]:
+            db.execute(update(Project), rows["project"])
+        if rows["blog"]:
+            db.execute(update(Blog), rows["blog"])
+        record_reset(db)
+        db.commit()
+
+        return {"nodes": len(keys), "edges": len(edges), "compute_ms": round(elapsed * 1000, 2)}
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+class LayoutJob:
+    """Runs at most one layout at a time in a worker thread and tracks its state."""
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+        self.status = "idle"
+        self.params: Optional[LayoutParams] = None
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+        self.result: Optional[dict] = None
+        self.error: Optional[str] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self, params: LayoutParams) -> bool:
+        """Schedule a layout run; returns False if one is already running."""
+        if self.running:
+            return False
+        self.status = "running"
+        self.params = params
+        self.started_at = datetime.utcnow()
+        self.finished_at = None
+        self.result = None
+        self.error = None
+        self._task = asyncio.create_task(self._run(params))
+        return True
+
+    async def _run(self, params: LayoutParams) -> None:
+        try:
+            self.result = await asyncio.to_thread(run_layout, params)
+            version = bump_content_version()
+            content_events.publish("content", {"type": "scene", "action": "reset", "version": version})
+            self.status = "completed"
+            logger.info(f"Layout completed: {self.result}")
+        except Exception as e:
+            self.status = "failed"
+            self.error = str(e)
+            logger.error(f"Layout job failed: {e}")
+        finally:
+            self.finished_at = datetime.utcnow()
+
+    def state(self) -> dict:
+        return {
+            "status": self.status,
+            "params": self.params.__dict__ if self.params else None,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "result": self.result,
+            "error": self.error
+        }
+
+layout_job = LayoutJob()
@@ -0,0 +1,162 @@
+"""Level-of-detail cluster hierarchy for the neural scene.
+
+Level 1 groups scene nodes with mini-batch k-means over their positions;
+each further level clusters the previous level's centroids, weighted by
+member counts, so every level is about BRANCHING times smaller than the one
+below it. Positions come from the layout and auto-placement, which already
+pull similar content together, so spatial clusters are also topical ones.
+Edges between clusters aggregate the neural edges between their members.
+"""
+from typing import List, Optional, Tuple
+import math
+import numpy as np
+from scipy.spatial import cKDTree
+from .neural_edges import node_key
+
+BRANCHING = 8
+MAX_LEVELS = 6
+BATCH_SIZE = 256
+ITERATIONS = 50
+INIT_FACTOR = 3
+SEED = 42
+
+def kmeans_plus_plus(points: np.ndarray, weights: np.ndarray, k: int, rng: np.random.Generator) -> np.ndarray:
+    """Pick k initial centroids spread out by weighted k-means++ sampling."""
+    centroids = np.empty((k, points.shape[1]))
+    cumulative = np.cumsum(weights)
+    centroids[0] = points[np.searchsorted(cumulative, rng.random() * cumulative[-1], side="right")]
+    diff = points - centroids[0]
+    closest = np.einsum("ij,ij->i", diff, diff)
+    for i in range(1, k):
+        cumulative = np.cumsum(weights * closest)
+        if cumulative[-1] <= 0:
+            centroids[i:] = centroids[0]
+            break
+        centroids[i] = points[min(np.searchsorted(cumulative, rng.random() * cumulative[-1], side="right"), len(points) - 1)]
+        diff = points - centroids[i]
+        np.minimum(closest, np.einsum("ij,ij->i", diff, diff), out=closest)
+    return centroids
+
+def minibatch_kmeans(
+    points: np.ndarray,
+    k: int,
+    weights: Optional[np.ndarray] = None,
+    batch_size: int = BATCH_SIZE,
+    iterations: int = ITERATIONS,
+    seed: int = SEED
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Weighted mini-batch k-means; returns (centroids, label per point).
+
+    Batches are drawn with probability proportional to weight and each centre
+    moves toward its batch mean at a rate of 1/(points it has absorbed).
+    Clusters left empty by the final assignment are dropped, and the returned
+    centroids are the exact weighted means of their members.
+    """
+    n = len(points)
+    weights = np.ones(n) if weights is None else np.asarray(weights, dtype=np.float64)
+    k = max(1, min(k, n))
+    rng = np.random.default_rng(seed)
+    # Seed from a weighted sample a few times larger than k so initialisation stays cheap
+    sample = rng.choice(n, size=min(n, INIT_FACTOR * max(k, batch_size)), replace=False, p=weights / weights.sum())
+    centroids = kmeans_plus_plus(points[sample], np.ones(len(sample)), k, rng)
+    absorbed = np.zeros(k)
+    probabilities = weights / weights.sum()
+
+    for _ in range(iterations if n > k else 0):
+        batch = points[rng.choice(n, size=min(batch_size, n), p=probabilities)]
+        _, nearest = cKDTree(centroids).query(batch)
+        counts = np.bincount(nearest, minlength=k)
+        touched = counts > 0
+        sums = np.stack([np.bincount(nearest, weights=batch[:, d], minlength=k) for d in range(points.shape[1])], axis=1)
+        absorbed += counts
+        rate = np.where(touched, counts / np.maximum(absorbed, 1), 0.0)
+        centroids[touched] += rate[touched, None] * (sums[touched] / counts[touched, None] - centroids[touched])
+
+    _, labels = cKDTree(centroids).query(points)
+    used, labels = np.unique(labels, return_inverse=True)
+    mass = np.bincount(labels, weights=weights, minlength=len(used))
+    centroids = np.stack(
+        [np.bincount(labels, weights=weights * points[:, d], minlength=len(used)) for d in range(points.shape[1])], axis=1
+    ) / mass[:, None]
+    return centroids, labels
+
+def _aggregate_edges(sources: np.ndarray, targets: np.ndarray, strengths: np.ndarray, counts: np.ndarray, clusters: int):
+    """Sum edges between distinct clusters into one undirected edge per cluster pair."""
+    low, high = np.minimum(sources, targets), np.maximum(sources, targets)
+    between = low != high
+    pairs, inverse = np.unique(low[between] * clusters + high[between], return_inverse=True)
+    return (
+        pairs // clusters,
+        pairs % clusters,
+        np.bincount(inverse, weights=strengths[between], minlength=len(pairs)),
+        np.bincount(inverse, weights=counts[between], minlength=len(pairs)).astype(np.int64)
+    )
+
+def build_lod_levels(payload: dict) -> List[dict]:
+    """Cluster a neural-data payload into JSON-ready levels, finest first.
+
+    There is always at least one level once any node exists; the last level
+    holds at most BRANCHING clusters unless MAX_LEVELS is reached first.
+    """
+    nodes = [("project", node) for node in payload["projects"]] + [("blog", node) for node in payload["blogs"]]
+    if not nodes:
+        return []
+    positions = np.array([[n["position_x"], n["position_y"], n["position_z"]] for _, n in nodes], dtype=np.float64)
+    is_project = np.array([kind == "project" for kind, _ in nodes])
+    index = {node_key(kind, node["id"]): i for i, (kind, node) in enumerate(nodes)}
+    edges = [(index[e["source"]], index[e["target"]], e["strength"]) for e in payload["edges"]
+             if e["source"] in index and e["target"] in index]
+    sources = np.array([e[0] for e in edges], dtype=np.int64)
+    targets = np.array([e[1] for e in edges], dtype=np.int64)
+    strengths = np.array([e[2] for e in edges], dtype=np.float64)
+    edge_counts = np.ones(len(edges), dtype=np.int64)
+
+    levels: List[dict] = []
+    points, weights = positions, np.ones(len(nodes))
+    node_cluster = np.arange(len(nodes))
+    while len(levels) < MAX_LEVELS and (not levels or len(points) > BRANCHING):
+        centroids, labels = minibatch_kmeans(points, math.ceil(len(points) / BRANCHING), weights, seed=SEED + len(levels))
+        node_cluster = labels[node_cluster]
+        sources, targets = labels[sources], labels[targets]
+        sources, targets, strengths, edge_counts = _aggregate_edges(sources, targets, strengths, edge_counts, len(centroids))
+        weights = np.bincount(labels, weights=weights, minlength=len(centroids))
+
+        # Each cluster is labelled by the member node closest to its centroid
+        distance = ((positions - centroids[node_cluster]) ** 2).sum(axis=1)
+        order = np.lexsort((distance, node_cluster))
+        representative = order[np.concatenate(([0], np.flatnonzero(np.diff(node_cluster[order])) + 1))]
+
+        level = len(levels) + 1
+        if levels:
+            for child, parent in zip(levels[-1]["clusters"], labels):
+                child["parent"] = f"lod{level}-{parent}"
+        projects = np.bincount(node_cluster, weights=is_project, minlength=len(centroids)).astype(np.int64)
+        levels.append({
+            "level": level,
+            "levels": None,
+            "clusters": [
+                {
+                    "id": f"lod{level}-{i}",
+                    "position_x": round(float(x), 4),
+                    "position_y": round(float(y), 4),
+                    "position_z": round(float(z), 4),
+                    "count": int(count),
+                    "projects": int(project_count),
+                    "blogs": int(count - project_count),
+                    "representative": node_key(nodes[rep][0], nodes[rep][1]["id"]),
+                    "label": nodes[rep][1]["title"],
+                    "parent": None
+                }
+                for i, ((x, y, z), count, project_count, rep) in enumerate(
+                    zip(centroids, weights, projects, representative)
+                )
+            ],
+            "edges": [
+                {"source": f"lod{level}-{s}", "target": f"lod{level}-{t}", "strength": round(float(w), 4), "count": int(c)}
+                for s, t, w, c in zip(sources, targets, strengths, edge_counts)
+            ]
+        })
+        points = centroids
+    for level in levels:
+        level["levels"] = len(levels)
+    return levels
@@ -0,0 +1,182 @@
+"""Similarity edges between neural scene nodes.
+
+Implements the rules the frontend used to evaluate in every browser:
+project-blog keyword Jaccard above 0.3, and project-project tech stack
+Jaccard above 0.4 (scaled by 0.8). Token sets are turned into sparse
+incidence matrices so all pairwise intersections come from one product.
+"""
+from typing import Dict, Iterable, List, Sequence, Set, Tuple
+import logging
+import re
+import numpy as np
+from scipy import sparse
+from sqlalchemy import delete, or_
+from sqlalchemy.orm import Session, load_only
+from app.core.database import SessionLocal
+from app.models import Project, Blog, NeuralEdge
+
+logger = logging.getLogger(__name__)
+
+CONTENT_THRESHOLD = 0.3
+TECH_THRESHOLD = 0.4
+TECH_STRENGTH_SCALE = 0.8
+MAX_KEYWORDS = 10
+
+STOP_WORDS = frozenset(["the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for", "of", "with", "by"])
+
+# JavaScript's \w is ASCII-only
+_NON_WORD = re.compile(r"[^\w\s]", re.ASCII)
+
+# (source, target, kind, strength)
+Edge = Tuple[str, str, str, float]
+
+def node_key(kind: str, node_id: int) -> str:
+    """Scene node id as used by the frontend, e.g. "project-3"."""
+    return f"{kind}-{node_id}"
+
+def extract_keywords(text: str) -> List[str]:
+    """Lowercased words longer than two characters, stop words removed, first ten kept."""
+    words = _NON_WORD.sub(" ", text.lower()).split()
+    return [word for word in words if len(word) > 2 and word not in STOP_WORDS][:MAX_KEYWORDS]
+
+def project_keywords(project: Project) -> Set[str]:
+    return set(extract_keywords(f"{project.title} {project.description or ''}"))
+
+def blog_keywords(blog: Blog) -> Set[str]:
+    return set(extract_keywords(f"{blog.title} {blog.summary or ''}"))
+
+def project_techs(project: Project) -> Set[str]:
+    return {tech.lower() for tech in project.get_tech_stack_list()}
+
+def _incidence(token_sets: Sequence[Set[str]], vocabulary: Dict[str, int]) -> sparse.csr_matrix:
+    rows, cols = [], []
+    for row, tokens in enumerate(token_sets):
+        for token in tokens:
+            rows.append(row)
+            cols.append(vocabulary[token])
+    data = np.ones(len(rows), dtype=np.float32)
+    return sparse.csr_matrix((data, (rows, cols)), shape=(len(token_sets), len(vocabulary)))
+
+def jaccard_pairs(
+    left: Sequence[Set[str]],
+    right: Sequence[Set[str]],
+    threshold: float
+) -> Iterable[Tuple[int, int, float]]:
+    """Yield (left index, right index, similarity) for pairs whose Jaccard exceeds threshold.
+
+    Only pairs sharing at least one token appear in the sparse product, so the
+    cost follows the number of overlapping pairs rather than len(left) * len(right).
+    """
+    if not left or not right:
+        return []
+
+    vocabulary: Dict[str, int] = {}
+    for tokens in (*left, *right):
+        for token in tokens:
+            vocabulary.setdefault(token, len(vocabulary))
+    if not vocabulary:
+        return []
+
+    left_matrix = _incidence(left, vocabulary)
+    right_matrix = _incidence(right, vocabulary)
+    left_sizes = np.asarray(left_matrix.sum(axis=1)).ravel()
+    right_sizes = np.asarray(right_matrix.sum(axis=1)).ravel()
+
+    overlap = (left_matrix @ right_matrix.T).tocoo()
+    union = left_sizes[overlap.row] + right_sizes[overlap.col] - overlap.data
+    similarity = overlap.data / union
+    keep = similarity > threshold
+    return zip(overlap.row[keep].tolist(), overlap.col[keep].tolist(), similarity[keep].tolist())
+
+def content_edges(projects: Sequence[Project], blogs: Sequence[Blog]) -> List[Edge]:
+    """Project-to-blog edges from title/description vs title/summary keywords."""
+    pairs = jaccard_pairs(
+        [project_keywords(project) for project in projects],
+        [blog_keywords(blog) for blog in blogs],
+        CONTENT_THRESHOLD
+    )
+    return [
+        (node_key("project", projects[i].id), node_key("blog", blogs[j].id), "content", round(strength, 4))
+        for i, j, strength in pairs
+    ]
+
+def tech_edges(projects: Sequence[Project], others: Sequence[Project]) -> List[Edge]:
+    """Project-to-project edges from shared technologies, oriented lower id first."""
+    pairs = jaccard_pairs(
+        [project_techs(project) for project in projects],
+        [project_techs(project) for project in others],
+        TECH_THRESHOLD
+    )
+    edges: Dict[Tuple[int, int], Edge] = {}
+    for i, j, strength in pairs:
+        low, high = sorted((projects[i].id, others[j].id))
+        if low == high:
+            continue
+        edges[(low, high)] = (
+            node_key("project", low), node_key("project", high), "tech", round(strength * TECH_STRENGTH_SCALE, 4)
+        )
+    return list(edges.values())
+
+def _load_projects(db: Session) -> List[Project]:
+    return db.query(Project).options(load_only(Project.id, Project.title, Project.description, Project.tech_stack)).all()
+
+def _load_blogs(db: Session) -> List[Blog]:
+    return db.query(Blog).options(load_only(Blog.id, Blog.title, Blog.summary)).all()
+
+def _insert_edges(db: Session, edges: List[Edge]) -> None:
+    if edges:
+        db.execute(
+            NeuralEdge.__table__.insert(),
+            [{"source": s, "target": t, "kind": k, "strength": w} for s, t, k, w in edges]
+        )
+
+def sync_node_edges(db: Session, kind: str, node_id: int) -> int:
+    """Recompute the edges of one project or blog after it was written or deleted.
+
+    Must run after the change is flushed; returns the number of edges stored.
+    """
+    key = node_key(kind, node_id)
+    db.execute(delete(NeuralEdge).where(or_(NeuralEdge.source == key, NeuralEdge.target == key)))
+
+    if kind == "project":
+        project = db.get(Project, node_id)
+        if project is None:
+            return 0
+        edges = content_edges([project], _load_blogs(db)) + tech_edges([project], _load_projects(db))
+    else:
+        blog = db.get(Blog, node_id)
+        if blog is None:
+            return 0
+        edges = content_edges(_load_projects(db), [blog])
+
+    _insert_edges(db, edges)
+    return len(edges)
+
+def rebuild_edges(db: Session) -> int:
+    """Recompute every edge from scratch; returns the number of edges stored."""
+    projects = _load_projects(db)
+    edges = content_edges(projects, _load_blogs(db)) + tech_edges(projects, projects)
+    db.execute(delete(NeuralEdge))
+    _insert_edges(db, edges)
+    return len(edges)
+
+def backfill_neural_edges() -> None:
+    """Build the edge table on startup when it is empty but content exists."""
+    db = SessionLocal()
+    try:
+        if db.query(NeuralEdge.id).first() or not db.query(Project.id).first():
+            return
+        count = rebuild_edges(db)
+        db.commit()
+        logger.info(f"Backfilled {count} neural edges")
+    finally:
+        db.close()
+
+def load_graph(db: Session) -> Tuple[List[NeuralEdge], Dict[str, List[str]]]:
+    """Load stored edges (strongest first) and the per-node neighbour index."""
+    edges = db.query(NeuralEdge).order_by(NeuralEdge.strength.desc(), NeuralEdge.id).all()
+    adjacency: Dict[str, List[str]] = {}
+    for edge in edges:
+        adjacency.setdefault(edge.source, []).append(edge.target)
+        adjacency.setdefault(edge.target, []).append(edge.source)
+    return edges, adjacency
@@ -0,0 +1,176 @@
+"""Semantic auto-placement of scene nodes.
+
+All projects and blogs are embedded as TF-IDF vectors and reduced to three
+dimensions with a randomized truncated SVD, then rescaled into the scene
+bounds. New or edited items are projected into the fitted basis, which costs
+one sparse vector product, so related content lands near each other without
+refitting on every insert. The basis is refitted only once the corpus has
+grown by REFIT_GROWTH since the last fit.
+"""
+from threading import Lock
+from typing import Dict, List, Optional, Sequence, Tuple
+import asyncio
+import logging
+import re
+import numpy as np
+from scipy import sparse
+from app.core.database import SessionLocal
+from app.models import Project, Blog
+from .layout import SCENE_BOUNDS
+from .neural_edges import STOP_WORDS
+
+logger = logging.getLogger(__name__)
+
+COMPONENTS = 3
+OVERSAMPLING = 10
+POWER_ITERATIONS = 4
+REFIT_GROWTH = 1.5
+SEED = 42
+
+# Fitted coordinates between these percentiles fill this share of the bounds
+SCALE_PERCENTILES = (2, 98)
+SCALE_FILL = 0.8
+
+_TOKEN = re.compile(r"[a-z0-9][a-z0-9+#.-]*[a-z0-9+#]|[a-z0-9]")
+
+def tokenize(text: str) -> List[str]:
+    return [token for token in _TOKEN.findall(text.lower()) if len(token) > 2 and token not in STOP_WORDS]
+
+def project_document(project: Project) -> str:
+    return " ".join([
+        project.title or "",
+        project.description or "",
+        project.content or "",
+        " ".join(project.get_tech_stack_list())
+    ])
+
+def blog_document(blog: Blog) -> str:
+    return " ".join([
+        blog.title or "",
+        blog.summary or "",
+        blog.content or "",
+        " ".join(blog.get_tags_list())
+    ])
+
+def randomized_svd(matrix: sparse.csr_matrix, mean: np.ndarray, k: int, rng: np.random.Generator) -> np.ndarray:
+    """Top-k right singular vectors of (matrix - mean) without densifying matrix.
+
+    Halko et al. range finder with a few power iterations; the centring is
+    applied implicitly to every product.
+    """
+    rows, cols = matrix.shape
+    width = min(k + OVERSAMPLING, rows, cols)
+
+    def times(dense):  # (matrix - mean) @ dense
+        return matrix @ dense - np.outer(np.ones(rows), mean @ dense)
+
+    def transpose_times(dense):  # (matrix - mean).T @ dense
+        return matrix.T @ dense - np.outer(mean, dense.sum(axis=0))
+
+    basis, _ = np.linalg.qr(times(rng.standard_normal((cols, width))))
+    for _ in range(POWER_ITERATIONS):
+        basis, _ = np.linalg.qr(transpose_times(basis))
+        basis, _ = np.linalg.qr(times(basis))
+
+    small = transpose_times(basis).T
+    _, _, vt = np.linalg.svd(small, full_matrices=False)
+    return vt[:k]
+
+class PlacementModel:
+    """Fitted TF-IDF vocabulary, SVD basis and scene scaling."""
+
+    def __init__(self, documents: Sequence[str]):
+        tokenized = [tokenize(document) for document in documents]
+        self.vocabulary: Dict[str, int] = {}
+        for tokens in tokenized:
+            for token in tokens:
+                self.vocabulary.setdefault(token, len(self.vocabulary))
+        self.documents = len(documents)
+
+        counts = self._counts(tokenized)
+        df = np.bincount(counts.indices, minlength=len(self.vocabulary))
+        self.idf = np.log((1 + self.documents) / (1 + df)) + 1
+        matrix = self._weigh(counts)
+
+        self.mean = np.asarray(matrix.mean(axis=0)).ravel() if self.documents else np.zeros(len(self.vocabulary))
+        k = min(COMPONENTS, max(self.documents - 1, 0), len(self.vocabulary))
+        self.components = np.zeros((COMPONENTS, len(self.vocabulary)))
+        if k > 0:
+            self.components[:k] = randomized_svd(matrix, self.mean, k, np.random.default_rng(SEED))
+            # Fix each axis' sign so refits of the same corpus agree
+            signs = np.sign(self.components[:k][np.arange(k), np.abs(self.components[:k]).argmax(axis=1)])
+            self.components[:k] *= signs[:, None]
+
+        coords = self._reduce(matrix)
+        low, high = np.percentile(coords, SCALE_PERCENTILES, axis=0) if len(coords) else (np.zeros(3), np.zeros(3))
+        self.center = (low + high) / 2
+        spread = np.where(high - low > 1e-9, high - low, 1.0)
+        bounds_span = SCENE_BOUNDS[:, 1] - SCENE_BOUNDS[:, 0]
+        self.scale = SCALE_FILL * bounds_span / spread
+
+    def _counts(self, tokenized: Sequence[List[str]]) -> sparse.csr_matrix:
+        rows, cols = [], []
+        for row, tokens in enumerate(tokenized):
+            for token in tokens:
+                col = self.vocabulary.get(token)
+                if col is not None:
+                    rows.append(row)
+                    cols.append(col)
+        counts = sparse.csr_matrix(
+            (np.ones(len(rows)), (rows, cols)), shape=(len(tokenized), len(self.vocabulary))
+        )
+        counts.sum_duplicates()
+        return counts
+
+    def _weigh(self, counts: sparse.csr_matrix) -> sparse.csr_matrix:
+        """Sublinear TF times IDF, rows L2-normalised."""
+        weighted = counts.copy()
+        weighted.data = 1 + np.log(weighted.data)
+        weighted = weighted.multiply(self.idf).tocsr()
+        norms = np.sqrt(np.asarray(weighted.multiply(weighted).sum(axis=1)).ravel())
+        return sparse.diags(1 / np.where(norms > 0, norms, 1)) @ weighted
+
+    def _reduce(self, matrix: sparse.csr_matrix) -> np.ndarray:
+        return matrix @ self.components.T - self.mean @ self.components.T
+
+    def place(self, document: str) -> Tuple[float, float, float]:
+        """Project one document into the fitted basis and return scene coordinates."""
+        vector = self._weigh(self._counts([tokenize(document)]))
+        coords = (self._reduce(vector)[0] - self.center) * self.scale
+        coords = np.clip(coords, SCENE_BOUNDS[:, 0], SCENE_BOUNDS[:, 1])
+        return tuple(round(float(value), 4) for value in coords)
+
+class PlacementIndex:
+    """Process-wide placement model, fitted lazily and refitted as the corpus grows."""
+
+    def __init__(self):
+        self._model: Optional[PlacementModel] = None
+        self._lock = Lock()
+
+    def ensure_fitted(self) -> PlacementModel:
+        """Return the model, fitting it first if missing or outgrown (blocking; run in a thread)."""
+        db = SessionLocal()
+        try:
+            total = db.query(Project.id).count() + db.query(Blog.id).count()
+            with self._lock:
+                model = self._model
+                if model is None or total >= max(model.documents, 1) * REFIT_GROWTH:
+                    documents = [project_document(p) for p in db.query(Project).all()]
+                    documents += [blog_document(b) for b in db.query(Blog).all()]
+                    model = self._model = PlacementModel(documents)
+                    logger.info(f"Fitted placement model on {len(documents)} documents ({len(model.vocabulary)} terms)")
+                return model
+        finally:
+            db.close()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._model = None
+
+placement_index = PlacementIndex()
+
+async def auto_place(kind: str, node) -> None:
+    """Set a project's or blog's position from its text."""
+    model = await asyncio.to_thread(placement_index.ensure_fitted)
+    document = project_document(node) if kind == "project" else blog_document(node)
+    node.position_x, node.position_y, node.position_z = model.place(document)
@@ -0,0 +1,314 @@
+"""Precomputed related content for project and blog pages.
+
+Every project and blog is a sublinear TF-IDF vector over its title, summary
+or description, content and tags or tech stack, and related_content stores
+each node's TOP_K most cosine-similar nodes. The term frequencies and the stored
+neighbour lists are mirrored in memory, so when one node is written its
+similarity to every other node is a single sparse matrix-vector product: its
+own list (row) is replaced, it is inserted into or dropped from other nodes'
+lists (column), and only lists it falls out of are recomputed. Only
+rebuild_related compares every pair.
+
+Other lists are not rescored when a write shifts the IDF weights slightly;
+rebuild_related recomputes them exactly.
+
+The mirror is loaded once at startup. Writes made meanwhile by other
+workers are replayed from the change log, node by node, so a write never
+re-reads the whole corpus unless the log was reset or compacted.
+"""
+from typing import Dict, List, Optional, Sequence, Tuple
+import logging
+import numpy as np
+from scipy import sparse
+from sqlalchemy import delete, insert
+from sqlalchemy.orm import Session, load_only
+from app.core.database import SessionLocal
+from app.models import Project, Blog, RelatedContent
+from .change_log import changed_nodes, current_version
+from .neural_edges import node_key
+from .placement import tokenize, project_document, blog_document
+
+logger = logging.getLogger(__name__)
+
+TOP_K = 5
+REBUILD_CHUNK = 256
+
+MODELS = {"project": Project, "blog": Blog}
+DOCUMENT_COLUMNS = {
+    "project": (Project.id, Project.title, Project.description, Project.content, Project.tech_stack),
+    "blog": (Blog.id, Blog.title, Blog.summary, Blog.content, Blog.tags),
+}
+
+def _document(kind: str, node) -> str:
+    return project_document(node) if kind == "project" else blog_document(node)
+
+def top_k(scores: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Indices and scores of the TOP_K highest positive scores, best first, padded with -1 / 0."""
+    candidates = np.flatnonzero(scores > 0)
+    if len(candidates) > TOP_K:
+        candidates = candidates[np.argpartition(-scores[candidates], TOP_K - 1)[:TOP_K]]
+    candidates = candidates[np.lexsort((candidates, -scores[candidates]))]
+    neighbors = np.full(TOP_K, -1, dtype=np.int64)
+    values = np.zeros(TOP_K)
+    neighbors[:len(candidates)] = candidates
+    values[:len(candidates)] = scores[candidates]
+    return neighbors, values
+
+class RelatedIndex:
+    """In-memory term frequencies and neighbour lists mirroring related_content.
+
+    version is the change log version the mirror reflects; sync_related
+    replays the changes of any writer that got in between.
+    Admin writes reach it one at a time, serialised by the database's write
+    lock, so it needs no lock of its own.
+    """
+
+    def __init__(self):
+        self.bind = None
+        self.version: Optional[int] = None
+        self.keys: List[str] = []
+        self.position: Dict[str, int] = {}
+        self.vocabulary: Dict[str, int] = {}
+        self.tf = sparse.csr_matrix((0, 0))
+        self.tf_squared = sparse.csr_matrix((0, 0))
+        self.alive = np.zeros(0, dtype=bool)
+        self.neighbors = np.full((0, TOP_K), -1, dtype=np.int64)
+        self.scores = np.zeros((0, TOP_K))
+
+    def _tf_row(self, tokens: Sequence[str]) -> sparse.csr_matrix:
+        """Sublinear term frequencies (1 + log count) of one document."""
+        cols = [self.vocabulary.setdefault(token, len(self.vocabulary)) for token in tokens]
+        row = sparse.csr_matrix((np.ones(len(cols)), (np.zeros(len(cols), dtype=np.int64), cols)), shape=(1, len(self.vocabulary)))
+        row.sum_duplicates()
+        row.data = 1 + np.log(row.data)
+        return row
+
+    def _load_terms(self, db: Session) -> None:
+        self.keys, self.vocabulary = [], {}
+        rows, cols = [], []
+        for kind, model in MODELS.items():
+            for node in db.query(model).options(load_only(*DOCUMENT_COLUMNS[kind])).order_by(model.id):
+                for token in tokenize(_document(kind, node)):
+                    rows.append(len(self.keys))
+                    cols.append(self.vocabulary.setdefault(token, len(self.vocabulary)))
+                self.keys.append(node_key(kind, node.id))
+        n = len(self.keys)
+        tf = sparse.csr_matrix((np.ones(len(rows)), (rows, cols)), shape=(n, len(self.vocabulary)))
+        tf.sum_duplicates()
+        tf.data = 1 + np.log(tf.data)
+        self.tf, self.tf_squared = tf, tf.multiply(tf).tocsr()
+        self.position = {key: i for i, key in enumerate(self.keys)}
+        self.alive = np.ones(n, dtype=bool)
+        self.neighbors = np.full((n, TOP_K), -1, dtype=np.int64)
+        self.scores = np.zeros((n, TOP_K))
+
+    def load(self, db: Session) -> None:
+        """Rebuild the mirror from the content tables and the stored neighbour lists."""
+        self._load_terms(db)
+        for source, rank, target, score in db.query(
+            RelatedContent.source, RelatedContent.rank, RelatedContent.target, RelatedContent.score
+        ):
+            i, j = self.position.get(source), self.position.get(target)
+            if i is not None and j is not None and rank < TOP_K:
+                self.neighbors[i, rank] = j
+                self.scores[i, rank] = score
+
+    def _weights(self) -> Tuple[np.ndarray, np.ndarray]:
+        """IDF over live nodes and every row's TF-IDF norm, each one pass over the nonzeros."""
+        df = np.bincount(self.tf.indices, minlength=self.tf.shape[1])
+        idf = np.log((1 + self.alive.sum()) / (1 + df)) + 1
+        norms = np.sqrt(self.tf_squared @ (idf * idf))
+        return idf, np.where(norms > 0, norms, 1)
+
+    def _similarities(self, idf: np.ndarray, norms: np.ndarray, i: int) -> np.ndarray:
+        """Cosine similarity of row i to every row, as one sparse matrix-vector product."""
+        row = self.tf[i]
+        query = np.zeros(self.tf.shape[1])
+        query[row.indices] = row.data * idf[row.indices] ** 2 / norms[i]
+        scores = (self.tf @ query) / norms
+        scores[i] = 0
+        scores[~self.alive] = 0
+        return scores
+
+    @staticmethod
+    def _splice(matrix: sparse.csr_matrix, i: int, row: sparse.csr_matrix, width: int) -> sparse.csr_matrix:
+        """Replace row i by splicing the CSR arrays, without re-indexing the other rows."""
+        start, end = matrix.indptr[i], matrix.indptr[i + 1]
+        shift = row.nnz - (end - start)
+        return sparse.csr_matrix((
+            np.concatenate([matrix.data[:start], row.data, matrix.data[end:]]),
+            np.concatenate([matrix.indices[:start], row.indices, matrix.indices[end:]]),
+            np.concatenate([matrix.indptr[:i + 1], matrix.indptr[i + 1:] + shift])
+        ), shape=(matrix.shape[0], width))
+
+    def _set_row(self, i: int, row: sparse.csr_matrix) -> None:
+        width = len(self.vocabulary)
+        self.tf = self._splice(self.tf, i, row, width)
+        self.tf_squared = self._splice(self.tf_squared, i, row.multiply(row).tocsr(), width)
+
+    def _append(self, key: str) -> int:
+        i = len(self.keys)
+        self.keys.append(key)
+        self.position[key] = i
+        empty = sparse.csr_matrix((1, self.tf.shape[1]))
+        self.tf = sparse.vstack([self.tf, empty], format="csr")
+        self.tf_squared = sparse.vstack([self.tf_squared, empty], format="csr")
+        self.alive = np.append(self.alive, False)
+        self.neighbors = np.vstack([self.neighbors, np.full((1, TOP_K), -1, dtype=np.int64)])
+        self.scores = np.vstack([self.scores, np.zeros((1, TOP_K))])
+        return i
+
+    def _sort_row(self, j: int) -> None:
+        dropped = self.scores[j] <= 0
+        self.neighbors[j, dropped] = -1
+        self.scores[j, dropped] = 0
+        order = np.lexsort((np.where(dropped, len(self.keys), self.neighbors[j]), -self.scores[j]))
+        self.neighbors[j] = self.neighbors[j, order]
+        self.scores[j] = self.scores[j, order]
+
+    def update(self, db: Session, kind: str, node_id: int) -> List[int]:
+        """Refresh the row and column of one written or deleted node; returns the rows that changed."""
+        key = node_key(kind, node_id)
+        node = db.get(MODELS[kind], node_id)
+        i = self.position.get(key)
+        if node is None:
+            if i is None:
+                return []
+            self._set_row(i, sparse.csr_matrix((1, len(self.vocabulary))))
+            self.alive[i] = False
+        else:
+            if i is None:
+                i = self._append(key)
+            self._set_row(i, self._tf_row(tokenize(_document(kind, node))))
+            self.alive[i] = True
+
+        idf, norms = self._weights()
+        scores = self._similarities(idf, norms, i) if self.alive[i] else np.zeros(len(self.keys))
+        changed = {i}
+        self.neighbors[i], self.scores[i] = top_k(scores)
+
+        full = self.neighbors[:, TOP_K - 1] >= 0
+        members = (self.neighbors == i).any(axis=1)
+        members[i] = False
+        for j in np.flatnonzero(members):
+            slot = np.flatnonzero(self.neighbors[j] == i)[0]
+            if scores[j] >= self.scores[j, slot] or not full[j]:
+                # Rising, or the list already holds every positive match: it stays exact
+                self.scores[j, slot] = scores[j]
+                self._sort_row(j)
+            else:
+                self.neighbors[j], self.scores[j] = top_k(self._similarities(idf, norms, j))
+            changed.add(j)
+
+        entering = self.alive & ~members & (scores > self.scores[:, TOP_K - 1])
+        entering[i] = False
+        for j in np.flatnonzero(entering):
+            self.neighbors[j, TOP_K - 1] = i
+            self.scores[j, TOP_K - 1] = scores[j]
+            self._sort_row(j)
+            changed.add(j)
+        return sorted(changed)
+
+    def rebuild(self, db: Session) -> None:
+        """Reload the term frequencies and compute every neighbour list in blocks of REBUILD_CHUNK rows."""
+        self._load_terms(db)
+        idf, norms = self._weights()
+        weighted = (sparse.diags(1 / norms) @ self.tf.multiply(idf)).tocsr()
+        transposed = weighted.T.tocsr()
+        for start in range(0, len(self.keys), REBUILD_CHUNK):
+            block = (weighted[start:start + REBUILD_CHUNK] @ transposed).toarray()
+            rows = np.arange(len(block))
+            block[rows, rows + start] = 0
+            for offset, scores in enumerate(block):
+                self.neighbors[start + offset], self.scores[start + offset] = top_k(scores)
+
+    def store(self, db: Session, rows: Sequence[int], replace_all: bool = False) -> int:
+        """Write the given neighbour lists to related_content; returns the number of entries stored."""
+        if replace_all:
+            db.execute(delete(RelatedContent))
+        else:
+            keys = [self.keys[j] for j in rows]
+            for start in range(0, len(keys), 500):
+                db.execute(delete(RelatedContent).where(RelatedContent.source.in_(keys[start:start + 500])))
+        entries = [
+            {"source": self.keys[j], "rank": rank, "target": self.keys[target], "score": round(float(score), 4)}
+            for j in rows if self.alive[j]
+            for rank, (target, score) in enumerate(zip(self.neighbors[j], self.scores[j])) if target >= 0
+        ]
+        if entries:
+            db.execute(insert(RelatedContent), entries)
+        return len(entries)
+
+related_index = RelatedIndex()
+
+def sync_related(db: Session, kind: str, node_id: int, version: int) -> int:
+    """Refresh related content for one written or deleted node within the caller's transaction.
+
+    version is the change log entry of this write. Nodes logged between the
+    mirror's version and this one are refreshed first; the mirror is only
+    reloaded when it has never been loaded for this database or the log
+    cannot list those nodes. Returns the number of neighbour lists rewritten.
+    """
+    bind = db.get_bind()
+    missed = None
+    if related_index.bind is bind and related_index.version is not None:
+        missed = changed_nodes(db, related_index.version, version)
+    if missed is None:
+        related_index.load(db)
+        missed = []
+    related_index.version = None
+    rows = set()
+    for key in missed + [node_key(kind, node_id)]:
+        missed_kind, _, missed_id = key.partition("-")
+        rows.update(related_index.update(db, missed_kind, int(missed_id)))
+    related_index.store(db, sorted(rows))
+    related_index.bind, related_index.version = bind, version
+    return len(rows)
+
+def rebuild_related(db: Session) -> int:
+    """Recompute every neighbour list from scratch; returns the number of entries stored."""
+    related_index.version = None
+    related_index.rebuild(db)
+    count = related_index.store(db, range(len(related_index.keys)), replace_all=True)
+    related_index.bind, related_index.version = db.get_bind(), current_version(db)
+    return count
+
+def load_related(db: Session, kind: str, slug: str) -> Optional[List[dict]]:
+    """Stored related items of a project or blog as JSON-ready dicts, or None if the slug is unknown."""
+    model = MODELS[kind]
+    node_id = db.query(model.id).filter(model.slug == slug).scalar()
+    if node_id is None:
+        return None
+
+    rows = db.query(RelatedContent.target, RelatedContent.score).filter(
+        RelatedContent.source == node_key(kind, node_id)
+    ).order_by(RelatedContent.rank).all()
+    ids = {"project": [], "blog": []}
+    for target, _ in rows:
+        target_kind, _, target_id = target.partition("-")
+        ids[target_kind].append(int(target_id))
+
+    nodes = {}
+    for project_id, project_slug, title, summary in db.query(Project.id, Project.slug, Project.title, Project.description).filter(Project.id.in_(ids["project"])):
+        nodes[node_key("project", project_id)] = ("project", project_id, project_slug, title, summary)
+    for blog_id, blog_slug, title, summary in db.query(Blog.id, Blog.slug, Blog.title, Blog.summary).filter(Blog.id.in_(ids["blog"])):
+        nodes[node_key("blog", blog_id)] = ("blog", blog_id, blog_slug, title, summary)
+
+    return [
+        dict(zip(("type", "id", "slug", "title", "summary"), nodes[target]), score=score)
+        for target, score in rows if target in nodes
+    ]
+
+def backfill_related() -> None:
+    """Load the in-memory mirror on startup, building the related content table first when it is empty."""
+    db = SessionLocal()
+    try:
+        if db.query(RelatedContent.source).first() or not (db.query(Project.id).first() or db.query(Blog.id).first()):
+            related_index.load(db)
+            related_index.bind, related_index.version = db.get_bind(), current_version(db)
+            return
+        count = rebuild_related(db)
+        db.commit()
+        logger.info(f"Backfilled {count} related content entries")
+    finally:
+        db.close()
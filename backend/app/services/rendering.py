@@ -0,0 +1,175 @@
+"""Server-side markdown rendering with a per-block render cache.
+
+Markdown is split into top-level blocks (paragraphs, headings, lists, fences,
+tables...) with markdown-it's block parser, and each block is rendered on its
+own. Rendered blocks are cached by a hash of their source, so re-rendering a
+document while it is being edited only renders the blocks that changed.
+
+Raw HTML in the source is escaped instead of passed through, markdown-it
+refuses javascript:/vbscript:/file: links, and fenced code is highlighted
+with Pygments (span classes from HtmlFormatter).
+"""
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+import asyncio
+import hashlib
+import html
+import json
+import logging
+import math
+import re
+from markdown_it import MarkdownIt
+from pygments import highlight
+from pygments.formatters import HtmlFormatter
+from pygments.lexers import get_lexer_by_name
+from pygments.util import ClassNotFound
+from app.core.cache import LRUCache
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models import Project, Blog
+
+logger = logging.getLogger(__name__)
+
+WORDS_PER_MINUTE = 200
+
+_FORMATTER = HtmlFormatter(nowrap=True)
+_TAG = re.compile(r"<[^>]+>")
+_WORD = re.compile(r"\w+(?:['’-]\w+)*")
+_SLUG_STRIP = re.compile(r"[^\w\s-]")
+_SLUG_SPACE = re.compile(r"[\s-]+")
+_NEWLINES = re.compile(r"\r\n?")
+
+def _highlight_code(code: str, lang: str, attrs: str) -> str:
+    try:
+        lexer = get_lexer_by_name(lang) if lang else None
+    except ClassNotFound:
+        lexer = None
+    # An empty result makes markdown-it escape the code itself
+    return highlight(code, lexer, _FORMATTER) if lexer else ""
+
+def _heading_open(self, tokens, idx, options, env):
+    token = tokens[idx]
+    if token.level == 0 and env.get("heading_id"):
+        token.attrSet("id", env["heading_id"])
+    return self.renderToken(tokens, idx, options, env)
+
+def _link_open(self, tokens, idx, options, env):
+    token = tokens[idx]
+    if (token.attrGet("href") or "").startswith(("http://", "https://")):
+        token.attrSet("target", "_blank")
+        token.attrSet("rel", "noopener noreferrer")
+    return self.renderToken(tokens, idx, options, env)
+
+_markdown = MarkdownIt("commonmark", {"html": False, "highlight": _highlight_code}).enable(["table", "strikethrough"])
+_markdown.add_render_rule("heading_open", _heading_open)
+_markdown.add_render_rule("link_open", _link_open)
+
+render_cache = LRUCache(settings.RENDER_CACHE_MAX_ENTRIES)
+
+@dataclass
+class RenderedMarkdown:
+    html: str
+    toc: List[dict] = field(default_factory=list)
+    word_count: int = 0
+    reading_time: int = 0
+    blocks: int = 0
+    rendered_blocks: int = 0
+
+def _plain_text(fragment: str, separator: str = " ") -> str:
+    return html.unescape(_TAG.sub(separator, fragment))
+
+def slugify(text: str) -> str:
+    """Heading anchor: lowercased words joined by hyphens."""
+    return _SLUG_SPACE.sub("-", _SLUG_STRIP.sub("", text.lower())).strip("-") or "section"
+
+def split_blocks(markdown: str) -> Tuple[List[Tuple[str, str, str, int]], dict]:
+    """Top-level blocks as (token type, source, heading text, heading level) plus the document's link references."""
+    source = _NEWLINES.sub("\n", markdown).replace("\0", "�")
+    lines = source.split("\n")
+    env: dict = {}
+    tokens = []
+    _markdown.block.parse(source, _markdown, env, tokens)
+
+    blocks = []
+    for i, token in enumerate(tokens):
+        if token.level != 0 or token.nesting == -1 or token.map is None:
+            continue
+        heading, level = (tokens[i + 1].content, int(token.tag[1])) if token.type == "heading_open" else ("", 0)
+        blocks.append((token.type, "\n".join(lines[token.map[0]:token.map[1]]), heading, level))
+    return blocks, env.get("references", {})
+
+def _render_block(source: str, heading_id: str, references: dict, code: bool) -> Tuple[str, int]:
+    rendered = _markdown.render(source, {"references": references, "heading_id": heading_id})
+    words = 0 if code else len(_WORD.findall(_plain_text(rendered)))
+    return rendered, words
+
+def render_markdown(markdown: str) -> RenderedMarkdown:
+    """Render markdown to sanitized HTML with a heading index, word count and reading time.
+
+    Each block is looked up in render_cache by a hash of its source, its
+    heading anchor and the document's link references; only misses are
+    rendered. Code blocks do not count towards the word count.
+    """
+    blocks, references = split_blocks(markdown or "")
+    references_key = json.dumps(
+        sorted((label, ref["href"], ref["title"]) for label, ref in references.items())
+    ) if references else ""
+
+    parts, toc = [], []
+    slugs: Dict[str, int] = {}
+    words = rendered_blocks = 0
+    for block_type, source, heading, level in blocks:
+        heading_id = ""
+        if block_type == "heading_open":
+            text = _plain_text(_markdown.renderInline(heading), "").strip()
+            base = slugify(text)
+            seen = slugs.get(base, 0)
+            slugs[base] = seen + 1
+            heading_id = f"{base}-{seen}" if seen else base
+            toc.append({"level": level, "text": text, "id": heading_id})
+
+        key = hashlib.sha1("\0".join((source, heading_id, references_key)).encode()).hexdigest()
+        cached = render_cache.get(key)
+        if cached is None:
+            cached = _render_block(source, heading_id, references, block_type in ("fence", "code_block"))
+            render_cache.set(key, cached)
+            rendered_blocks += 1
+        block_html, block_words = cached
+        parts.append(block_html)
+        words += block_words
+
+    return RenderedMarkdown(
+        html="".join(parts),
+        toc=toc,
+        word_count=words,
+        reading_time=math.ceil(words / WORDS_PER_MINUTE),
+        blocks=len(blocks),
+        rendered_blocks=rendered_blocks
+    )
+
+def apply_rendered(node, rendered: RenderedMarkdown) -> None:
+    """Store a render result on a project or blog row."""
+    node.content_html = rendered.html
+    node.toc = json.dumps(rendered.toc)
+    node.word_count = rendered.word_count
+    node.reading_time = rendered.reading_time
+
+async def render_content(node) -> None:
+    """Render a project's or blog's markdown off the event loop and store the result on the row."""
+    rendered = await asyncio.to_thread(render_markdown, node.content or "")
+    apply_rendered(node, rendered)
+
+def backfill_rendered_content() -> None:
+    """Render rows saved before write-time rendering existed."""
+    db = SessionLocal()
+    try:
+        count = 0
+        for model in (Project, Blog):
+            for node in db.query(model).filter(model.content_html.is_(None)):
+                apply_rendered(node, render_markdown(node.content or ""))
+                count += 1
+        if count:
+            db.commit()
+            logger.info(f"Rendered markdown for {count} projects and blogs")
+    finally:
+        db.close()
@@ -0,0 +1,151 @@
+"""SQLite FTS5 full-text search over projects and blogs.
+
+Both tables feed one FTS5 index. Row ids encode the source row as
+id * 2 (+1 for blogs), so triggers can update or delete an entry by rowid
+without scanning the index. Columns are title, summary (project
+description), content and tags (project tech stack); they are ranked with
+BM25 weights that favour titles.
+"""
+from typing import List, Optional, Tuple
+import html
+import re
+from fastapi import HTTPException
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+from app.core.pagination import decode_cursor, encode_cursor
+
+SEARCH_TABLE = "search_index"
+KINDS = ("project", "blog")
+WEIGHTS = (10.0, 5.0, 1.0, 3.0)
+SNIPPET_TOKENS = 16
+
+# Highlight markers from the private-use area, swapped for <mark> after HTML escaping
+_OPEN, _CLOSE = "\ue000", "\ue001"
+_TERM = re.compile(r"\w+", re.UNICODE)
+
+# Kept in sync with alembic/versions/e4b7c1d9a2f6_add_search_index.py
+SEARCH_DDL = [
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5("
+    "title, summary, content, tags, tokenize = 'porter unicode61 remove_diacritics 2')",
+    f"""CREATE TRIGGER IF NOT EXISTS projects_search_insert AFTER INSERT ON projects BEGIN
+        INSERT INTO {SEARCH_TABLE}(rowid, title, summary, content, tags)
+        VALUES (new.id * 2, new.title, new.description, new.content, new.tech_stack);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS projects_search_update AFTER UPDATE OF title, description, content, tech_stack ON projects BEGIN
+        UPDATE {SEARCH_TABLE} SET title = new.title, summary = new.description, content = new.content, tags = new.tech_stack
+        WHERE rowid = new.id * 2;
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS projects_search_delete AFTER DELETE ON projects BEGIN
+        DELETE FROM {SEARCH_TABLE} WHERE rowid = old.id * 2;
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS blogs_search_insert AFTER INSERT ON blogs BEGIN
+        INSERT INTO {SEARCH_TABLE}(rowid, title, summary, content, tags)
+        VALUES (new.id * 2 + 1, new.title, new.summary, new.content, new.tags);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS blogs_search_update AFTER UPDATE OF title, summary, content, tags ON blogs BEGIN
+        UPDATE {SEARCH_TABLE} SET title = new.title, summary = new.summary, content = new.content, tags = new.tags
+        WHERE rowid = new.id * 2 + 1;
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS blogs_search_delete AFTER DELETE ON blogs BEGIN
+        DELETE FROM {SEARCH_TABLE} WHERE rowid = old.id * 2 + 1;
+    END""",
+]
+
+BACKFILL = [
+    f"INSERT INTO {SEARCH_TABLE}(rowid, title, summary, content, tags) "
+    "SELECT id * 2, title, description, content, tech_stack FROM projects",
+    f"INSERT INTO {SEARCH_TABLE}(rowid, title, summary, content, tags) "
+    "SELECT id * 2 + 1, title, summary, content, tags FROM blogs",
+]
+
+def ensure_search_index(engine: Engine) -> None:
+    """Create the FTS5 table and triggers if missing, filling a new table from existing rows."""
+    if engine.dialect.name != "sqlite":
+        return
+    with engine.begin() as connection:
+        exists = connection.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"), {"name": SEARCH_TABLE}
+        ).first()
+        for statement in SEARCH_DDL:
+            connection.execute(text(statement))
+        if not exists:
+            for statement in BACKFILL:
+                connection.execute(text(statement))
+
+def build_match_query(q: str) -> Optional[str]:
+    """Turn free text into an FTS5 query: every term must match, the last one as a prefix."""
+    terms = _TERM.findall(q)
+    if not terms:
+        return None
+    quoted = [f'"{term}"' for term in terms]
+    quoted[-1] += "*"
+    return " ".join(quoted)
+
+def _markup(value: str) -> str:
+    return html.escape(value).replace(_OPEN, "<mark>").replace(_CLOSE, "</mark>")
+
+def search(
+    connection: Connection,
+    q: str,
+    kind: Optional[str],
+    cursor: Optional[str],
+    limit: int
+) -> Tuple[List[dict], Optional[str]]:
+    """One page of matches, best first, and the cursor for the next page.
+
+    Pages are keyed on (score, rowid), so results stay stable while paging.
+    Title and snippet are HTML-escaped with matches wrapped in <mark>.
+    """
+    match = build_match_query(q)
+    if match is None:
+        return [], None
+
+    weights = ", ".join(str(weight) for weight in WEIGHTS)
+    conditions = [f"{SEARCH_TABLE} MATCH :match"]
+    params = {"match": match, "open": _OPEN, "close": _CLOSE, "limit": limit + 1}
+    if kind is not None:
+        conditions.append("rowid % 2 = :parity")
+        params["parity"] = KINDS.index(kind)
+    if cursor:
+        score, last_rowid = decode_cursor(cursor)
+        try:
+            params["score"] = float(score)
+        except (TypeError, ValueError):
+            raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+        params["last_rowid"] = last_rowid
+        conditions.append("(score > :score OR (score = :score AND rowid > :last_rowid))")
+
+    rows = connection.execute(text(f"""
+        SELECT rowid, bm25({SEARCH_TABLE}, {weights}) AS score,
+               highlight({SEARCH_TABLE}, 0, :open, :close) AS title,
+               snippet({SEARCH_TABLE}, -1, :open, :close, '…', {SNIPPET_TOKENS}) AS snippet
+        FROM {SEARCH_TABLE}
+        WHERE {" AND ".join(conditions)}
+        ORDER BY score, rowid
+        LIMIT :limit
+    """), params).all()
+
+    next_cursor = encode_cursor(repr(rows[limit - 1].score), rows[limit - 1].rowid) if len(rows) > limit else None
+    rows = rows[:limit]
+
+    slugs = {}
+    for parity, table in enumerate(("projects", "blogs")):
+        ids = [row.rowid // 2 for row in rows if row.rowid % 2 == parity]
+        if ids:
+            found = connection.execute(
+                text(f"SELECT id, slug FROM {table} WHERE id IN ({', '.join(str(i) for i in ids)})")
+            ).all()
+            slugs.update({(parity, row_id): slug for row_id, slug in found})
+
+    results = [
+        {
+            "type": KINDS[row.rowid % 2],
+            "id": row.rowid // 2,
+            "slug": slugs.get((row.rowid % 2, row.rowid // 2), ""),
+            "title": _markup(row.title or ""),
+            "snippet": _markup(row.snippet or ""),
+            "score": float(f"{-row.score:.6g}")
+        }
+        for row in rows
+    ]
+    return results, next_cursor
@@ -0,0 +1,89 @@
+"""KD-tree over scene node positions."""
+from typing import Dict, List, Sequence, Tuple
+import numpy as np
+from scipy.spatial import cKDTree
+from .neural_edges import node_key
+
+class SpatialIndex:
+    """Immutable KD-tree over node positions; rebuilt per content version.
+
+    Box queries run as an L-infinity ball query around the box centre and are
+    then trimmed to the exact box, so they touch O(log n + matches) nodes.
+    """
+
+    def __init__(self, keys: Sequence[str], positions: np.ndarray):
+        self.keys: List[str] = list(keys)
+        self.positions = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+        self.tree = cKDTree(self.positions) if len(self.keys) else None
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def within_box(self, low: Sequence[float], high: Sequence[float]) -> List[str]:
+        """Keys of nodes inside the axis-aligned box [low, high] (inclusive)."""
+        if self.tree is None:
+            return []
+        low, high = np.minimum(low, high), np.maximum(low, high)
+        center = (low + high) / 2
+        candidates = np.array(self.tree.query_ball_point(center, float((high - low).max()) / 2, p=np.inf), dtype=np.int64)
+        if candidates.size == 0:
+            return []
+        points = self.positions[candidates]
+        inside = ((points >= low) & (points <= high)).all(axis=1)
+        return [self.keys[i] for i in np.sort(candidates[inside])]
+
+    def nearest(self, point: Sequence[float], k: int) -> List[Tuple[str, float]]:
+        """Up to k (key, distance) pairs closest to point, nearest first."""
+        if self.tree is None:
+            return []
+        k = min(k, len(self.keys))
+        distances, indices = self.tree.query(np.asarray(point, dtype=np.float64), k=k)
+        distances, indices = np.atleast_1d(distances), np.atleast_1d(indices)
+        return [(self.keys[i], float(d)) for d, i in zip(distances, indices)]
+
+def index_neural_payload(payload: dict) -> Tuple[SpatialIndex, Dict[str, Tuple[str, dict]], Dict[str, List[Tuple[int, str]]]]:
+    """Build the spatial index for a neural-data payload.
+
+    Also returns a key -> (type, node) lookup and the payload's edges keyed
+    by source node as (position in payload["edges"], target) pairs.
+    """
+    nodes: Dict[str, Tuple[str, dict]] = {}
+    for kind, group in (("project", "projects"), ("blog", "blogs")):
+        for node in payload[group]:
+            nodes[node_key(kind, node["id"])] = (kind, node)
+    positions = np.array(
+        [[node["position_x"], node["position_y"], node["position_z"]] for _, node in nodes.values()],
+        dtype=np.float64
+    )
+    node_edges: Dict[str, List[Tuple[int, str]]] = {}
+    for position, edge in enumerate(payload["edges"]):
+        node_edges.setdefault(edge["source"], []).append((position, edge["target"]))
+    return SpatialIndex(list(nodes), positions), nodes, node_edges
+
+def filter_neural_payload(
+    payload: dict,
+    nodes: Dict[str, Tuple[str, dict]],
+    node_edges: Dict[str, List[Tuple[int, str]]],
+    keys: Sequence[str]
+) -> dict:
+    """Restrict a neural-data payload to the given nodes and the edges between them.
+
+    Only the given nodes and their own edges are visited, and the payload's
+    node and edge order is kept.
+    """
+    keep = set(keys)
+    groups = {"project": [], "blog": []}
+    for key in keys:
+        kind, node = nodes[key]
+        groups[kind].append(node)
+    inside = sorted(position for key in keys for position, target in node_edges.get(key, ()) if target in keep)
+    adjacency = payload["adjacency"]
+    return {
+        "projects": groups["project"],
+        "blogs": groups["blog"],
+        "edges": [payload["edges"][position] for position in inside],
+        "adjacency": {
+            key: [other for other in adjacency[key] if other in keep]
+            for key in keys if key in adjacency
+        }
+    }
@@ -0,0 +1,153 @@
+"""Normalised tag and tech stack index behind the ?tag= / ?tech= list filters and /api/facets.
+
+Blog.tags and Project.tech_stack stay the source of truth as JSON text; the
+blog_tags and project_technologies tables mirror them one row per entry so a
+filter is an index lookup instead of a scan that parses every row's JSON.
+facet_counts holds how many nodes use each value and is adjusted by the diff
+of a node's old and new values, so reading the facets never touches content.
+"""
+from collections import Counter
+from typing import Dict, Iterable, List
+import logging
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.orm import Session, load_only
+from app.core.database import SessionLocal
+from app.models import Project, Blog, BlogTag, ProjectTechnology, FacetCount
+
+logger = logging.getLogger(__name__)
+
+FACETS = ("tag", "tech")
+
+def normalize_term(value: str) -> str:
+    """Lookup form of a tag or technology: trimmed and lowercased."""
+    return value.strip().lower()
+
+def _labels(values: Iterable) -> Dict[str, str]:
+    """Map each normalised value to the first spelling it appears with."""
+    labels: Dict[str, str] = {}
+    for value in values:
+        if isinstance(value, str) and value.strip():
+            labels.setdefault(normalize_term(value), value.strip())
+    return labels
+
+def _index(kind: str):
+    """(table, node id column, value column, facet name) for a node kind."""
+    if kind == "project":
+        return ProjectTechnology, ProjectTechnology.project_id, ProjectTechnology.technology, "tech"
+    return BlogTag, BlogTag.blog_id, BlogTag.tag, "tag"
+
+def _node_labels(db: Session, kind: str, node_id: int) -> Dict[str, str]:
+    if kind == "project":
+        project = db.get(Project, node_id)
+        return _labels(project.get_tech_stack_list()) if project is not None else {}
+    blog = db.get(Blog, node_id)
+    return _labels(blog.get_tags_list()) if blog is not None else {}
+
+def adjust_facets(db: Session, facet: str, added: Dict[str, str], removed: Iterable[str]) -> None:
+    """Apply one node's value diff to facet_counts: +1 per added value, -1 per removed one."""
+    removed = list(removed)
+    if removed:
+        db.execute(
+            update(FacetCount)
+            .where(FacetCount.facet == facet, FacetCount.value.in_(removed))
+            .values(count=FacetCount.count - 1)
+        )
+        db.execute(delete(FacetCount).where(FacetCount.facet == facet, FacetCount.count <= 0))
+    if added:
+        db.execute(
+            update(FacetCount)
+            .where(FacetCount.facet == facet, FacetCount.value.in_(list(added)))
+            .values(count=FacetCount.count + 1)
+        )
+        existing = set(db.scalars(
+            select(FacetCount.value).where(FacetCount.facet == facet, FacetCount.value.in_(list(added)))
+        ))
+        new_rows = [
+            {"facet": facet, "value": value, "label": label, "count": 1}
+            for value, label in added.items() if value not in existing
+        ]
+        if new_rows:
+            db.execute(insert(FacetCount), new_rows)
+
+def sync_node_terms(db: Session, kind: str, node_id: int) -> int:
+    """Bring the index rows and facet counts of one project or blog up to date after a write or delete.
+
+    Must run after the change is flushed; returns the number of values the node now has.
+    """
+    table, id_column, value_column, facet = _index(kind)
+    labels = _node_labels(db, kind, node_id)
+    old = set(db.scalars(select(value_column).where(id_column == node_id)))
+    added = {value: label for value, label in labels.items() if value not in old}
+    removed = sorted(old - labels.keys())
+
+    if removed:
+        db.execute(delete(table).where(id_column == node_id, value_column.in_(removed)))
+    if added:
+        db.execute(insert(table), [{id_column.key: node_id, value_column.key: value} for value in sorted(added)])
+    adjust_facets(db, facet, added, removed)
+    return len(labels)
+
+def rebuild_terms(db: Session) -> int:
+    """Rebuild the index tables and facet counts from the JSON columns; returns the number of index rows stored.
+
+    A facet's label is its spelling on the lowest-id node using it.
+    """
+    db.execute(delete(ProjectTechnology))
+    db.execute(delete(BlogTag))
+    db.execute(delete(FacetCount))
+
+    stored = 0
+    sources = (
+        ("project", db.query(Project).options(load_only(Project.id, Project.tech_stack)).order_by(Project.id),
+         Project.get_tech_stack_list),
+        ("blog", db.query(Blog).options(load_only(Blog.id, Blog.tags)).order_by(Blog.id), Blog.get_tags_list),
+    )
+    for kind, query, values_of in sources:
+        table, id_column, value_column, facet = _index(kind)
+        rows, counts, labels = [], Counter(), {}
+        for node in query:
+            node_labels = _labels(values_of(node))
+            for value, label in node_labels.items():
+                rows.append({id_column.key: node.id, value_column.key: value})
+                counts[value] += 1
+                labels.setdefault(value, label)
+        if rows:
+            db.execute(insert(table), rows)
+            db.execute(insert(FacetCount), [
+                {"facet": facet, "value": value, "label": labels[value], "count": count}
+                for value, count in counts.items()
+            ])
+        stored += len(rows)
+    return stored
+
+def load_facets(db: Session) -> Dict[str, List[dict]]:
+    """Facet values by facet, most used first, as JSON-ready dicts."""
+    facets: Dict[str, List[dict]] = {facet: [] for facet in FACETS}
+    rows = db.query(FacetCount.facet, FacetCount.value, FacetCount.label, FacetCount.count).order_by(
+        FacetCount.facet, FacetCount.count.desc(), FacetCount.value
+    )
+    for facet, value, label, count in rows:
+        facets.setdefault(facet, []).append({"value": value, "label": label, "count": count})
+    return facets
+
+def projects_with_technology(technology: str):
+    """Subquery of project ids whose tech stack includes technology."""
+    return select(ProjectTechnology.project_id).where(ProjectTechnology.technology == normalize_term(technology))
+
+def blogs_with_tag(tag: str):
+    """Subquery of blog ids carrying tag."""
+    return select(BlogTag.blog_id).where(BlogTag.tag == normalize_term(tag))
+
+def backfill_terms() -> None:
+    """Fill the index tables and facet counts on startup when the counts are empty but content exists."""
+    db = SessionLocal()
+    try:
+        if db.query(FacetCount.facet).first():
+            return
+        if not db.query(Project.id).first() and not db.query(Blog.id).first():
+            return
+        count = rebuild_terms(db)
+        db.commit()
+        logger.info(f"Backfilled {count} tag and technology index rows")
+    finally:
+        db.close()
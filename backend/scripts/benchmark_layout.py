@@ -0,0 +1,60 @@
+"""Benchmark the Barnes-Hut layout engine against exact pairwise repulsion."""
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import time
+import numpy as np
+from app.services.layout import LayoutParams, compute_layout, repulsive_forces
+
+# Exact O(n^2) repulsion is skipped above this size (its n x n x 3 temporaries get too large)
+EXACT_LIMIT = 2000
+
+def exact_repulsion(positions, strength, softening):
+    """Reference all-pairs repulsion matching repulsive_forces."""
+    diff = positions[:, None, :] - positions[None, :, :]
+    dist2 = (diff * diff).sum(axis=-1) + softening
+    np.fill_diagonal(dist2, np.inf)
+    return strength * (diff / (dist2 * np.sqrt(dist2))[..., None]).sum(axis=1)
+
+def random_graph(n, rng):
+    """Random positions and roughly two edges per node."""
+    positions = rng.uniform(-10, 10, size=(n, 3))
+    edges = rng.integers(0, n, size=(2 * n, 2))
+    edges = edges[edges[:, 0] != edges[:, 1]]
+    return positions, edges, rng.uniform(0.3, 1.0, size=len(edges))
+
+def timed(fn, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def benchmark(sizes, iterations):
+    params = LayoutParams(iterations=iterations)
+    print(f"{'nodes':>8} {'bh force':>10} {'exact':>10} {'rel err':>8} {'layout':>10}")
+    for n in sizes:
+        rng = np.random.default_rng(0)
+        positions, edges, weights = random_graph(n, rng)
+
+        bh_time, bh = timed(lambda: repulsive_forces(positions, params.theta, params.repulsion, params.softening))
+        if n <= EXACT_LIMIT:
+            exact_time, exact = timed(lambda: exact_repulsion(positions, params.repulsion, params.softening))
+            error = np.linalg.norm(bh - exact, axis=1).mean() / np.linalg.norm(exact, axis=1).mean()
+            exact_col, error_col = f"{exact_time * 1000:8.1f}ms", f"{error:8.3f}"
+        else:
+            exact_col, error_col = f"{'-':>10}", f"{'-':>8}"
+
+        layout_time, _ = timed(lambda: compute_layout(positions, edges, weights, params), repeat=1)
+        print(f"{n:>8} {bh_time * 1000:8.1f}ms {exact_col} {error_col} {layout_time:9.2f}s")
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Benchmark the layout engine")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000], help="Node counts to benchmark")
+    parser.add_argument("--iterations", type=int, default=50, help="Layout iterations per run")
+    args = parser.parse_args()
+    
+    benchmark(args.sizes, args.iterations)
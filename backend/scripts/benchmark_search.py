@@ -0,0 +1,72 @@
+"""Benchmark /api/search queries against a synthetic corpus in a temporary SQLite file."""
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import random
+import tempfile
+import time
+from sqlalchemy import create_engine, insert, text as text_sql
+from app.core.database import Base
+from app.models import Project, Blog
+from app.services.search import build_match_query, ensure_search_index, search
+
+DOCUMENTS = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+# From a term in nearly every document down to one in about 1%, plus a prefix and a miss
+QUERIES = ["radiance", "neural render", "term300", "term3000", "term300 term301", "gauss", "zzzz"]
+
+def vocabulary(rng, size=5000):
+    """Zipf-like word list: a few very common words and a long tail."""
+    words = [f"term{i}" for i in range(size)]
+    words[:12] = ["neural", "render", "graph", "radiance", "fields", "gaussian", "splat",
+                  "cuda", "kernel", "optimisation", "pytorch", "mesh"]
+    weights = [1 / (i + 1) for i in range(size)]
+    return lambda k: " ".join(rng.choices(words, weights, k=k))
+
+def timed(fn, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+def main():
+    rng = random.Random(7)
+    text = vocabulary(rng)
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{directory}/search.db")
+        Base.metadata.create_all(bind=engine)
+        ensure_search_index(engine)
+
+        start = time.perf_counter()
+        with engine.begin() as connection:
+            half = DOCUMENTS // 2
+            connection.execute(insert(Project), [
+                {"title": text(4), "slug": f"p{i}", "description": text(20), "content": text(300),
+                 "tech_stack": '["Python", "CUDA"]', "position_x": 0, "position_y": 0, "position_z": 0}
+                for i in range(half)
+            ])
+            connection.execute(insert(Blog), [
+                {"title": text(6), "slug": f"b{i}", "summary": text(20), "content": text(300),
+                 "tags": '["ml"]', "position_x": 0, "position_y": 0, "position_z": 0}
+                for i in range(DOCUMENTS - half)
+            ])
+        print(f"Indexed {DOCUMENTS} documents through triggers in {time.perf_counter() - start:.1f} s")
+
+        with engine.connect() as connection:
+            print(f"{'query':<20}{'matches':>9}{'first page':>12}{'page 5':>10}{'blogs only':>12}")
+            for q in QUERIES:
+                matches = connection.execute(
+                    text_sql("SELECT count(*) FROM search_index WHERE search_index MATCH :m"), {"m": build_match_query(q)}
+                ).scalar()
+                first = timed(lambda: search(connection, q, None, None, 20))
+                cursor = None
+                for _ in range(4):
+                    _, cursor = search(connection, q, None, cursor, 20)
+                later = timed(lambda: search(connection, q, None, cursor, 20)) if cursor else float("nan")
+                blogs = timed(lambda: search(connection, q, "blog", None, 20))
+                print(f"{q:<20}{matches:>9}{first:>10.2f}ms{later:>8.2f}ms{blogs:>10.2f}ms")
+
+if __name__ == "__main__":
+    main()
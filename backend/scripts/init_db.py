@@ -4,6 +4,7 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from app.core.database import create_tables, engine, Base
+from app.services.search import ensure_search_index
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -18,6 +19,7 @@ def init_database(reset=False):
     
     logger.info("Creating tables...")
     create_tables()
+    ensure_search_index(engine)
     logger.info("Database initialized successfully")
 
 if __name__ == "__main__":
@@ -0,0 +1,28 @@
+"""Recount projects and blogs into the content_counters row behind the admin dashboard."""
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.core.database import SessionLocal
+from app.services.counters import rebuild_counters
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+def rebuild():
+    """Recount and store the counters in one transaction."""
+    db = SessionLocal()
+    try:
+        counts = rebuild_counters(db)
+        db.commit()
+        logger.info(f"Stored content counters: {counts}")
+    except Exception as e:
+        logger.error(f"Error rebuilding content counters: {e}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    rebuild()
@@ -0,0 +1,28 @@
+"""Rebuild the tag/technology index tables and facet counts from the JSON columns."""
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.core.database import SessionLocal
+from app.services.taxonomy import rebuild_terms
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+def rebuild():
+    """Rebuild the index and facet counts in one transaction."""
+    db = SessionLocal()
+    try:
+        count = rebuild_terms(db)
+        db.commit()
+        logger.info(f"Stored {count} tag and technology index rows")
+    except Exception as e:
+        logger.error(f"Error rebuilding facets: {e}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    rebuild()
@@ -0,0 +1,30 @@
+"""Recompute the neural_edges table from all projects and blogs."""
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.core.database import SessionLocal
+from app.services.change_log import record_reset
+from app.services.neural_edges import rebuild_edges
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+def rebuild():
+    """Rebuild all neural edges in one transaction."""
+    db = SessionLocal()
+    try:
+        count = rebuild_edges(db)
+        record_reset(db)
+        db.commit()
+        logger.info(f"Stored {count} neural edges")
+    except Exception as e:
+        logger.error(f"Error rebuilding neural edges: {e}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    rebuild()
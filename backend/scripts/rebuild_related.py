@@ -0,0 +1,28 @@
+"""Recompute the related_content table from all projects and blogs."""
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.core.database import SessionLocal
+from app.services.related import rebuild_related
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+def rebuild():
+    """Rebuild all related content lists in one transaction."""
+    db = SessionLocal()
+    try:
+        count = rebuild_related(db)
+        db.commit()
+        logger.info(f"Stored {count} related content entries")
+    except Exception as e:
+        logger.error(f"Error rebuilding related content: {e}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    rebuild()
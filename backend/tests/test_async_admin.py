@@ -0,0 +1,162 @@
+"""Tests for the async admin database path."""
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import asyncio
+import gc
+import time
+from datetime import datetime, timedelta
+import httpx
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+from app.main import app
+from app.core import sweeper
+from app.core.database import Base, get_async_db, get_db
+from app.core.security import create_session_token, get_session_expiry
+from app.core.sweeper import SessionSweeper
+from app.models import AdminUser, AdminSession
+from app.services import content_sync
+
+def use_private_database(monkeypatch, tmp_path) -> sessionmaker:
+    """Point the app, the derived-data refresh and the sweeper at a fresh database file.
+
+    A file rather than an in-memory database, because the sync and async
+    engines must see the same data. Returns the sync session factory.
+    """
+    path = tmp_path / "admin.db"
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(bind=engine)
+    # NullPool: connections never outlive the event loop that opened them
+    async_factory = async_sessionmaker(
+        create_async_engine(f"sqlite+aiosqlite:///{path}", poolclass=NullPool),
+        class_=AsyncSession,
+        expire_on_commit=False
+    )
+
+    def override_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    async def override_async_db():
+        async with async_factory() as db:
+            yield db
+
+    monkeypatch.setitem(app.dependency_overrides, get_db, override_db)
+    monkeypatch.setitem(app.dependency_overrides, get_async_db, override_async_db)
+    monkeypatch.setattr(content_sync, "SessionLocal", session_factory)
+    monkeypatch.setattr(sweeper, "AsyncSessionLocal", async_factory)
+    return session_factory
+
+def create_admin_session(session_factory: sessionmaker, username: str = "asyncadmin") -> str:
+    """Create an admin user (if needed) and a fresh session, returning the token."""
+    db = session_factory()
+    try:
+        admin = db.query(AdminUser).filter(AdminUser.username == username).first()
+        if not admin:
+            admin = AdminUser(username=username, password_hash="!")
+            db.add(admin)
+            db.flush()
+
+        token = create_session_token()
+        db.add(AdminSession(user_id=admin.id, session_token=token, expires_at=get_session_expiry()))
+        db.commit()
+        return token
+    finally:
+        db.close()
+
+def test_public_latency_during_admin_writes(monkeypatch, tmp_path):
+    """Concurrent admin writes do not stall the event loop serving public requests."""
+    token = create_admin_session(use_private_database(monkeypatch, tmp_path))
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport,
+            base_url="http://test",
+            cookies={"admin_session": token}
+        ) as client:
+            loop_lags = []
+            public_latencies = []
+            done = asyncio.Event()
+
+            async def public_traffic():
+                while not done.is_set():
+                    start = time.perf_counter()
+                    response = await client.get("/api/projects")
+                    public_latencies.append(time.perf_counter() - start)
+                    assert response.status_code == 200
+                    await asyncio.sleep(0.005)
+
+            async def loop_probe():
+                while not done.is_set():
+                    start = time.perf_counter()
+                    await asyncio.sleep(0.005)
+                    loop_lags.append(time.perf_counter() - start - 0.005)
+
+            async def admin_write(i: int):
+                response = await client.post("/api/admin/projects", json={
+                    "title": f"Async Project {i}",
+                    "slug": f"async-project-{i}",
+                    "description": "Created while measuring public latency",
+                    "tech_stack": ["Python"],
+                    "position_x": 0.0,
+                    "position_y": 0.0,
+                    "position_z": 0.0
+                })
+                assert response.status_code == 201
+                response = await client.delete(f"/api/admin/projects/{response.json()['id']}")
+                assert response.status_code == 200
+
+            # Warm up both paths, so one-off first-request costs are not measured
+            await admin_write(-1)
+            assert (await client.get("/api/projects")).status_code == 200
+            
+            background = [asyncio.create_task(public_traffic()), asyncio.create_task(loop_probe())]
+            await asyncio.gather(*(admin_write(i) for i in range(20)))
+            done.set()
+            await asyncio.gather(*background)
+            return loop_lags, public_latencies
+
+    # Start from a clean heap, so a full collection of objects left by earlier
+    # tests does not land inside the measured window
+    gc.collect()
+    loop_lags, public_latencies = asyncio.run(scenario())
+
+    assert public_latencies
+    assert max(loop_lags) < 0.1
+    assert max(public_latencies) < 0.25
+
+def test_session_sweeper_deletes_expired_in_batches(monkeypatch, tmp_path):
+    """Expired sessions are removed across several bounded batches; live ones survive."""
+    session_factory = use_private_database(monkeypatch, tmp_path)
+    live_token = create_admin_session(session_factory, "sweepadmin")
+    db = session_factory()
+    try:
+        admin = db.query(AdminUser).filter(AdminUser.username == "sweepadmin").first()
+        for _ in range(5):
+            db.add(AdminSession(
+                user_id=admin.id,
+                session_token=create_session_token(),
+                expires_at=datetime.utcnow() - timedelta(minutes=1)
+            ))
+        db.commit()
+    finally:
+        db.close()
+
+    session_sweeper = SessionSweeper(interval_seconds=60, batch_size=2)
+    assert asyncio.run(session_sweeper.sweep_once()) == 5
+    assert session_sweeper.stats()["total_swept"] == 5
+
+    db = session_factory()
+    try:
+        assert db.query(AdminSession).filter(AdminSession.expires_at < datetime.utcnow()).count() == 0
+        assert db.query(AdminSession).filter(AdminSession.session_token == live_token).count() == 1
+    finally:
+        db.close()
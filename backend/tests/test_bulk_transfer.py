@@ -0,0 +1,89 @@
+"""Tests for NDJSON bulk import."""
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import asyncio
+import json
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from app.core.database import Base
+from app.models import Blog
+from app.core.config import settings
+from app.services import bulk_transfer
+from app.services.bulk_transfer import ImportResult, import_ndjson, prepare_rows, read_lines, write_rows
+
+def blog_line(slug, title="t", **fields):
+    return json.dumps({"title": title, "slug": slug, "content": f"# {title}\n\nbody", "tags": ["ML"],
+                       "position_x": 0, "position_y": 0, "position_z": 0, **fields}).encode()
+
+async def collect(chunks, max_line_bytes):
+    async def stream():
+        for chunk in chunks:
+            yield chunk
+    return [item async for item in read_lines(stream(), max_line_bytes)]
+
+def test_read_lines_across_chunk_boundaries():
+    lines = asyncio.run(collect([b'{"a"', b':1}\n{"b":2}\n', b"x" * 30, b"y\nlast"], max_line_bytes=20))
+    assert lines == [(1, b'{"a":1}'), (2, b'{"b":2}'), (3, None), (4, b"last")]
+
+def test_prepare_rows_validates_and_renders():
+    result = ImportResult()
+    rows = prepare_rows("blog", [(1, blog_line("a", "Hello")), (2, b"{not json"), (3, b'{"title": "x"}'), (4, None)], result)
+    assert [number for number, _ in rows] == [1]
+    row = rows[0][1]
+    assert row["tags"] == '["ML"]'
+    assert row["content_html"].startswith('<h1 id="hello">')
+    assert row["word_count"] == 2
+    assert "position_mode" not in row
+    assert [error["line"] for error in result.errors] == [2, 3, 4]
+    assert result.errors[1]["detail"] == "slug: Field required"
+
+def test_write_rows_resolves_slug_conflicts():
+    async def scenario():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        async with AsyncSession(engine, expire_on_commit=False) as db:
+            first = ImportResult()
+            lines = [(1, blog_line("a")), (2, blog_line("b")), (3, blog_line("a", "again"))]
+            await write_rows(db, "blog", prepare_rows("blog", lines, first), replace=False, result=first)
+
+            second = ImportResult()
+            lines = [(1, blog_line("b", "new b")), (2, blog_line("c")), (3, blog_line("c", "new c"))]
+            await write_rows(db, "blog", prepare_rows("blog", lines, second), replace=True, result=second)
+
+            titles = dict((await db.execute(select(Blog.slug, Blog.title).order_by(Blog.slug))).all())
+        await engine.dispose()
+        return first, second, titles
+
+    first, second, titles = asyncio.run(scenario())
+    assert (first.created, first.updated, first.skipped) == (2, 0, 1)
+    assert (second.created, second.updated, second.skipped) == (1, 1, 0)
+    assert titles == {"a": "t", "b": "new b", "c": "new c"}
+
+def test_failed_import_raises_its_own_error(monkeypatch):
+    """A failing refresh after a failed import is logged instead of replacing the import's error."""
+    def broken_refresh():
+        raise RuntimeError("refresh failed")
+
+    monkeypatch.setattr(settings, "BULK_CHUNK_SIZE", 1)
+    monkeypatch.setattr(bulk_transfer, "refresh_derived", broken_refresh)
+
+    async def chunks():
+        yield blog_line("a") + b"\n"
+        raise ValueError("connection lost")
+
+    async def scenario():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        try:
+            async with AsyncSession(engine, expire_on_commit=False) as db:
+                await import_ndjson(db, "blog", chunks())
+        finally:
+            await engine.dispose()
+
+    with pytest.raises(ValueError, match="connection lost"):
+        asyncio.run(scenario())
@@ -0,0 +1,109 @@
+"""Tests for the in-process content cache."""
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import gzip
+import json
+from app.core.cache import LRUCache, ContentCache
+from app.core.snapshots import build_json_snapshot
+from app.core.http_cache import content_etag, is_not_modified
+from starlette.requests import Request
+
+def make_request(headers: dict) -> Request:
+    """Build a bare GET request carrying the given headers."""
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "headers": [(k.lower().encode(), v.encode()) for k, v in headers.items()]
+    })
+
+def test_lru_eviction():
+    """Least recently used entries are evicted once the cache is full."""
+    cache = LRUCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["hits"] == 3
+    assert stats["misses"] == 1
+
+def test_content_cache_version_invalidation():
+    """Bumping the content version forces the next read to rebuild."""
+    cache = ContentCache(max_entries=8)
+    calls = []
+
+    def factory():
+        calls.append(1)
+        return len(calls)
+
+    assert cache.get_or_set("projects:list", factory) == 1
+    assert cache.get_or_set("projects:list", factory) == 1
+    assert len(calls) == 1
+
+    cache.bump_version()
+    assert cache.get_or_set("projects:list", factory) == 2
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 2
+
+def test_content_cache_factory_error_not_cached():
+    """Exceptions raised while building a value leave nothing cached."""
+    cache = ContentCache(max_entries=8)
+
+    def failing():
+        raise ValueError("boom")
+
+    try:
+        cache.get_or_set("pages:missing", failing)
+    except ValueError:
+        pass
+    assert len(cache) == 0
+
+def test_json_snapshot_roundtrip():
+    """Snapshots hold identical payloads in plain and gzip form."""
+    payload = {"projects": [{"id": 1, "title": "Test"}], "blogs": []}
+    snapshot = build_json_snapshot(payload)
+
+    assert json.loads(snapshot.body) == payload
+    assert gzip.decompress(snapshot.gzip_body) == snapshot.body
+
+def test_if_none_match_handling():
+    """Matching, weak and list-valued If-None-Match headers short-circuit to 304."""
+    etag = content_etag([{"id": 1, "title": "Test"}])
+
+    assert is_not_modified(make_request({"If-None-Match": etag}), etag)
+    assert is_not_modified(make_request({"If-None-Match": f'"other", W/{etag}'}), etag)
+    assert is_not_modified(make_request({"If-None-Match": "*"}), etag)
+    assert not is_not_modified(make_request({"If-None-Match": '"other"'}), etag)
+    assert not is_not_modified(make_request({}), etag)
+
+def test_etag_follows_content():
+    """ETags depend only on the content, so every process derives the same one."""
+    from app.core.cache import bump_content_version
+
+    payload = {"title": "Test", "slug": "test-blog"}
+    before = content_etag(payload)
+    bump_content_version()
+    assert content_etag(dict(reversed(list(payload.items())))) == before
+    assert content_etag({**payload, "title": "Edited"}) != before
+    assert content_etag(payload, "gzip") != before
+
+def test_search_cache_is_separate_but_invalidated_together():
+    """Search entries never evict content entries, and a content write clears both caches."""
+    from app.core.cache import bump_content_version, content_cache, search_cache
+
+    content_cache.get_or_set("test:scene", lambda: "scene")
+    for i in range(search_cache.max_entries + 10):
+        search_cache.get_or_set(f"search:{i}", lambda: i)
+    assert content_cache.get_or_set("test:scene", lambda: "rebuilt") == "scene"
+
+    bump_content_version()
+    assert search_cache.get_or_set("search:0", lambda: "fresh") == "fresh"
+    assert content_cache.get_or_set("test:scene", lambda: "rebuilt") == "rebuilt"
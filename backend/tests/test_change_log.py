@@ -0,0 +1,72 @@
+"""Tests for the neural-data change log."""
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.core.database import Base
+from app.models import Project, Blog, ContentChange
+from app.services.change_log import current_version, load_changes, record_reset
+from app.services.content_sync import sync_content_change
+
+def make_session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine)()
+
+def add_project(db, slug, techs):
+    project = Project(title=slug, slug=slug, description="", position_x=0, position_y=0, position_z=0)
+    project.set_tech_stack_list(techs)
+    db.add(project)
+    db.flush()
+    sync_content_change(db, "project", project.id)
+    return project
+
+def test_changes_since_version_with_tombstones():
+    """Deltas carry final node states, tombstones and every edge touching a changed node."""
+    db = make_session()
+    assert current_version(db) == 0 and load_changes(db, 0) is None
+
+    first = add_project(db, "first", ["Python", "CUDA"])
+    second = add_project(db, "second", ["Python", "CUDA"])
+    blog = Blog(title="Post", slug="post", content="x", summary="", position_x=0, position_y=0, position_z=0)
+    db.add(blog)
+    db.flush()
+    sync_content_change(db, "blog", blog.id)
+    version = current_version(db)
+    assert version == 3
+
+    second.title = "second v2"
+    db.flush()
+    sync_content_change(db, "project", second.id)
+    db.delete(blog)
+    db.flush()
+    sync_content_change(db, "blog", blog.id)
+
+    changes = load_changes(db, version)
+    assert changes["version"] == 5
+    assert [p.title for p in changes["projects"]] == ["second v2"]
+    assert changes["blogs"] == []
+    assert changes["deleted"] == ["blog-1"]
+    assert changes["changed"] == ["blog-1", "project-2"]
+    assert [(e.source, e.target) for e in changes["edges"]] == [("project-1", "project-2")]
+
+    assert load_changes(db, 5)["changed"] == []
+    assert load_changes(db, 6) is None
+
+def test_reset_and_compaction_force_full_sync():
+    """A logged reset or a compacted gap sends clients back to a full snapshot."""
+    db = make_session()
+    for i in range(4):
+        add_project(db, f"p{i}", [])
+    assert load_changes(db, 1) is not None
+
+    db.query(ContentChange).filter(ContentChange.id <= 2).delete()
+    assert load_changes(db, 1) is None
+    assert load_changes(db, 2) is not None
+
+    record_reset(db)
+    db.flush()
+    assert load_changes(db, 3) is None
+    assert load_changes(db, current_version(db)) is not None
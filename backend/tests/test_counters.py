@@ -0,0 +1,64 @@
+"""Tests for the content counters behind dashboard stats."""
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.core.database import Base
+from app.models import Project, Blog, ContentCounter
+from app.services.content_sync import sync_content_change
+from app.services.counters import count_content, load_counters, node_counts, rebuild_counters
+
+def make_session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine)()
+
+def add_blog(db, slug, published):
+    blog = Blog(title=slug, slug=slug, content=slug, published=published, position_x=0, position_y=0, position_z=0)
+    db.add(blog)
+    db.flush()
+    sync_content_change(db, "blog", blog.id)
+    return blog
+
+def test_missing_row_falls_back_to_aggregate_query():
+    db = make_session()
+    assert set(load_counters(db).values()) == {0}
+    db.add(Project(title="p", slug="p", description="d", tech_stack="[]", featured=True, position_x=0, position_y=0, position_z=0))
+    add_blog(db, "draft", False)
+    assert load_counters(db) == {
+        "total_projects": 1, "featured_projects": 1, "total_blogs": 1, "published_blogs": 0, "draft_blogs": 1
+    }
+    assert db.query(ContentCounter).count() == 0
+
+def test_writes_adjust_counters_row():
+    db = make_session()
+    rebuild_counters(db)
+    first = add_blog(db, "first", True)
+    add_blog(db, "second", False)
+    project = Project(title="p", slug="p", description="d", tech_stack="[]", position_x=0, position_y=0, position_z=0)
+    db.add(project)
+    db.flush()
+    sync_content_change(db, "project", project.id)
+
+    previous = node_counts(first)
+    first.published = False
+    db.flush()
+    sync_content_change(db, "blog", first.id, previous)
+
+    previous = node_counts(project)
+    project.featured = True
+    db.flush()
+    sync_content_change(db, "project", project.id, previous)
+
+    previous = node_counts(first)
+    db.delete(first)
+    db.flush()
+    sync_content_change(db, "blog", first.id, previous)
+
+    stored = load_counters(db)
+    assert stored == {
+        "total_projects": 1, "featured_projects": 1, "total_blogs": 1, "published_blogs": 0, "draft_blogs": 1
+    }
+    assert stored == count_content(db)
@@ -0,0 +1,110 @@
+"""Tests for the content event broker behind /api/events."""
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import asyncio
+import json
+import pytest
+from fastapi import HTTPException
+from app.core.events import EventBroker, format_event
+from app.api.routes.events import get_events, stream_events
+
+def parse(message: bytes) -> dict:
+    fields = dict(line.split(": ", 1) for line in message.decode().strip().split("\n"))
+    return {**fields, "data": json.loads(fields["data"])}
+
+def test_broker_fans_out_and_bounds_queues():
+    """Every subscriber gets each event; a full queue collapses to one resync event."""
+    async def scenario():
+        broker = EventBroker(queue_size=2, max_subscribers=2)
+        fast, slow = broker.subscribe(), broker.subscribe()
+        assert broker.subscribe() is None
+
+        broker.publish("content", {"type": "blog", "id": 1, "slug": "a", "action": "created", "version": 2})
+        event = parse(await fast.get())
+        assert event["id"] == broker.last_event_id and event["event"] == "content" and event["data"]["slug"] == "a"
+
+        for version in range(3, 5):
+            broker.publish("content", {"version": version})
+        assert slow.qsize() == 1
+        resync = parse(slow.get_nowait())
+        assert resync["event"] == "resync" and resync["id"] == broker.last_event_id
+        assert fast.qsize() == 2
+        assert broker.stats()["overflows"] == 1
+
+        broker.unsubscribe(fast)
+        assert broker.publish("content", {}) == 1
+        broker.close()
+        assert slow.get_nowait() is None
+        assert broker.stats()["subscribers"] == 0
+
+    asyncio.run(scenario())
+
+def test_stream_sends_heartbeats_and_unsubscribes(monkeypatch):
+    """Idle streams emit comment heartbeats and leave the broker when closed."""
+    from app.core import config
+    from app.api.routes import events
+    monkeypatch.setattr(config.settings, "EVENTS_HEARTBEAT_SECONDS", 0.01)
+    broker = EventBroker(queue_size=4, max_subscribers=10)
+    monkeypatch.setattr(events, "content_events", broker)
+
+    async def scenario():
+        stream = stream_events(broker.last_event_id)
+        assert (await stream.__anext__()).startswith(b"retry: ")
+        assert broker.stats()["subscribers"] == 1
+        assert await stream.__anext__() == b": ping\n\n"
+        broker.publish("content", {"version": 9})
+        assert await stream.__anext__() == format_event("content", {"version": 9}, broker.last_event_id)
+        await stream.aclose()
+        assert broker.stats()["subscribers"] == 0
+
+    asyncio.run(scenario())
+
+def test_reconnect_resyncs_unless_last_event_id_is_current(monkeypatch):
+    """A stream starts with a resync unless Last-Event-ID names the latest event."""
+    from app.api.routes import events
+    broker = EventBroker(queue_size=4, max_subscribers=10)
+    monkeypatch.setattr(events, "content_events", broker)
+
+    async def first_message(last_event_id):
+        response = await get_events(last_event_id)
+        body = response.body_iterator
+        assert (await body.__anext__()).startswith(b"retry: ")
+        broker.publish("content", {"version": 1})
+        message = parse(await body.__anext__())
+        await body.aclose()
+        return message
+
+    async def scenario():
+        first = await first_message(None)
+        assert first["event"] == "resync" and first["data"]["reason"] == "new stream"
+
+        current = broker.last_event_id
+        assert (await first_message(current))["event"] == "content"
+        assert (await first_message("stale-1"))["data"]["reason"] == "missed events"
+        assert (await first_message(current))["event"] == "resync"
+
+    asyncio.run(scenario())
+
+def test_unstarted_stream_holds_no_subscription(monkeypatch):
+    """Subscribing waits for the stream to start, so a client gone before that leaks nothing."""
+    from app.api.routes import events
+    broker = EventBroker(queue_size=4, max_subscribers=1)
+    monkeypatch.setattr(events, "content_events", broker)
+
+    async def scenario():
+        abandoned = await get_events(None)
+        assert broker.stats()["subscribers"] == 0
+        del abandoned
+
+        response = await get_events(None)
+        body = response.body_iterator
+        await body.__anext__()
+        with pytest.raises(HTTPException) as exc:
+            await get_events(None)
+        assert exc.value.status_code == 503
+        await body.aclose()
+        assert broker.stats()["subscribers"] == 0
+
+    asyncio.run(scenario())
@@ -0,0 +1,63 @@
+"""Tests for incrementally maintained facet counts."""
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.core.database import Base
+from app.models import Project, Blog, FacetCount
+from app.services.content_sync import sync_content_change
+from app.services.taxonomy import load_facets, rebuild_terms
+
+def make_session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine)()
+
+def add_project(db, slug, techs):
+    project = Project(title=slug, slug=slug, description="", position_x=0, position_y=0, position_z=0)
+    project.set_tech_stack_list(techs)
+    db.add(project)
+    db.flush()
+    sync_content_change(db, "project", project.id)
+    return project
+
+def counts(db):
+    return {(f["value"], f["label"], f["count"]) for f in load_facets(db)["tech"]}
+
+def test_writes_adjust_counts_by_diff():
+    """Creates, edits and deletes move only the values that changed."""
+    db = make_session()
+    first = add_project(db, "first", ["Python", "PyTorch"])
+    add_project(db, "second", ["python", "FastAPI"])
+    assert counts(db) == {("python", "Python", 2), ("pytorch", "PyTorch", 1), ("fastapi", "FastAPI", 1)}
+    assert [f["value"] for f in load_facets(db)["tech"]][0] == "python"
+
+    first.set_tech_stack_list(["Python", "JAX"])
+    db.flush()
+    sync_content_change(db, "project", first.id)
+    assert counts(db) == {("python", "Python", 2), ("jax", "JAX", 1), ("fastapi", "FastAPI", 1)}
+
+    db.delete(first)
+    db.flush()
+    sync_content_change(db, "project", first.id)
+    assert counts(db) == {("python", "Python", 1), ("fastapi", "FastAPI", 1)}
+
+    blog = Blog(title="b", slug="b", content="x", position_x=0, position_y=0, position_z=0)
+    blog.set_tags_list(["ML"])
+    db.add(blog)
+    db.flush()
+    sync_content_change(db, "blog", blog.id)
+    assert load_facets(db)["tag"] == [{"value": "ml", "label": "ML", "count": 1}]
+
+def test_rebuild_repairs_drift():
+    """A rebuild recomputes every count from the JSON columns."""
+    db = make_session()
+    add_project(db, "first", ["Python"])
+    add_project(db, "second", ["Rust"])
+    db.query(FacetCount).filter(FacetCount.value == "python").update({"count": 7})
+    db.query(FacetCount).filter(FacetCount.value == "rust").delete()
+
+    rebuild_terms(db)
+    assert counts(db) == {("python", "Python", 1), ("rust", "Rust", 1)}
@@ -0,0 +1,40 @@
+"""Tests for the packed binary neural-data encoding."""
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+import orjson
+from app.services.graph_binary import HEADER, decode_neural_graph, encode_neural_graph
+
+def test_binary_graph_roundtrip_and_alignment():
+    """Positions, ids, edges and strings survive encoding; numeric sections stay 4-byte aligned."""
+    def node(node_id, title, x):
+        return {"id": node_id, "slug": f"slug-{node_id}", "title": title, "description": "long text " * 20,
+                "position_x": x, "position_y": -x, "position_z": 0.5}
+
+    payload = {
+        "projects": [node(3, "Neural Net", 1.25), node(7, "Web app", -2.0)],
+        "blogs": [node(3, "Training ✓", 4.0)],
+        "edges": [
+            {"source": "project-3", "target": "blog-3", "kind": "content", "strength": 0.5},
+            {"source": "project-3", "target": "project-7", "kind": "tech", "strength": 0.25},
+            {"source": "project-3", "target": "blog-99", "kind": "content", "strength": 0.9}
+        ],
+        "adjacency": {}
+    }
+    body = encode_neural_graph(payload)
+    graph = decode_neural_graph(body)
+
+    assert (graph["projects"], graph["blogs"]) == (2, 1)
+    assert np.allclose(graph["positions"], [[1.25, -1.25, 0.5], [-2.0, 2.0, 0.5], [4.0, -4.0, 0.5]])
+    assert graph["ids"].tolist() == [3, 7, 3]
+    assert graph["endpoints"].tolist() == [[0, 2], [0, 1]]
+    assert np.allclose(graph["strengths"], [0.5, 0.25])
+    assert [graph["strings"]["kinds"][k] for k in graph["kinds"]] == ["content", "tech"]
+    assert graph["strings"]["titles"] == ["Neural Net", "Web app", "Training ✓"]
+
+    numeric = HEADER.size + 3 * 12 + 3 * 4 + 2 * 8 + 2 * 4
+    assert numeric % 4 == 0
+    assert body[numeric:numeric + 4] == b"\0\1\0\0"
+    assert len(body) < len(orjson.dumps(payload)) / 2
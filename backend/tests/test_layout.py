@@ -0,0 +1,70 @@
+"""Tests for the Barnes-Hut layout engine."""
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from app.core.database import Base
+from app.models import Project
+from app.services import layout
+from app.services.layout import SCENE_BOUNDS, LayoutParams, compute_layout, repulsive_forces, run_layout
+
+def exact_repulsion(positions, strength=1.0, softening=0.05):
+    diff = positions[:, None, :] - positions[None, :, :]
+    dist2 = (diff * diff).sum(axis=-1) + softening
+    np.fill_diagonal(dist2, np.inf)
+    return strength * (diff / (dist2 * np.sqrt(dist2))[..., None]).sum(axis=1)
+
+def test_barnes_hut_matches_exact_repulsion():
+    """The octree approximation stays within a few percent and tightens as theta shrinks."""
+    positions = np.random.default_rng(1).uniform(-10, 10, size=(300, 3))
+    exact = exact_repulsion(positions)
+
+    def relative_error(theta):
+        approx = repulsive_forces(positions, theta, 1.0, 0.05)
+        return np.linalg.norm(approx - exact, axis=1).mean() / np.linalg.norm(exact, axis=1).mean()
+
+    assert relative_error(0.3) < relative_error(0.8) < 0.05
+
+def test_layout_is_deterministic_and_warm_starts():
+    """Same seed gives the same layout; a warm start refines it without reshuffling."""
+    positions = np.full((40, 3), np.nan)
+    edges = np.array([[i, i + 1] for i in range(39)])
+    weights = np.full(len(edges), 0.5)
+
+    first = compute_layout(positions, edges, weights, LayoutParams(iterations=80))
+    second = compute_layout(positions, edges, weights, LayoutParams(iterations=80))
+    assert np.array_equal(first, second)
+    assert (first >= SCENE_BOUNDS[:, 0]).all() and (first <= SCENE_BOUNDS[:, 1]).all()
+
+    refined = compute_layout(first, edges, weights, LayoutParams(iterations=20))
+    assert np.abs(refined - first).max() < 1.0
+
+def test_run_layout_writes_positions(monkeypatch):
+    """The layout job stores new positions for every project."""
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(bind=engine)
+    monkeypatch.setattr(layout, "SessionLocal", session_factory)
+
+    db = session_factory()
+    try:
+        slugs = ["layout-a", "layout-b"]
+        for slug in slugs:
+            project = Project(title=slug, slug=slug, description="layout", position_x=0, position_y=0, position_z=0)
+            project.set_tech_stack_list(["Python"])
+            db.add(project)
+        db.commit()
+
+        result = run_layout(LayoutParams(iterations=30))
+        assert result["nodes"] == 2
+
+        db.expire_all()
+        placed = [db.query(Project).filter(Project.slug == slug).one() for slug in slugs]
+        assert (placed[0].position_x, placed[0].position_y) != (placed[1].position_x, placed[1].position_y)
+    finally:
+        db.close()
+        engine.dispose()
@@ -0,0 +1,57 @@
+"""Tests for the level-of-detail cluster hierarchy."""
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+from app.services.lod import BRANCHING, build_lod_levels, minibatch_kmeans
+
+def test_minibatch_kmeans_finds_separated_blobs():
+    """Well separated blobs end up as one cluster each."""
+    rng = np.random.default_rng(0)
+    centres = np.array([[-8.0, 0.0, 0.0], [8.0, 0.0, 0.0], [0.0, 6.0, 6.0]])
+    points = np.concatenate([centre + rng.normal(0, 0.3, size=(100, 3)) for centre in centres])
+
+    centroids, labels = minibatch_kmeans(points, 3)
+    assert len(centroids) == 3
+    for blob in range(3):
+        assert len(set(labels[blob * 100:(blob + 1) * 100])) == 1
+    assert np.allclose(np.sort(centroids[:, 0]), [-8, 0, 8], atol=0.2)
+
+def test_hierarchy_levels_shrink_and_aggregate_edges():
+    """Every level covers all nodes, links to its parent level and drops intra-cluster edges."""
+    rng = np.random.default_rng(1)
+    positions = rng.uniform(-10, 10, size=(600, 3))
+    payload = {
+        "projects": [
+            {"id": i, "title": f"Project {i}", "position_x": x, "position_y": y, "position_z": z}
+            for i, (x, y, z) in enumerate(positions[:200])
+        ],
+        "blogs": [
+            {"id": i, "title": f"Blog {i}", "position_x": x, "position_y": y, "position_z": z}
+            for i, (x, y, z) in enumerate(positions[200:])
+        ],
+        "edges": [
+            {"source": f"project-{a}", "target": f"blog-{b}", "kind": "content", "strength": 0.5}
+            for a, b in zip(range(200), range(0, 400, 2))
+        ]
+    }
+
+    levels = build_lod_levels(payload)
+    assert [level["level"] for level in levels] == list(range(1, len(levels) + 1))
+    assert len(levels[0]["clusters"]) <= 600 // BRANCHING + 1
+    assert len(levels[-1]["clusters"]) <= BRANCHING
+
+    for level, coarser in zip(levels, levels[1:] + [None]):
+        clusters = level["clusters"]
+        assert sum(c["count"] for c in clusters) == 600
+        assert sum(c["projects"] for c in clusters) == 200
+        ids = {c["id"] for c in clusters}
+        assert all(e["source"] in ids and e["target"] in ids and e["source"] != e["target"] for e in level["edges"])
+        if coarser:
+            parents = {c["id"] for c in coarser["clusters"]}
+            assert all(c["parent"] in parents for c in clusters)
+            assert sum(e["count"] for e in coarser["edges"]) <= sum(e["count"] for e in level["edges"])
+
+    assert build_lod_levels(payload) == levels
+    assert build_lod_levels({"projects": [], "blogs": [], "edges": []}) == []
@@ -0,0 +1,95 @@
+"""Tests for server-side neural edge computation."""
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import random
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.core.database import Base
+from app.models import Project, Blog, NeuralEdge
+from app.services.neural_edges import (
+    extract_keywords, content_edges, tech_edges, sync_node_edges, rebuild_edges, load_graph
+)
+
+WORDS = ["neural", "mesh", "pytorch", "cuda", "render", "graph", "vision", "pose", "radiance", "fields", "the", "and"]
+TECHS = ["Python", "PyTorch", "CUDA", "OpenGL", "JAX", "NumPy"]
+
+def make_session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine)()
+
+def reference_jaccard(a, b):
+    a, b = set(a), set(b)
+    return len(a & b) / len(a | b) if a and b else 0.0
+
+def random_content(db, rng, projects=12, blogs=10):
+    for i in range(projects):
+        project = Project(
+            title=" ".join(rng.sample(WORDS, 3)), slug=f"p{i}", description=" ".join(rng.sample(WORDS, 4)),
+            position_x=0, position_y=0, position_z=0
+        )
+        project.set_tech_stack_list(rng.sample(TECHS, rng.randint(0, 3)))
+        db.add(project)
+    for i in range(blogs):
+        db.add(Blog(
+            title=" ".join(rng.sample(WORDS, 3)), slug=f"b{i}", content="x", summary=" ".join(rng.sample(WORDS, 3)),
+            position_x=0, position_y=0, position_z=0
+        ))
+    db.flush()
+
+def test_extract_keywords_matches_frontend_rules():
+    """Punctuation splits words; short words and stop words are dropped."""
+    assert extract_keywords("The GPU-accelerated NeRF, with C++ and 3D!") == ["gpu", "accelerated", "nerf"]
+
+def test_edges_match_pairwise_reference():
+    """Sparse computation agrees with a naive pairwise Jaccard."""
+    db = make_session()
+    random_content(db, random.Random(3))
+    projects, blogs = db.query(Project).all(), db.query(Blog).all()
+
+    edges = {(s, t): w for s, t, _, w in content_edges(projects, blogs) + tech_edges(projects, projects)}
+
+    expected = {}
+    for p in projects:
+        for b in blogs:
+            sim = reference_jaccard(
+                extract_keywords(f"{p.title} {p.description}"), extract_keywords(f"{b.title} {b.summary}")
+            )
+            if sim > 0.3:
+                expected[(f"project-{p.id}", f"blog-{b.id}")] = round(sim, 4)
+    for p in projects:
+        for q in projects:
+            sim = reference_jaccard([t.lower() for t in p.get_tech_stack_list()], [t.lower() for t in q.get_tech_stack_list()])
+            if p.id < q.id and sim > 0.4:
+                expected[(f"project-{p.id}", f"project-{q.id}")] = round(sim * 0.8, 4)
+
+    assert edges == expected
+
+def test_incremental_sync_matches_rebuild():
+    """Per-row recomputation after writes and deletes leaves the same edges as a full rebuild."""
+    rng = random.Random(7)
+    db = make_session()
+    random_content(db, rng)
+    rebuild_edges(db)
+
+    project = db.query(Project).first()
+    project.description = "neural mesh pytorch cuda"
+    project.set_tech_stack_list(["Python", "CUDA"])
+    db.flush()
+    sync_node_edges(db, "project", project.id)
+
+    blog = db.query(Blog).first()
+    db.delete(blog)
+    db.flush()
+    sync_node_edges(db, "blog", blog.id)
+
+    incremental = sorted((e.source, e.target, e.strength) for e in db.query(NeuralEdge).all())
+    rebuild_edges(db)
+    assert incremental == sorted((e.source, e.target, e.strength) for e in db.query(NeuralEdge).all())
+
+    edges, adjacency = load_graph(db)
+    for edge in edges:
+        assert edge.target in adjacency[edge.source]
+        assert edge.source in adjacency[edge.target]
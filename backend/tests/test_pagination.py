@@ -0,0 +1,25 @@
+"""Tests for keyset pagination cursors."""
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from datetime import datetime
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import select
+from app.core.pagination import apply_keyset, decode_cursor, encode_cursor
+from app.models import Blog
+
+def test_cursor_round_trip():
+    created = datetime(2024, 5, 1, 12, 30)
+    assert decode_cursor(encode_cursor(created, 7)) == (created.isoformat(), 7)
+    assert decode_cursor(encode_cursor(created, 7), parse_datetime=True) == (created, 7)
+
+def test_malformed_cursor_is_a_client_error():
+    """Garbage, wrong shapes and unparseable timestamps all give 400, never 500."""
+    cases = [("sqlite", "not-a-cursor"), ("sqlite", encode_cursor(1, 2)), ("postgresql", encode_cursor("yesterday", 2))]
+    for dialect, cursor in cases:
+        with pytest.raises(HTTPException) as exc:
+            apply_keyset(select(Blog), Blog.created_at, Blog.id, cursor, 10, dialect)
+        assert exc.value.status_code == 400
+        assert exc.value.detail == "Invalid pagination cursor"
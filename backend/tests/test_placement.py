@@ -0,0 +1,101 @@
+"""Tests for TF-IDF/SVD auto-placement."""
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import asyncio
+import time
+import httpx
+import numpy as np
+from app.services.layout import SCENE_BOUNDS
+from app.services.placement import PlacementModel
+
+TOPICS = {
+    "ml": "neural network pytorch training gradient model deep learning tensor".split(),
+    "web": "react frontend css html browser javascript component server api".split(),
+    "graphics": "rendering shader opengl mesh vertex lighting texture gpu raster".split()
+}
+
+def corpus(size=90):
+    rng = np.random.default_rng(0)
+    names = list(TOPICS)
+    return [" ".join(rng.choice(TOPICS[names[i % 3]], 10)) for i in range(size)]
+
+def distance(a, b):
+    return float(np.linalg.norm(np.subtract(a, b)))
+
+def test_related_documents_are_placed_together():
+    """New documents land nearer to their own topic than to other topics."""
+    model = PlacementModel(corpus())
+    ml = model.place("pytorch training of a deep neural network")
+    ml_other = model.place("gradient descent for tensor models")
+    web = model.place("react component styling with css")
+
+    assert distance(ml, ml_other) < distance(ml, web)
+    for coords in (ml, ml_other, web):
+        assert all(low <= value <= high for value, (low, high) in zip(coords, SCENE_BOUNDS))
+
+def test_placement_is_incremental_and_deterministic():
+    """Placing is a cheap projection into a fixed basis; refits of the same corpus agree."""
+    model = PlacementModel(corpus())
+    start = time.perf_counter()
+    for _ in range(50):
+        placed = model.place("opengl shader lighting")
+    assert (time.perf_counter() - start) / 50 < 0.01
+
+    assert PlacementModel(corpus()).place("opengl shader lighting") == placed
+    assert PlacementModel([]).place("anything") == (0.0, 0.0, 0.0)
+
+def test_blog_update_with_auto_position_moves_blog(monkeypatch, tmp_path):
+    """PUT /api/admin/blogs/{id} with position_mode "auto" re-places the blog from its text."""
+    from sqlalchemy import create_engine
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+    from sqlalchemy.orm import sessionmaker
+    from app.main import app
+    from app.core.database import Base, get_async_db
+    from app.core.sessions import AdminPrincipal
+    from app.api.dependencies import get_current_admin
+    from app.models import Blog
+    from app.services import content_sync, placement
+
+    model = PlacementModel(corpus())
+    monkeypatch.setattr(placement.placement_index, "ensure_fitted", lambda: model)
+    # Derived data is refreshed through a sync session after the commit, so both share one private file
+    path = tmp_path / "placement.db"
+    sync_engine = create_engine(f"sqlite:///{path}")
+    monkeypatch.setattr(content_sync, "SessionLocal", sessionmaker(bind=sync_engine))
+
+    async def scenario():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        async with AsyncSession(engine, expire_on_commit=False) as db:
+            blog = Blog(title="b", slug="b", content="c", tags="[]", position_x=0, position_y=0, position_z=0)
+            db.add(blog)
+            await db.commit()
+            blog_id = blog.id
+
+        async def override_db():
+            async with AsyncSession(engine, expire_on_commit=False) as db:
+                yield db
+
+        app.dependency_overrides[get_async_db] = override_db
+        app.dependency_overrides[get_current_admin] = lambda: AdminPrincipal(id=1, username="admin")
+        try:
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                response = await client.put(f"/api/admin/blogs/{blog_id}", json={
+                    "content": "opengl shader lighting for gpu rendering", "position_mode": "auto"
+                })
+        finally:
+            app.dependency_overrides.clear()
+            await engine.dispose()
+            sync_engine.dispose()
+        return response
+
+    response = asyncio.run(scenario())
+    assert response.status_code == 200
+    body = response.json()
+    placed = (body["position_x"], body["position_y"], body["position_z"])
+    assert placed != (0.0, 0.0, 0.0)
+    assert placed == model.place(placement.blog_document(Blog(title="b", summary=None, content=body["content"], tags="[]")))
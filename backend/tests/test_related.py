@@ -0,0 +1,106 @@
+"""Tests for precomputed related content."""
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.core.database import Base
+from app.models import Blog, RelatedContent
+from app.services.change_log import record_change
+from app.services.content_sync import sync_content_change
+from app.services.related import TOP_K, load_related, rebuild_related, related_index
+
+TOPICS = ["gaussian splatting radiance", "rust compiler borrow", "kubernetes cluster autoscaling", "react hooks state"]
+
+def make_session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine)()
+
+def add_blog(db, slug, content):
+    blog = Blog(title=slug, slug=slug, content=content, summary="", position_x=0, position_y=0, position_z=0)
+    db.add(blog)
+    db.flush()
+    sync_content_change(db, "blog", blog.id)
+    return blog
+
+def stored(db):
+    lists = {}
+    for source, target in db.query(RelatedContent.source, RelatedContent.target).order_by(RelatedContent.source, RelatedContent.rank):
+        lists.setdefault(source, []).append(target)
+    return lists
+
+def test_writes_refresh_row_and_column():
+    """New, edited and deleted nodes enter and leave other nodes' lists."""
+    db = make_session()
+    for i, topic in enumerate(TOPICS * 2):
+        add_blog(db, f"post{i}", topic)
+    assert stored(db)["blog-1"] == ["blog-5"]
+
+    edited = db.get(Blog, 5)
+    edited.content = "rust compiler borrow checker"
+    db.flush()
+    sync_content_change(db, "blog", edited.id)
+    lists = stored(db)
+    assert "blog-1" not in lists and lists["blog-5"][0] in ("blog-2", "blog-6")
+    assert "blog-5" in lists["blog-2"]
+
+    deleted = db.get(Blog, 2)
+    db.delete(deleted)
+    db.flush()
+    sync_content_change(db, "blog", 2)
+    lists = stored(db)
+    assert "blog-2" not in lists and all("blog-2" not in targets for targets in lists.values())
+
+    related = load_related(db, "blog", "post4")
+    assert related[0]["slug"] == "post5" and related[0]["type"] == "blog" and related[0]["score"] > 0
+    assert load_related(db, "blog", "missing") is None
+
+def test_incremental_matches_rebuild():
+    """Lists maintained write by write agree with a full rebuild."""
+    db = make_session()
+    for i in range(12):
+        add_blog(db, f"post{i}", f"{TOPICS[i % 4]} unique{i}")
+    blog = db.get(Blog, 3)
+    blog.content = f"{TOPICS[1]} unique2"
+    db.flush()
+    sync_content_change(db, "blog", 3)
+    db.delete(db.get(Blog, 8))
+    db.flush()
+    sync_content_change(db, "blog", 8)
+
+    incremental = {source: set(targets) for source, targets in stored(db).items()}
+    assert incremental["blog-3"] == {"blog-2", "blog-6", "blog-10"}
+    assert incremental["blog-7"] == {"blog-11"} and "blog-8" not in incremental["blog-4"]
+    assert max(len(targets) for targets in incremental.values()) <= TOP_K
+    rebuild_related(db)
+    assert {source: set(targets) for source, targets in stored(db).items()} == incremental
+
+def test_mirror_reloads_after_other_writer():
+    """A change logged by someone else forces the in-memory mirror to reload."""
+    db = make_session()
+    add_blog(db, "first", TOPICS[0])
+    blog = Blog(title="second", slug="second", content=TOPICS[0], summary="", position_x=0, position_y=0, position_z=0)
+    db.add(blog)
+    db.flush()
+    related_index.version = None
+    sync_content_change(db, "blog", blog.id)
+    assert stored(db) == {"blog-1": ["blog-2"], "blog-2": ["blog-1"]}
+
+def test_mirror_replays_changes_of_other_writers(monkeypatch):
+    """Changes logged by another worker are replayed node by node instead of reloading the corpus."""
+    db = make_session()
+    add_blog(db, "first", TOPICS[0])
+    other = Blog(title="other", slug="other", content=TOPICS[0], summary="", position_x=0, position_y=0, position_z=0)
+    db.add(other)
+    db.flush()
+    record_change(db, "blog", other.id)
+
+    def full_reload(session):
+        raise AssertionError("mirror reloaded")
+
+    monkeypatch.setattr(related_index, "load", full_reload)
+    add_blog(db, "third", TOPICS[1])
+    assert stored(db)["blog-1"] == ["blog-2"]
+    assert stored(db)["blog-2"] == ["blog-1"]
@@ -0,0 +1,77 @@
+"""Tests for server-side markdown rendering."""
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import json
+from datetime import datetime
+from app.models import Blog
+from app.schemas import BlogDetailResponse, BlogResponse
+from app.services.rendering import apply_rendered, render_cache, render_markdown
+
+def test_raw_html_and_script_links_are_not_passed_through():
+    rendered = render_markdown(
+        "<script>alert(1)</script>\n\n"
+        "[bad](javascript:alert(1)) [good](https://example.com)\n\n"
+        "<img src=x onerror=alert(1)>"
+    )
+    assert "<script>" not in rendered.html
+    assert "&lt;script&gt;" in rendered.html
+    assert "<img" not in rendered.html
+    assert 'href="javascript:' not in rendered.html
+    assert '<a href="https://example.com" target="_blank" rel="noopener noreferrer">good</a>' in rendered.html
+
+def test_toc_ids_are_unique_and_match_headings():
+    rendered = render_markdown("# Intro\n\ntext\n\n## Setup *fast*\n\n## Setup fast\n\n# Intro\n")
+    assert rendered.toc == [
+        {"level": 1, "text": "Intro", "id": "intro"},
+        {"level": 2, "text": "Setup fast", "id": "setup-fast"},
+        {"level": 2, "text": "Setup fast", "id": "setup-fast-1"},
+        {"level": 1, "text": "Intro", "id": "intro-1"},
+    ]
+    assert '<h2 id="setup-fast-1">' in rendered.html
+
+def test_word_count_skips_code_and_rounds_reading_time_up():
+    prose = " ".join(["word"] * 201)
+    rendered = render_markdown(f"{prose}\n\n```python\nnot counted here\n```\n\n    nor here\n")
+    assert rendered.word_count == 201
+    assert rendered.reading_time == 2
+    assert 'class="language-python"' in rendered.html
+
+def test_edit_rerenders_only_changed_blocks():
+    render_cache.clear()
+    blocks = [f"Paragraph number {i} with [a link][ref]." for i in range(10)]
+    document = "\n\n".join(blocks + ["[ref]: https://example.com"])
+    first = render_markdown(document)
+    assert first.rendered_blocks == first.blocks == 10
+
+    blocks[4] = "Paragraph number 4 was edited."
+    second = render_markdown("\n\n".join(blocks + ["[ref]: https://example.com"]))
+    assert second.rendered_blocks == 1
+    assert "was edited" in second.html
+    assert second.html.count('href="https://example.com"') == 9
+
+    # Changing a reference definition invalidates every block that could use it
+    third = render_markdown("\n\n".join(blocks + ["[ref]: https://example.org"]))
+    assert third.rendered_blocks == 10
+
+def test_apply_rendered_stores_on_row():
+    blog = Blog(title="t", slug="t", content="# Title\n\nSome words here.")
+    apply_rendered(blog, render_markdown(blog.content))
+    assert blog.content_html.startswith('<h1 id="title">')
+    assert json.loads(blog.toc) == [{"level": 1, "text": "Title", "id": "title"}]
+    assert blog.word_count == 4
+    assert blog.reading_time == 1
+
+def test_rendered_fields_are_only_on_the_detail_response():
+    blog = Blog(
+        id=1, title="t", slug="t", content="# Title\n\nSome words here.",
+        position_x=0.0, position_y=0.0, position_z=0.0, created_at=datetime(2024, 1, 1)
+    )
+    apply_rendered(blog, render_markdown(blog.content))
+    listing = BlogResponse.model_validate(blog).model_dump(mode="json")
+    assert not {"content_html", "toc", "word_count", "reading_time"} & set(listing)
+    detail = BlogDetailResponse.model_validate(blog).model_dump(mode="json")
+    assert detail["content_html"].startswith('<h1 id="title">')
+    assert detail["toc"] == [{"level": 1, "text": "Title", "id": "title"}]
+    assert detail["reading_time"] == 1
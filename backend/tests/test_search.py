@@ -0,0 +1,64 @@
+"""Tests for the FTS5 search index."""
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.core.database import Base
+from app.models import Project, Blog
+from app.services.search import build_match_query, ensure_search_index, search
+
+def make_session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    db.add(Project(title="Existing radiance fields", slug="existing", description="", content="", tech_stack="[]", position_x=0, position_y=0, position_z=0))
+    db.commit()
+    ensure_search_index(engine)
+    return db
+
+def test_triggers_keep_index_in_sync():
+    """Inserts, updates and deletes are reflected in ranked, highlighted results."""
+    db = make_session()
+    project = Project(title="Neural renderer", slug="renderer", description="Real-time <b>radiance</b> fields",
+                      content="", tech_stack="[]", position_x=0, position_y=0, position_z=0)
+    project.set_tech_stack_list(["CUDA", "PyTorch"])
+    blog = Blog(title="Notes", slug="notes", content="Training radiance fields on a laptop", summary="",
+                position_x=0, position_y=0, position_z=0)
+    blog.set_tags_list(["nerf"])
+    db.add_all([project, blog])
+    db.commit()
+
+    results, _ = search(db.connection(), "radiance", None, None, 10)
+    assert [r["slug"] for r in results] == ["existing", "renderer", "notes"]
+    assert results[1]["snippet"] == "Real-time &lt;b&gt;<mark>radiance</mark>&lt;/b&gt; fields"
+    assert results[0]["title"] == "Existing <mark>radiance</mark> fields"
+
+    assert [r["slug"] for r in search(db.connection(), "pytor", "project", None, 10)[0]] == ["renderer"]
+    assert [r["type"] for r in search(db.connection(), "radiance", "blog", None, 10)[0]] == ["blog"]
+
+    blog.content = "Nothing here"
+    db.delete(project)
+    db.commit()
+    assert [r["slug"] for r in search(db.connection(), "radiance", None, None, 10)[0]] == ["existing"]
+    assert search(db.connection(), "  !!  ", None, None, 10) == ([], None)
+
+def test_cursor_pagination_walks_all_matches():
+    """Pages are disjoint and cover every match in score order."""
+    db = make_session()
+    for i in range(25):
+        db.add(Blog(title=f"Post {i}", slug=f"post-{i}", content="graph " * (i % 5 + 1), summary="",
+                    position_x=0, position_y=0, position_z=0))
+    db.commit()
+
+    seen, cursor, scores = [], None, []
+    while True:
+        page, cursor = search(db.connection(), "graph", None, cursor, 7)
+        seen += [r["slug"] for r in page]
+        scores += [r["score"] for r in page]
+        if cursor is None:
+            break
+    assert len(seen) == len(set(seen)) == 25
+    assert scores == sorted(scores, reverse=True)
+    assert build_match_query('c++ "graph') == '"c" "graph"*'
@@ -0,0 +1,156 @@
+"""Tests for password hashing, login throttling and admin session auth."""
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import asyncio
+from datetime import datetime, timedelta
+import pytest
+from fastapi import HTTPException, Response
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from app.api.dependencies import authenticate_token, is_token_revoked
+from app.core.config import settings
+from app.core.security import (
+    PasswordHasherPool, PasswordPoolSaturated, hash_password,
+    issue_admin_token, decode_admin_token, get_revocation_expiry
+)
+from app.core.rate_limit import SlidingWindowLimiter, LoginThrottle
+from app.core.database import Base
+from app.core.sessions import AdminPrincipal, SessionCache, RevocationList
+from app.api import dependencies
+from app.models import RevokedToken
+
+def test_sliding_window_limiter():
+    """Keys are rejected once they reach the limit within the window."""
+    limiter = SlidingWindowLimiter(max_attempts=2, window_seconds=60)
+    assert limiter.retry_after("admin") is None
+    limiter.hit("admin")
+    limiter.hit("admin")
+
+    wait = limiter.retry_after("admin")
+    assert wait is not None and 0 < wait <= 60
+    assert limiter.retry_after("other") is None
+
+    limiter.reset("admin")
+    assert limiter.retry_after("admin") is None
+
+def test_login_throttle_checks_username_and_ip():
+    """Either dimension exceeding its limit throttles the attempt."""
+    throttle = LoginThrottle(window_seconds=60, max_per_username=3, max_per_ip=2)
+    throttle.record_attempt("Admin", "10.0.0.1")
+    throttle.record_attempt("someone", "10.0.0.1")
+
+    assert throttle.retry_after("fresh", "10.0.0.1") is not None
+    assert throttle.retry_after("admin", "10.0.0.2") is None
+
+    throttle.record_success("admin")
+    assert throttle.stats()["by_username"]["tracked_keys"] == 1
+
+def test_password_pool_rejects_when_saturated():
+    """Requests beyond workers + queue depth are rejected without hashing."""
+    pool = PasswordHasherPool(max_workers=1, max_queue=0)
+    hashed = hash_password("secret")
+
+    async def scenario():
+        return await asyncio.gather(
+            pool.verify("secret", hashed),
+            pool.verify("secret", hashed),
+            return_exceptions=True
+        )
+
+    results = asyncio.run(scenario())
+    assert results[0] is True
+    assert isinstance(results[1], PasswordPoolSaturated)
+
+    stats = pool.stats()
+    assert stats["rejected"] == 1
+    assert stats["completed"] == 1
+    assert stats["saturation"] == 0.0
+
+def test_session_cache_expiry_and_eviction():
+    """Cached sessions are served until they expire or are evicted."""
+    cache = SessionCache(max_entries=4, ttl_seconds=60)
+    principal = AdminPrincipal(id=1, username="admin")
+
+    cache.put("live", principal, datetime.utcnow() + timedelta(hours=1))
+    cache.put("expired", principal, datetime.utcnow() - timedelta(seconds=1))
+
+    assert cache.get_session("live") == principal
+    assert cache.get_session("expired") is None
+    assert len(cache) == 1
+
+    cache.evict("live")
+    assert cache.get_session("live") is None
+
+async def with_database(scenario):
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    try:
+        async with AsyncSession(engine) as db:
+            return await scenario(db)
+    finally:
+        await engine.dispose()
+
+def test_admin_token_refresh_and_revocation(monkeypatch):
+    """Signed tokens authenticate without a session row, slide near expiry and stop once revoked."""
+    revocation_list = RevocationList(check_ttl_seconds=60, max_checked=16)
+    monkeypatch.setattr(dependencies, "revocation_list", revocation_list)
+    token, _ = issue_admin_token(7, "admin", "admin@example.com")
+    claims = decode_admin_token(token)
+
+    async def scenario(db):
+        response = Response()
+        principal = await authenticate_token(token, response, db)
+        assert principal == AdminPrincipal(id=7, username="admin", email="admin@example.com")
+        assert "set-cookie" not in response.headers
+
+        # Tokens inside the refresh window are re-issued for the same login
+        with monkeypatch.context() as patch:
+            patch.setattr(settings, "ACCESS_TOKEN_EXPIRE_MINUTES", 5)
+            short_token, _ = issue_admin_token(7, "admin", jti="short-login")
+        response = Response()
+        await authenticate_token(short_token, response, db)
+        assert "admin_session=" in response.headers["set-cookie"]
+
+        # A login close to the absolute limit is refreshed only up to that limit
+        auth_time = datetime.utcnow() - timedelta(hours=23, minutes=55)
+        old_token, expires_at = issue_admin_token(7, "admin", jti="old-login", auth_time=auth_time)
+        assert expires_at <= datetime.utcnow() + timedelta(minutes=5)
+        response = Response()
+        await authenticate_token(old_token, response, db)
+        assert "set-cookie" not in response.headers
+
+        revocation_list.revoke(claims["jti"], get_revocation_expiry(claims))
+        with pytest.raises(HTTPException) as exc:
+            await authenticate_token(token, Response(), db)
+        assert exc.value.status_code == 401
+
+    asyncio.run(with_database(scenario))
+    assert decode_admin_token(token + "x") is None
+
+def test_revocation_by_another_worker_is_seen_after_check_ttl(monkeypatch):
+    """A jti revoked only in the database is picked up once its cached answer is older than the TTL."""
+    revoked = RevocationList(check_ttl_seconds=0.05, max_checked=16)
+    monkeypatch.setattr(dependencies, "revocation_list", revoked)
+
+    async def scenario(db):
+        assert not await is_token_revoked(db, "login")
+        db.add(RevokedToken(jti="login", expires_at=datetime.utcnow() + timedelta(hours=1)))
+        await db.commit()
+        assert not await is_token_revoked(db, "login")
+        await asyncio.sleep(0.06)
+        assert await is_token_revoked(db, "login")
+        assert revoked.is_revoked("login")
+
+    asyncio.run(with_database(scenario))
+
+def test_revocation_list_prune():
+    """Revocations past the token's maximum lifetime are forgotten."""
+    revoked = RevocationList(check_ttl_seconds=5, max_checked=16)
+    revoked.revoke("live", datetime.utcnow() + timedelta(hours=1))
+    revoked.merge({"stale": datetime.utcnow() - timedelta(seconds=1)})
+
+    assert revoked.prune() == 1
+    assert revoked.is_revoked("live")
+    assert not revoked.is_revoked("stale")
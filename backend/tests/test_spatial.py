@@ -0,0 +1,50 @@
+"""Tests for the spatial index over scene nodes."""
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+from app.services.spatial import SpatialIndex, index_neural_payload, filter_neural_payload
+
+def test_box_and_nearest_queries_match_brute_force():
+    """KD-tree answers agree with a linear scan."""
+    positions = np.random.default_rng(3).uniform(-10, 10, size=(2000, 3))
+    keys = [f"project-{i}" for i in range(len(positions))]
+    index = SpatialIndex(keys, positions)
+
+    low, high = np.array([-2.0, -5.0, 0.0]), np.array([4.0, 1.0, 3.0])
+    inside = ((positions >= low) & (positions <= high)).all(axis=1)
+    assert index.within_box(high, low) == [keys[i] for i in np.flatnonzero(inside)]
+
+    point = np.array([1.0, 2.0, -3.0])
+    distances = np.linalg.norm(positions - point, axis=1)
+    nearest = index.nearest(point, 5)
+    assert [key for key, _ in nearest] == [keys[i] for i in np.argsort(distances)[:5]]
+    assert np.isclose(nearest[0][1], distances.min())
+
+    assert len(index.nearest(point, 5000)) == 2000
+    assert SpatialIndex([], np.empty((0, 3))).within_box(low, high) == []
+
+def test_filter_payload_keeps_edges_inside_box():
+    """Filtered payloads only reference nodes inside the box."""
+    def node(node_id, x):
+        return {"id": node_id, "slug": f"n{node_id}", "title": "", "position_x": x, "position_y": 0.0, "position_z": 0.0}
+
+    payload = {
+        "projects": [node(1, 0.0), node(2, 5.0)],
+        "blogs": [node(1, 0.5)],
+        "edges": [
+            {"source": "project-1", "target": "blog-1", "kind": "content", "strength": 0.5},
+            {"source": "project-1", "target": "project-2", "kind": "tech", "strength": 0.5}
+        ],
+        "adjacency": {"project-1": ["blog-1", "project-2"], "blog-1": ["project-1"], "project-2": ["project-1"]}
+    }
+    index, nodes, node_edges = index_neural_payload(payload)
+    keys = index.within_box([-1, -1, -1], [1, 1, 1])
+    assert keys == ["project-1", "blog-1"]
+    assert nodes["blog-1"][0] == "blog"
+
+    filtered = filter_neural_payload(payload, nodes, node_edges, keys)
+    assert [p["id"] for p in filtered["projects"]] == [1]
+    assert len(filtered["edges"]) == 1
+    assert filtered["adjacency"] == {"project-1": ["blog-1"], "blog-1": ["project-1"]}
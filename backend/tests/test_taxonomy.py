@@ -0,0 +1,73 @@
+"""Tests for the tag and tech stack index tables."""
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.core.database import Base
+from app.models import Project, Blog, BlogTag, ProjectTechnology
+from app.api.routes.blogs import load_blogs_page
+from app.api.routes.projects import load_projects_page
+from app.services.content_sync import sync_content_change
+from app.services.taxonomy import rebuild_terms
+
+def make_session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine)()
+
+def add_blog(db, slug, tags):
+    blog = Blog(title=slug, slug=slug, content="x", summary="", position_x=0, position_y=0, position_z=0)
+    blog.set_tags_list(tags)
+    db.add(blog)
+    db.flush()
+    sync_content_change(db, "blog", blog.id)
+    return blog
+
+def test_admin_writes_keep_tag_index_in_sync():
+    """Tags are stored normalised and follow updates and deletes."""
+    db = make_session()
+    first = add_blog(db, "first", ["ML", " ml", "Rust"])
+    second = add_blog(db, "second", ["ml"])
+    assert sorted(db.query(BlogTag.tag, BlogTag.blog_id).all()) == [("ml", 1), ("ml", 2), ("rust", 1)]
+
+    first.set_tags_list(["Go"])
+    db.flush()
+    sync_content_change(db, "blog", first.id)
+    db.delete(second)
+    db.flush()
+    sync_content_change(db, "blog", second.id)
+    assert db.query(BlogTag.tag, BlogTag.blog_id).all() == [("go", 1)]
+
+def test_list_filters_resolve_through_index():
+    """?tag= and ?tech= filter before keyset pagination, so cursors stay valid."""
+    db = make_session()
+    for i in range(5):
+        add_blog(db, f"post{i}", ["ml"] if i % 2 == 0 else ["web"])
+
+    page = load_blogs_page(db, "summary", None, 2, "ml")
+    assert [blog["slug"] for blog in page["items"]] == ["post4", "post2"]
+    rest = load_blogs_page(db, "summary", page["next_cursor"], 2, "ml")
+    assert [blog["slug"] for blog in rest["items"]] == ["post0"] and rest["next_cursor"] is None
+    assert load_blogs_page(db, "summary", None, 10, "nope")["items"] == []
+
+    project = Project(title="p", slug="p", description="", position_x=0, position_y=0, position_z=0)
+    project.set_tech_stack_list(["CUDA", "Python"])
+    db.add(project)
+    db.flush()
+    sync_content_change(db, "project", project.id)
+    assert [p["slug"] for p in load_projects_page(db, "full", None, 10, "cuda")["items"]] == ["p"]
+    assert load_projects_page(db, "full", None, 10, "rust")["items"] == []
+
+def test_rebuild_terms_from_json_columns():
+    """A rebuild restores rows for content written without the sync hook."""
+    db = make_session()
+    project = Project(title="p", slug="p", description="", tech_stack='["Python", "python", 3]',
+                      position_x=0, position_y=0, position_z=0)
+    blog = Blog(title="b", slug="b", content="x", tags="not json", position_x=0, position_y=0, position_z=0)
+    db.add_all([project, blog])
+    db.flush()
+
+    assert rebuild_terms(db) == 1
+    assert db.query(ProjectTechnology.technology).all() == [("python",)]
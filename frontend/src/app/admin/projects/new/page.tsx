@@ -23,6 +23,7 @@ export default function NewProjectPage() {
     position_x: 0,
     position_y: 0,
     position_z: 0,
+    auto_position: false,
   });
 
   const handleChange = (
@@ -69,9 +70,13 @@ export default function NewProjectPage() {
         live_demo: formData.live_demo || undefined,
         image_url: formData.image_url || undefined,
         featured: formData.featured,
-        position_x: parseFloat(formData.position_x.toString()),
-        position_y: parseFloat(formData.position_y.toString()),
-        position_z: parseFloat(formData.position_z.toString()),
+        ...(formData.auto_position
+          ? { position_mode: 'auto' as const }
+          : {
+              position_x: parseFloat(formData.position_x.toString()),
+              position_y: parseFloat(formData.position_y.toString()),
+              position_z: parseFloat(formData.position_z.toString()),
+            }),
       };
 
       await createProject(projectData);
@@ -265,6 +270,19 @@ export default function NewProjectPage() {
         </div>
 
         {/* 3D Position */}
+        <div className="flex items-center">
+          <input
+            type="checkbox"
+            id="auto_position"
+            name="auto_position"
+            checked={formData.auto_position}
+            onChange={handleChange}
+            className="w-4 h-4 text-blue-600 border-gray-300 rounded focus:ring-blue-500"
+          />
+          <label htmlFor="auto_position" className="ml-2 text-sm font-medium">
+            Place automatically near related content
+          </label>
+        </div>
         <div className="grid grid-cols-3 gap-4">
           <div>
             <label htmlFor="position_x" className="block text-sm font-medium mb-1">
@@ -276,7 +294,8 @@ export default function NewProjectPage() {
               name="position_x"
               value={formData.position_x}
               onChange={handleChange}
-              required
+              required={!formData.auto_position}
+              disabled={formData.auto_position}
               step="0.1"
               className="w-full px-3 py-2 border border-gray-300 rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500"
             />
@@ -291,7 +310,8 @@ export default function NewProjectPage() {
               name="position_y"
               value={formData.position_y}
               onChange={handleChange}
-              required
+              required={!formData.auto_position}
+              disabled={formData.auto_position}
               step="0.1"
               className="w-full px-3 py-2 border border-gray-300 rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500"
             />
@@ -306,7 +326,8 @@ export default function NewProjectPage() {
               name="position_z"
               value={formData.position_z}
               onChange={handleChange}
-              required
+              required={!formData.auto_position}
+              disabled={formData.auto_position}
               step="0.1"
               className="w-full px-3 py-2 border border-gray-300 rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500"
             />
@@ -1,12 +1,16 @@
 import { notFound } from 'next/navigation';
 import Link from 'next/link';
-import MarkdownRenderer from '@/components/MarkdownRenderer';
+import dynamic from 'next/dynamic';
+import RenderedContent from '@/components/RenderedContent';
 import BlogMetadata from '@/components/BlogMetadata';
 import { getBlog } from '@/lib/api';
-import { Blog } from '@/types/api';
+import { BlogDetail } from '@/types/api';
+
+// Client-side markdown bundle is only loaded for rows without content_html
+const MarkdownRenderer = dynamic(() => import('@/components/MarkdownRenderer'));
 
 // Fallback mock data for development
-const mockBlogs: Record<string, Blog> = {
+const mockBlogs: Record<string, BlogDetail> = {
   'getting-started-3d-ml': {
     id: 1,
     title: 'Getting Started with 3D Machine Learning',
@@ -202,7 +206,7 @@ interface BlogPageProps {
 
 export default async function BlogDetailPage({ params }: BlogPageProps) {
   const { slug } = await params;
-  let blog: Blog;
+  let blog: BlogDetail;
 
   try {
     blog = await getBlog(slug);
@@ -251,9 +255,13 @@ export default async function BlogDetailPage({ params }: BlogPageProps) {
               )}
             </header>
 
-            {/* Blog Content with Markdown Rendering */}
+            {/* Server-rendered HTML; client-side markdown only for rows not rendered yet */}
             <div className="mb-12">
-              <MarkdownRenderer content={blog.content} />
+              {blog.content_html ? (
+                <RenderedContent html={blog.content_html} toc={blog.toc} />
+              ) : (
+                <MarkdownRenderer content={blog.content} />
+              )}
             </div>
           </article>
 
@@ -2,7 +2,7 @@ import { notFound } from 'next/navigation';
 import Link from 'next/link';
 import Image from 'next/image';
 import { getProject } from '@/lib/api';
-import { Project } from '@/types/api';
+import { ProjectDetail } from '@/types/api';
 
 interface ProjectPageProps {
   params: Promise<{ slug: string }>;
@@ -11,7 +11,7 @@ interface ProjectPageProps {
 export default async function ProjectPage({ params }: ProjectPageProps) {
   const { slug } = await params;
   
-  let project: Project;
+  let project: ProjectDetail;
   
   try {
     project = await getProject(slug);
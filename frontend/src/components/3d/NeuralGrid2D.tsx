@@ -4,6 +4,7 @@ import React, { useState, useMemo } from 'react';
 import { motion, AnimatePresence } from 'framer-motion';
 import { generateNeuralPositions } from '@/lib/neuralPositioning';
 import { NeuralNetworkData, Node3DData } from '@/types/3d';
+import { NeuralEdge } from '@/types/api';
 import { Sidebar } from './Sidebar';
 
 interface ProjectData {
@@ -16,7 +17,7 @@ interface ProjectData {
   github_url?: string;
   live_demo?: string;
   image_url?: string;
-  created_at: string;
+  created_at?: string;
 }
 
 interface BlogData {
@@ -25,13 +26,14 @@ interface BlogData {
   slug: string;
   summary?: string;
   content?: string;
-  created_at: string;
+  created_at?: string;
 }
 
 interface NeuralGrid2DProps {
   className?: string;
   projects?: ProjectData[];
   blogs?: BlogData[];
+  edges?: NeuralEdge[];
 }
 
 // 2D Node Component
@@ -112,14 +114,14 @@ function Node2D({ node, isSelected, onClick, index }: Node2DProps) {
   );
 }
 
-export function NeuralGrid2D({ className, projects = [], blogs = [] }: NeuralGrid2DProps) {
+export function NeuralGrid2D({ className, projects = [], blogs = [], edges }: NeuralGrid2DProps) {
   const [selectedNodeId, setSelectedNodeId] = useState<string | null>(null);
   const [sidebarOpen, setSidebarOpen] = useState(false);
 
   // Generate neural network data (we'll use this for consistent node ordering)
   const neuralData: NeuralNetworkData = useMemo(() => {
-    return generateNeuralPositions(projects, blogs);
-  }, [projects, blogs]);
+    return generateNeuralPositions(projects, blogs, edges);
+  }, [projects, blogs, edges]);
 
   // Get the currently selected node data for the sidebar
   const selectedNode = useMemo(() => {
@@ -2,7 +2,7 @@
 
 import { Canvas, useThree } from '@react-three/fiber';
 import { CameraControls } from '@react-three/drei';
-import React, { Suspense, useState, useMemo, useRef, useCallback } from 'react';
+import React, { Suspense, useState, useMemo, useRef, useCallback, useEffect } from 'react';
 import { Node3D } from './Node3D';
 import { ConnectionNetwork } from './Connection3D';
 import { SceneSetup } from './SceneSetup';
@@ -10,7 +10,9 @@ import { Sidebar } from './Sidebar';
 import { NeuralGrid2D } from './NeuralGrid2D';
 import { useDeviceCapabilities, shouldUse3D, shouldUseReducedEffects } from './MobileDetector';
 import { generateNeuralPositions } from '@/lib/neuralPositioning';
+import { getNeuralData } from '@/lib/api';
 import { NeuralNetworkData } from '@/types/3d';
+import { NeuralDataResponse, NeuralEdge } from '@/types/api';
 import * as THREE from 'three';
 
 interface ProjectData {
@@ -23,7 +25,7 @@ interface ProjectData {
   github_url?: string;
   live_demo?: string;
   image_url?: string;
-  created_at: string;
+  created_at?: string;
 }
 
 interface BlogData {
@@ -32,13 +34,15 @@ interface BlogData {
   slug: string;
   summary?: string;
   content?: string;
-  created_at: string;
+  created_at?: string;
 }
 
 interface NeuralSceneProps {
   className?: string;
   projects?: ProjectData[];
   blogs?: BlogData[];
+  edges?: NeuralEdge[];
+  adjacency?: Record<string, string[]>;
 }
 
 // Enhanced sample data with more realistic content for positioning algorithm
@@ -112,6 +116,10 @@ const sampleBlogs: BlogData[] = [
   }
 ];
 
+// Stable empty lists while /api/neural-data is loading
+const NO_PROJECTS: ProjectData[] = [];
+const NO_BLOGS: BlogData[] = [];
+
 // Enhanced camera controller component with smooth transitions and easing
 function CameraController({
   selectedNodePosition,
@@ -255,7 +263,35 @@ function CameraController({
   );
 }
 
-export function NeuralScene({ className, projects = sampleProjects, blogs = sampleBlogs }: NeuralSceneProps) {
+export function NeuralScene({ className, projects: projectsProp, blogs: blogsProp, edges: edgesProp, adjacency: adjacencyProp }: NeuralSceneProps) {
+  // Without explicit data the scene loads nodes, edges and adjacency from /api/neural-data
+  const [sceneData, setSceneData] = useState<NeuralDataResponse | null>(null);
+  const [sceneLoadFailed, setSceneLoadFailed] = useState(false);
+  const hasExplicitData = projectsProp !== undefined || blogsProp !== undefined;
+
+  useEffect(() => {
+    if (hasExplicitData) return;
+    let cancelled = false;
+    getNeuralData()
+      .then(data => {
+        if (!cancelled) setSceneData(data);
+      })
+      .catch(error => {
+        console.error('Failed to load neural data:', error);
+        if (!cancelled) setSceneLoadFailed(true);
+      });
+    return () => {
+      cancelled = true;
+    };
+  }, [hasExplicitData]);
+
+  const fallbackProjects = sceneLoadFailed ? sampleProjects : NO_PROJECTS;
+  const fallbackBlogs = sceneLoadFailed ? sampleBlogs : NO_BLOGS;
+  const projects: ProjectData[] = projectsProp ?? sceneData?.projects ?? fallbackProjects;
+  const blogs: BlogData[] = blogsProp ?? sceneData?.blogs ?? fallbackBlogs;
+  const edges = hasExplicitData ? edgesProp : sceneData?.edges;
+  const serverAdjacency = hasExplicitData ? adjacencyProp : sceneData?.adjacency;
+
   const [hoveredNodeId, setHoveredNodeId] = useState<string | null>(null);
   const [selectedNodeId, setSelectedNodeId] = useState<string | null>(null);
   const [cameraTransitioning, setCameraTransitioning] = useState(false);
@@ -268,8 +304,8 @@ export function NeuralScene({ className, projects = sampleProjects, blogs = samp
 
   // Generate neural network layout using the positioning algorithm
   const neuralData: NeuralNetworkData = useMemo(() => {
-    return generateNeuralPositions(projects, blogs);
-  }, [projects, blogs]);
+    return generateNeuralPositions(projects, blogs, edges);
+  }, [projects, blogs, edges]);
 
   // Create position map for connections
   const nodePositions = useMemo(() => {
@@ -280,20 +316,29 @@ export function NeuralScene({ className, projects = sampleProjects, blogs = samp
     return positions;
   }, [neuralData.nodes]);
 
+  // Adjacency index for hover lookups: the server's when available, else built once per layout
+  const adjacency = useMemo(() => {
+    const index = new Map<string, Set<string>>();
+    if (serverAdjacency) {
+      Object.entries(serverAdjacency).forEach(([nodeId, neighbours]) => {
+        index.set(nodeId, new Set(neighbours));
+      });
+      return index;
+    }
+    neuralData.connections.forEach(connection => {
+      if (!index.has(connection.from)) index.set(connection.from, new Set());
+      if (!index.has(connection.to)) index.set(connection.to, new Set());
+      index.get(connection.from)!.add(connection.to);
+      index.get(connection.to)!.add(connection.from);
+    });
+    return index;
+  }, [serverAdjacency, neuralData.connections]);
+
   // Get connected node IDs for highlighting
   const getConnectedNodeIds = useCallback((nodeId: string | null): Set<string> => {
     if (!nodeId) return new Set();
-
-    const connected = new Set<string>();
-    neuralData.connections.forEach(connection => {
-      if (connection.from === nodeId) {
-        connected.add(connection.to);
-      } else if (connection.to === nodeId) {
-        connected.add(connection.from);
-      }
-    });
-    return connected;
-  }, [neuralData.connections]);
+    return adjacency.get(nodeId) ?? new Set();
+  }, [adjacency]);
 
   const connectedNodes = useMemo(() => {
     return getConnectedNodeIds(hoveredNodeId || selectedNodeId);
@@ -356,6 +401,7 @@ export function NeuralScene({ className, projects = sampleProjects, blogs = samp
         className={className}
         projects={projects}
         blogs={blogs}
+        edges={edges}
       />
     );
   }
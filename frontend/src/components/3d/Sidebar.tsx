@@ -13,14 +13,6 @@ interface SidebarProps {
   onClose: () => void;
 }
 
-// Type guards to determine node data type
-const isProject = (data: unknown): data is Project => {
-  return data !== null && typeof data === 'object' && 'tech_stack' in data && 'github_url' in data;
-};
-
-const isBlog = (data: unknown): data is Blog => {
-  return data !== null && typeof data === 'object' && 'content' in data && 'slug' in data;
-};
 
 // Project content component
 const ProjectContent: React.FC<{ project: Project }> = ({ project }) => (
@@ -110,7 +102,7 @@ const ProjectContent: React.FC<{ project: Project }> = ({ project }) => (
     <div className="pt-4 border-t border-border">
       <Text as="div" size="sm" variant="muted" className="flex items-center gap-2">
         <Calendar size={16} />
-        Created {new Date(project.created_at).toLocaleDateString()}
+        {project.created_at ? `Created ${new Date(project.created_at).toLocaleDateString()}` : 'Project'}
       </Text>
     </div>
   </div>
@@ -165,7 +157,7 @@ const BlogContent: React.FC<{ blog: Blog }> = ({ blog }) => (
     <div className="pt-4 border-t border-border">
       <Text as="div" size="sm" variant="muted" className="flex items-center gap-2">
         <Calendar size={16} />
-        Published {new Date(blog.created_at).toLocaleDateString()}
+        {blog.created_at ? `Published ${new Date(blog.created_at).toLocaleDateString()}` : 'Blog post'}
       </Text>
     </div>
   </div>
@@ -236,11 +228,11 @@ export const Sidebar: React.FC<SidebarProps> = ({ selectedNode, isOpen, onClose
                 />
               </div>
               <div className="relative z-10">
-                {isProject(selectedNode.data) && (
-                  <ProjectContent project={selectedNode.data} />
+                {selectedNode.type === 'project' && (
+                  <ProjectContent project={selectedNode.data as unknown as Project} />
                 )}
-                {isBlog(selectedNode.data) && (
-                  <BlogContent blog={selectedNode.data} />
+                {selectedNode.type === 'blog' && (
+                  <BlogContent blog={selectedNode.data as unknown as Blog} />
                 )}
               </div>
             </div>
@@ -0,0 +1,30 @@
+import { TocEntry } from '@/types/api';
+import './RenderedContent.css';
+
+interface RenderedContentProps {
+  html: string; // Sanitized by the backend render pipeline (raw HTML in markdown is escaped)
+  toc?: TocEntry[];
+  className?: string;
+}
+
+export default function RenderedContent({ html, toc = [], className = '' }: RenderedContentProps) {
+  return (
+    <div className={className}>
+      {toc.length > 1 && (
+        <nav aria-label="Table of contents" className="mb-10 rounded-lg border border-border bg-muted/30 p-4">
+          <p className="mb-2 text-sm font-semibold text-foreground">Contents</p>
+          <ul className="space-y-1 text-sm">
+            {toc.map(entry => (
+              <li key={entry.id} style={{ paddingLeft: `${(entry.level - 1) * 0.75}rem` }}>
+                <a href={`#${entry.id}`} className="text-muted-foreground hover:text-primary">
+                  {entry.text}
+                </a>
+              </li>
+            ))}
+          </ul>
+        </nav>
+      )}
+      <div className="rendered-content max-w-none" dangerouslySetInnerHTML={{ __html: html }} />
+    </div>
+  );
+}
@@ -17,7 +17,8 @@ class AdminApiError extends Error {
 // Generic fetch wrapper for admin endpoints
 async function fetchAdmin<T>(
   endpoint: string,
-  options: RequestInit = {}
+  options: RequestInit = {},
+  onHeaders?: (headers: Headers) => void
 ): Promise<T> {
   const url = `${API_BASE_URL}${endpoint}`;
   
@@ -51,6 +52,7 @@ async function fetchAdmin<T>(
       );
     }
 
+    onHeaders?.(response.headers);
     return data;
   } catch (error) {
     if (error instanceof AdminApiError) {
@@ -64,6 +66,22 @@ async function fetchAdmin<T>(
   }
 }
 
+// Follow X-Next-Cursor headers until the last page of a keyset-paginated listing
+async function fetchAdminAllPages<T>(endpoint: string): Promise<T[]> {
+  const items: T[] = [];
+  let cursor: string | null = null;
+
+  do {
+    const url: string = cursor ? `${endpoint}?cursor=${encodeURIComponent(cursor)}` : endpoint;
+    const page = await fetchAdmin<T[]>(url, {}, (headers) => {
+      cursor = headers.get('X-Next-Cursor');
+    });
+    items.push(...page);
+  } while (cursor);
+
+  return items;
+}
+
 // ============================================================================
 // Authentication API
 // ============================================================================
@@ -107,6 +125,8 @@ export async function verifyAdminSession(): Promise<{ valid: boolean; user?: any
 // Projects API
 // ============================================================================
 
+export type PositionMode = 'manual' | 'auto';
+
 export interface ProjectCreateData {
   title: string;
   slug: string;
@@ -117,9 +137,10 @@ export interface ProjectCreateData {
   live_demo?: string;
   image_url?: string;
   featured?: boolean;
-  position_x: number;
-  position_y: number;
-  position_z: number;
+  position_x?: number;
+  position_y?: number;
+  position_z?: number;
+  position_mode?: PositionMode; // 'auto' places the node from its content
 }
 
 export interface ProjectUpdateData {
@@ -135,6 +156,7 @@ export interface ProjectUpdateData {
   position_x?: number;
   position_y?: number;
   position_z?: number;
+  position_mode?: PositionMode;
 }
 
 export interface ProjectAdmin {
@@ -155,7 +177,7 @@ export interface ProjectAdmin {
 }
 
 export async function getAdminProjects(): Promise<ProjectAdmin[]> {
-  return fetchAdmin<ProjectAdmin[]>('/api/admin/projects');
+  return fetchAdminAllPages<ProjectAdmin>('/api/admin/projects');
 }
 
 export async function getAdminProject(id: number): Promise<ProjectAdmin> {
@@ -199,9 +221,10 @@ export interface BlogCreateData {
   tags?: string[];
   image_url?: string;
   published_at?: string;
-  position_x: number;
-  position_y: number;
-  position_z: number;
+  position_x?: number;
+  position_y?: number;
+  position_z?: number;
+  position_mode?: PositionMode; // 'auto' places the node from its content
 }
 
 export interface BlogUpdateData {
@@ -217,6 +240,7 @@ export interface BlogUpdateData {
   position_x?: number;
   position_y?: number;
   position_z?: number;
+  position_mode?: PositionMode;
 }
 
 export interface BlogAdmin {
@@ -237,7 +261,7 @@ export interface BlogAdmin {
 }
 
 export async function getAdminBlogs(): Promise<BlogAdmin[]> {
-  return fetchAdmin<BlogAdmin[]>('/api/admin/blogs');
+  return fetchAdminAllPages<BlogAdmin>('/api/admin/blogs');
 }
 
 export async function getAdminBlog(id: number): Promise<BlogAdmin> {
@@ -319,5 +343,67 @@ export async function getDashboardStats(): Promise<DashboardStats> {
   return fetchAdmin<DashboardStats>('/api/admin/stats');
 }
 
+// ============================================================================
+// Markdown Preview API
+// ============================================================================
+
+export interface TocEntry {
+  level: number;
+  text: string;
+  id: string;
+}
+
+export interface MarkdownPreview {
+  html: string;
+  toc: TocEntry[];
+  word_count: number;
+  reading_time: number; // minutes
+  blocks: number;
+  rendered_blocks: number; // blocks not served from the render cache
+}
+
+export async function previewMarkdown(content: string): Promise<MarkdownPreview> {
+  return fetchAdmin<MarkdownPreview>('/api/admin/preview', {
+    method: 'POST',
+    body: JSON.stringify({ content }),
+  });
+}
+
+// ============================================================================
+// Bulk Import/Export API (NDJSON)
+// ============================================================================
+
+export type BulkCollection = 'projects' | 'blogs';
+
+export interface BulkImportResult {
+  created: number;
+  updated: number;
+  skipped: number;
+  error_count: number;
+  errors: { line: number; detail: string }[]; // first 100 invalid lines
+}
+
+export async function exportContent(collection: BulkCollection): Promise<Blob> {
+  const response = await fetch(`${API_BASE_URL}/api/admin/bulk/${collection}/export`, {
+    credentials: 'include',
+  });
+  if (!response.ok) {
+    throw new AdminApiError(`Export failed: ${response.statusText}`, response.status, response.statusText);
+  }
+  return response.blob();
+}
+
+export async function importContent(
+  collection: BulkCollection,
+  file: Blob,
+  onConflict: 'skip' | 'replace' = 'skip'
+): Promise<BulkImportResult> {
+  return fetchAdmin<BulkImportResult>(`/api/admin/bulk/${collection}/import?on_conflict=${onConflict}`, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/x-ndjson' },
+    body: file,
+  });
+}
+
 // Export error class for error handling
 export { AdminApiError };
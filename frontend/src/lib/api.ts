@@ -1,6 +1,6 @@
 // API client utilities for Neural Space backend communication
 
-import { Project, Blog, NeuralDataResponse } from '@/types/api';
+import { Project, ProjectDetail, Blog, BlogDetail, ProjectNode, BlogNode, NeuralDataResponse, NeuralChangesResponse, ContentEvent, NearestNode, SearchResult, FacetsResponse, RelatedItem, NeuralLodResponse, NeuralGraphBinary } from '@/types/api';
 
 export interface StaticPage {
   id: number;
@@ -22,7 +22,7 @@ class ApiError extends Error {
   }
 }
 
-async function fetchApi<T>(endpoint: string): Promise<T> {
+async function fetchApiWithHeaders<T>(endpoint: string): Promise<{ data: T; headers: Headers }> {
   const url = `${API_BASE_URL}${endpoint}`;
   
   try {
@@ -41,7 +41,7 @@ async function fetchApi<T>(endpoint: string): Promise<T> {
     }
 
     const data = await response.json();
-    return data;
+    return { data, headers: response.headers };
   } catch (error) {
     if (error instanceof ApiError) {
       throw error;
@@ -54,22 +54,51 @@ async function fetchApi<T>(endpoint: string): Promise<T> {
   }
 }
 
+async function fetchApi<T>(endpoint: string): Promise<T> {
+  const { data } = await fetchApiWithHeaders<T>(endpoint);
+  return data;
+}
+
+// Follow X-Next-Cursor headers until the last page of a keyset-paginated listing
+async function fetchAllPages<T>(endpoint: string): Promise<T[]> {
+  const items: T[] = [];
+  let cursor: string | null = null;
+
+  do {
+    const separator = endpoint.includes('?') ? '&' : '?';
+    const url: string = cursor ? `${endpoint}${separator}cursor=${encodeURIComponent(cursor)}` : endpoint;
+    const { data, headers } = await fetchApiWithHeaders<T[]>(url);
+    items.push(...data);
+    cursor = headers.get('X-Next-Cursor');
+  } while (cursor);
+
+  return items;
+}
+
 // Project API functions
-export async function getProjects(): Promise<Project[]> {
-  return fetchApi<Project[]>('/api/projects');
+export async function getProjects(tech?: string): Promise<Project[]> {
+  return fetchAllPages<Project>(tech ? `/api/projects?tech=${encodeURIComponent(tech)}` : '/api/projects');
+}
+
+export async function getProject(slug: string): Promise<ProjectDetail> {
+  return fetchApi<ProjectDetail>(`/api/projects/${slug}`);
 }
 
-export async function getProject(slug: string): Promise<Project> {
-  return fetchApi<Project>(`/api/projects/${slug}`);
+export async function getRelatedToProject(slug: string): Promise<RelatedItem[]> {
+  return fetchApi<RelatedItem[]>(`/api/projects/${slug}/related`);
 }
 
 // Blog API functions
-export async function getBlogs(): Promise<Blog[]> {
-  return fetchApi<Blog[]>('/api/blogs');
+export async function getBlogs(tag?: string): Promise<Blog[]> {
+  return fetchAllPages<Blog>(tag ? `/api/blogs?tag=${encodeURIComponent(tag)}` : '/api/blogs');
 }
 
-export async function getBlog(slug: string): Promise<Blog> {
-  return fetchApi<Blog>(`/api/blogs/${slug}`);
+export async function getBlog(slug: string): Promise<BlogDetail> {
+  return fetchApi<BlogDetail>(`/api/blogs/${slug}`);
+}
+
+export async function getRelatedToBlog(slug: string): Promise<RelatedItem[]> {
+  return fetchApi<RelatedItem[]>(`/api/blogs/${slug}/related`);
 }
 
 // Neural network data for 3D scene
@@ -77,13 +106,166 @@ export async function getNeuralData(): Promise<NeuralDataResponse> {
   return fetchApi<NeuralDataResponse>('/api/neural-data');
 }
 
+const NEURAL_GRAPH_MEDIA_TYPE = 'application/vnd.neural-space.graph';
+
+// Layout is documented in backend/app/services/graph_binary.py
+export function decodeNeuralGraph(buffer: ArrayBuffer): NeuralGraphBinary {
+  const header = new DataView(buffer, 0, 24);
+  const magic = String.fromCharCode(...new Uint8Array(buffer, 0, 4));
+  if (magic !== 'NSG1' || header.getUint32(4, true) !== 1) {
+    throw new Error('Unsupported neural graph encoding');
+  }
+  const projects = header.getUint32(8, true);
+  const blogs = header.getUint32(12, true);
+  const edges = header.getUint32(16, true);
+  const stringsLength = header.getUint32(20, true);
+  const nodes = projects + blogs;
+
+  let offset = 24;
+  const take = <T>(make: (offset: number) => T, bytes: number): T => {
+    const view = make(offset);
+    offset += bytes;
+    return view;
+  };
+  const positions = take(o => new Float32Array(buffer, o, nodes * 3), nodes * 12);
+  const ids = take(o => new Uint32Array(buffer, o, nodes), nodes * 4);
+  const endpoints = take(o => new Uint32Array(buffer, o, edges * 2), edges * 8);
+  const strengths = take(o => new Float32Array(buffer, o, edges), edges * 4);
+  const kinds = take(o => new Uint8Array(buffer, o, edges), edges + ((4 - (edges % 4)) % 4));
+  const strings = JSON.parse(new TextDecoder().decode(new Uint8Array(buffer, offset, stringsLength)));
+
+  return { projects, blogs, positions, ids, endpoints, strengths, kinds, strings };
+}
+
+// Same scene as getNeuralData, as packed typed arrays for large graphs
+export async function getNeuralGraphBinary(): Promise<NeuralGraphBinary> {
+  const response = await fetch(`${API_BASE_URL}/api/neural-data`, {
+    headers: { Accept: NEURAL_GRAPH_MEDIA_TYPE },
+  });
+  if (!response.ok) {
+    throw new ApiError(`API request failed: ${response.statusText}`, response.status, response.statusText);
+  }
+  return decodeNeuralGraph(await response.arrayBuffer());
+}
+
+// Clustered scene for zoomed-out views; higher levels are coarser
+export async function getNeuralLod(level: number): Promise<NeuralLodResponse> {
+  return fetchApi<NeuralLodResponse>(`/api/neural-data?lod=${level}`);
+}
+
+const NEURAL_CACHE_KEY = 'neural-data';
+
+interface CachedNeuralData {
+  version: number;
+  data: NeuralDataResponse;
+}
+
+function readNeuralCache(): CachedNeuralData | null {
+  if (typeof window === 'undefined') return null;
+  try {
+    const raw = window.localStorage.getItem(NEURAL_CACHE_KEY);
+    return raw ? (JSON.parse(raw) as CachedNeuralData) : null;
+  } catch {
+    return null;
+  }
+}
+
+function writeNeuralCache(entry: CachedNeuralData) {
+  if (typeof window === 'undefined') return;
+  try {
+    window.localStorage.setItem(NEURAL_CACHE_KEY, JSON.stringify(entry));
+  } catch {
+    // Storage full or disabled; the next visit simply syncs from scratch
+  }
+}
+
+export function applyNeuralChanges(data: NeuralDataResponse, changes: NeuralChangesResponse): NeuralDataResponse {
+  const changed = new Set(changes.changed);
+  const projects = data.projects
+    .filter(project => !changed.has(`project-${project.id}`))
+    .concat(changes.projects);
+  const blogs = data.blogs
+    .filter(blog => !changed.has(`blog-${blog.id}`))
+    .concat(changes.blogs);
+  const edges = data.edges
+    .filter(edge => !changed.has(edge.source) && !changed.has(edge.target))
+    .concat(changes.edges)
+    .sort((a, b) => b.strength - a.strength);
+
+  const adjacency: Record<string, string[]> = {};
+  for (const edge of edges) {
+    (adjacency[edge.source] ??= []).push(edge.target);
+    (adjacency[edge.target] ??= []).push(edge.source);
+  }
+  return { projects, blogs, edges, adjacency };
+}
+
+// Neural data kept in local storage and brought up to date with one delta request
+export async function syncNeuralData(): Promise<NeuralDataResponse> {
+  const cached = readNeuralCache();
+  const changes = await fetchApi<NeuralChangesResponse>(
+    `/api/neural-data/changes?since=${cached?.version ?? 0}`
+  );
+  const data = changes.full || !cached
+    ? { projects: changes.projects, blogs: changes.blogs, edges: changes.edges, adjacency: changes.adjacency }
+    : applyNeuralChanges(cached.data, changes);
+  writeNeuralCache({ version: changes.version, data });
+  return data;
+}
+
+// Live content change notifications; onResync fires when the stream (re)connects
+// without the latest event id or events were dropped, and cached data should be
+// refetched. Returns a function that closes the stream.
+export function subscribeToContentEvents(
+  onEvent: (event: ContentEvent) => void,
+  onResync?: () => void
+): () => void {
+  const source = new EventSource(`${API_BASE_URL}/api/events`);
+  source.addEventListener('content', message => {
+    onEvent(JSON.parse((message as MessageEvent<string>).data) as ContentEvent);
+  });
+  if (onResync) {
+    source.addEventListener('resync', () => onResync());
+  }
+  return () => source.close();
+}
+
+export type Vec3 = [number, number, number];
+
+// Nodes inside an axis-aligned box, with the edges between them
+export async function getNeuralDataInBox(min: Vec3, max: Vec3): Promise<NeuralDataResponse> {
+  return fetchApi<NeuralDataResponse>(`/api/neural-data?bbox=${[...min, ...max].join(',')}`);
+}
+
+export async function getNearestNodes([x, y, z]: Vec3, k = 10): Promise<NearestNode[]> {
+  return fetchApi<NearestNode[]>(`/api/neural-data/nearest?x=${x}&y=${y}&z=${z}&k=${k}`);
+}
+
+// Full-text search; pass nextCursor back in to fetch the following page
+export async function searchContent(
+  q: string,
+  options: { type?: 'project' | 'blog'; cursor?: string; limit?: number } = {}
+): Promise<{ results: SearchResult[]; nextCursor: string | null }> {
+  const params = new URLSearchParams({ q });
+  if (options.type) params.set('type', options.type);
+  if (options.cursor) params.set('cursor', options.cursor);
+  if (options.limit) params.set('limit', String(options.limit));
+  const { data, headers } = await fetchApiWithHeaders<SearchResult[]>(`/api/search?${params}`);
+  return { results: data, nextCursor: headers.get('X-Next-Cursor') };
+}
+
+// Tag and technology counts for filter chips
+export async function getFacets(): Promise<FacetsResponse> {
+  return fetchApi<FacetsResponse>('/api/facets');
+}
+
 // Static page API functions
 export async function getPage(key: string): Promise<StaticPage> {
   return fetchApi<StaticPage>(`/api/pages/${key}`);
 }
 
 // Utility function to transform API data to 3D nodes
-export function transformToNodes(projects: Project[], blogs: Blog[]) {
+export function transformToNodes(projects: Array<Project | ProjectNode>, blogs: Array<Blog | BlogNode>) {
   const nodes = [
     ...projects.map(project => ({
       id: `project-${project.id}`,
@@ -4,6 +4,7 @@
  */
 
 import { Node3DData, Connection3D, NeuralNetworkData } from '@/types/3d';
+import { NeuralEdge } from '@/types/api';
 
 export interface PositioningConfig {
   bounds: {
@@ -27,7 +28,13 @@ const DEFAULT_CONFIG: PositioningConfig = {
   connectionStrength: 0.7
 };
 
-interface ProjectData {
+interface StoredPosition {
+  position_x?: number;
+  position_y?: number;
+  position_z?: number;
+}
+
+interface ProjectData extends StoredPosition {
   id: number | string;
   title: string;
   description?: string;
@@ -35,24 +42,72 @@ interface ProjectData {
   techStack?: string[];
 }
 
-interface BlogData {
+interface BlogData extends StoredPosition {
   id: number | string;
   title: string;
   summary?: string;
   content?: string;
 }
 
+function hasStoredPosition(item: StoredPosition): boolean {
+  return typeof item.position_x === 'number'
+    && typeof item.position_y === 'number'
+    && typeof item.position_z === 'number';
+}
+
+function storedPosition(item: StoredPosition): [number, number, number] {
+  return [item.position_x!, item.position_y!, item.position_z!];
+}
+
+/**
+ * Convert precomputed /api/neural-data edges into scene connections
+ */
+function serverConnections(edges: NeuralEdge[], nodes: Node3DData[]): Connection3D[] {
+  const ids = new Set(nodes.map(node => node.id));
+  return edges
+    .filter(edge => ids.has(edge.source) && ids.has(edge.target))
+    .map(edge => ({ from: edge.source, to: edge.target, strength: edge.strength }));
+}
+
 /**
- * Generate 3D positions using a neural network-inspired layout
+ * Generate 3D positions using a neural network-inspired layout.
+ * When server edges are given they are used as the connections and no
+ * client-side similarity is computed.
  */
 export function generateNeuralPositions(
   projects: ProjectData[],
   blogs: BlogData[],
+  edges?: NeuralEdge[],
   config: PositioningConfig = DEFAULT_CONFIG
 ): NeuralNetworkData {
   const nodes: Node3DData[] = [];
   const connections: Connection3D[] = [];
 
+  // Positions from the backend layout job are used as-is; no client-side layout pass
+  const items: StoredPosition[] = [...projects, ...blogs];
+  if (items.length > 0 && items.every(hasStoredPosition)) {
+    projects.forEach((project, index) => {
+      nodes.push({
+        id: `project-${project.id || index}`,
+        position: storedPosition(project),
+        type: 'project',
+        title: project.title,
+        data: project
+      });
+    });
+    blogs.forEach((blog, index) => {
+      nodes.push({
+        id: `blog-${blog.id || index}`,
+        position: storedPosition(blog),
+        type: 'blog',
+        title: blog.title,
+        data: blog
+      });
+    });
+    connections.push(...(edges ? serverConnections(edges, nodes) : generateConnections(nodes)));
+    return { nodes, connections, bounds: config.bounds };
+  }
+
   // Create project nodes with clustered positioning
   const projectCluster = generateClusterPositions(
     projects.length,
@@ -89,8 +144,8 @@ export function generateNeuralPositions(
     });
   });
 
-  // Generate connections based on content similarity and relationships
-  connections.push(...generateConnections(nodes));
+  // Server edges when available, otherwise content similarity and relationships
+  connections.push(...(edges ? serverConnections(edges, nodes) : generateConnections(nodes)));
 
   // Apply force-directed positioning to optimize layout
   const optimizedNodes = applyForceDirectedLayout(nodes, connections, config);
@@ -27,6 +27,50 @@ export interface Blog {
   created_at: string;
 }
 
+// Single-item views (/api/projects/{slug}, /api/blogs/{slug}) add the rendered body
+export interface ProjectDetail extends Project {
+  content_html?: string | null; // Server-rendered, sanitized HTML
+  toc?: TocEntry[];
+  word_count?: number | null;
+  reading_time?: number | null; // minutes
+}
+
+export interface BlogDetail extends Blog {
+  content_html?: string | null; // Server-rendered, sanitized HTML
+  toc?: TocEntry[];
+  word_count?: number | null;
+  reading_time?: number | null; // minutes
+}
+
+export interface TocEntry {
+  level: number;
+  text: string;
+  id: string;
+}
+
+// Slim listing / scene node projections (no markdown bodies)
+export interface ProjectNode {
+  id: number;
+  slug: string;
+  title: string;
+  description: string;
+  tech_stack: string[];
+  position_x: number;
+  position_y: number;
+  position_z: number;
+}
+
+export interface BlogNode {
+  id: number;
+  slug: string;
+  title: string;
+  summary?: string;
+  tags: string[];
+  position_x: number;
+  position_y: number;
+  position_z: number;
+}
+
 export interface Node3D {
   id: string;
   position: [number, number, number];
@@ -65,7 +109,112 @@ export interface BlogsResponse {
   blogs: Blog[];
 }
 
+// Precomputed server-side similarity edge between scene nodes ("project-1", "blog-3")
+export interface NeuralEdge {
+  source: string;
+  target: string;
+  kind: 'content' | 'tech';
+  strength: number;
+}
+
 export interface NeuralDataResponse {
-  projects: Project[];
-  blogs: Blog[];
-}
\ No newline at end of file
+  projects: ProjectNode[];
+  blogs: BlogNode[];
+  edges: NeuralEdge[];
+  adjacency: Record<string, string[]>; // node id -> neighbour node ids
+}
+
+// Delta from /api/neural-data/changes, or the whole scene when full is true
+export interface NeuralChangesResponse extends NeuralDataResponse {
+  version: number;
+  full: boolean;
+  deleted: string[]; // node ids removed since the requested version
+  changed: string[]; // node ids whose edges are all replaced by the ones in edges
+}
+
+// "content" event from /api/events
+export interface ContentEvent {
+  type: 'project' | 'blog' | 'page' | 'scene';
+  id?: number;
+  slug?: string;
+  action: 'created' | 'updated' | 'deleted' | 'reset';
+  version: number; // content version after the change
+  sync_version?: number; // change log version for /api/neural-data/changes
+}
+
+export interface NearestNode {
+  node: string;
+  type: 'project' | 'blog';
+  id: number;
+  slug: string;
+  title: string;
+  distance: number;
+}
+
+export interface LodCluster {
+  id: string;
+  position_x: number;
+  position_y: number;
+  position_z: number;
+  count: number;
+  projects: number;
+  blogs: number;
+  representative: string; // node id of the member closest to the centroid
+  label: string;
+  parent: string | null; // cluster id one level up
+}
+
+export interface LodEdge {
+  source: string;
+  target: string;
+  strength: number;
+  count: number;
+}
+
+export interface NeuralLodResponse {
+  level: number;
+  levels: number;
+  clusters: LodCluster[];
+  edges: LodEdge[];
+}
+
+// Decoded form of the application/vnd.neural-space.graph encoding of /api/neural-data
+export interface NeuralGraphBinary {
+  projects: number; // nodes [0, projects) are projects, the rest blogs
+  blogs: number;
+  positions: Float32Array; // x, y, z per node
+  ids: Uint32Array;
+  endpoints: Uint32Array; // source, target node index per edge
+  strengths: Float32Array;
+  kinds: Uint8Array; // index into strings.kinds
+  strings: { slugs: string[]; titles: string[]; kinds: string[] };
+}
+
+export interface SearchResult {
+  type: 'project' | 'blog';
+  id: number;
+  slug: string;
+  title: string; // HTML-escaped, matches wrapped in <mark>
+  snippet: string; // HTML-escaped, matches wrapped in <mark>
+  score: number;
+}
+
+export interface FacetValue {
+  value: string; // normalised; pass as ?tag= / ?tech=
+  label: string;
+  count: number;
+}
+
+export interface FacetsResponse {
+  tag: FacetValue[];
+  tech: FacetValue[];
+}
+
+export interface RelatedItem {
+  type: 'project' | 'blog';
+  id: number;
+  slug: string;
+  title: string;
+  summary?: string | null;
+  score: number; // TF-IDF cosine similarity, 0-1
+}